@@ -0,0 +1,77 @@
+import asyncio
+import struct
+import time
+
+import wow_world_messages.vanilla as world
+
+TICKS = 2_000
+MESSAGES_PER_TICK = 50
+
+
+class NullHeaderCrypto:
+    def encrypt_server_header(self, size: int, opcode: int) -> bytes:
+        return struct.pack(">H", size) + struct.pack("<H", opcode)
+
+
+def messages() -> list:
+    return [world.SMSG_PONG(sequence_id=i) for i in range(0, MESSAGES_PER_TICK)]
+
+
+async def write_individually(writer: asyncio.StreamWriter, crypto: NullHeaderCrypto, tick: list):
+    for message in tick:
+        message.write_encrypted_server(writer, crypto)
+    await writer.drain()
+
+
+async def write_batched(writer: asyncio.StreamWriter, crypto: NullHeaderCrypto, tick: list):
+    batch = world.PacketBatch(crypto)
+    batch.extend(tick)
+    batch.write(writer)
+    await writer.drain()
+
+
+async def measure(name: str, write) -> None:
+    done = asyncio.get_running_loop().create_future()
+
+    async def discard(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while await reader.read(65536):
+            pass
+        writer.close()
+        done.set_result(None)
+
+    server = await asyncio.start_server(discard, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    _, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    sends = 0
+    original_write = writer.transport.write
+
+    def counting_write(data):
+        nonlocal sends
+        sends += 1
+        original_write(data)
+
+    writer.transport.write = counting_write
+
+    crypto = NullHeaderCrypto()
+    tick = messages()
+    start = time.perf_counter()
+    for _ in range(0, TICKS):
+        await write(writer, crypto, tick)
+    elapsed = time.perf_counter() - start
+
+    writer.close()
+    await done
+    server.close()
+    await server.wait_closed()
+
+    print(f"{name}: {sends / TICKS:.0f} transport writes/tick, {elapsed / TICKS * 1e6:.1f} us/tick")
+
+
+async def main():
+    await measure("write_encrypted_server per message", write_individually)
+    await measure("PacketBatch", write_batched)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
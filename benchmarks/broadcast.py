@@ -0,0 +1,66 @@
+import struct
+import time
+
+import wow_world_messages.vanilla as world
+
+RECIPIENTS = 40
+ITERATIONS = 2_000
+
+# SMSG_MESSAGECHAT (CHAT_TYPE_SAY) and SMSG_UPDATE_OBJECT bodies taken from the generated tests
+MESSAGECHAT = bytes([0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 0, 0, 0, 23, 0, 0, 0, 84, 104, 105,
+                     115, 32, 105, 115, 32, 97, 32, 115, 97, 121, 32, 109, 101, 115, 115, 97, 103, 101, 46, 0, 0])
+
+UPDATE_OBJECT = bytes([
+    1, 0, 0, 0, 0, 3, 1, 4, 4, 49, 0, 0, 0, 0, 0, 0, 0, 0, 205, 215,
+    11, 198, 53, 126, 4, 195, 249, 15, 167, 66, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    128, 63, 0, 0, 224, 64, 0, 0, 144, 64, 0, 0, 0, 0, 0, 0, 0, 0, 219, 15,
+    73, 64, 1, 0, 0, 0, 2, 7, 0, 64, 0, 16, 0, 0, 0, 4, 0, 0, 0, 0,
+    0, 0, 0, 25, 0, 0, 0, 100, 0, 0, 0, 1, 1, 1, 1,
+])
+
+
+class HeaderCrypto:
+    def encrypt_server_header(self, size: int, opcode: int) -> bytes:
+        return struct.pack(">H", size) + struct.pack("<H", opcode)
+
+
+class Sink:
+    def __init__(self):
+        self.written = 0
+
+    def write(self, data):
+        self.written += len(data)
+
+    def writelines(self, data):
+        for d in data:
+            self.written += len(d)
+
+
+def measure(name: str, message, send) -> None:
+    recipients = [(Sink(), HeaderCrypto()) for _ in range(0, RECIPIENTS)]
+
+    start = time.perf_counter()
+    for _ in range(0, ITERATIONS):
+        send(message, recipients)
+    elapsed = time.perf_counter() - start
+
+    print(f"{name}: {elapsed / ITERATIONS * 1e6:.1f} us per broadcast to {RECIPIENTS} recipients")
+
+
+def per_recipient(message, recipients):
+    for writer, header_crypto in recipients:
+        message.write_encrypted_server(writer, header_crypto)
+
+
+def main():
+    chat = world.SMSG_MESSAGECHAT.from_buffer(MESSAGECHAT, 0, len(MESSAGECHAT))[0]
+    measure("SMSG_MESSAGECHAT write_encrypted_server per recipient", chat, per_recipient)
+    measure("SMSG_MESSAGECHAT broadcast", chat, world.broadcast)
+
+    objects = world.SMSG_UPDATE_OBJECT.from_buffer(UPDATE_OBJECT, 0, len(UPDATE_OBJECT))[0]
+    measure("SMSG_UPDATE_OBJECT write_encrypted_server per recipient", objects, per_recipient)
+    measure("SMSG_UPDATE_OBJECT broadcast", objects, world.broadcast)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import asyncio
+import concurrent.futures
+import struct
+import time
+
+import wow_world_messages.vanilla as world
+
+from broadcast import UPDATE_OBJECT
+
+OBJECTS = 600
+PACKETS = 20
+
+
+def zone_in_packet() -> bytes:
+    decoder = world.WorldFrameDecoder(world.server_opcodes, False)
+    message = decoder.feed(struct.pack(">H", len(UPDATE_OBJECT) + 2) + struct.pack("<H", 0x00A9) + UPDATE_OBJECT)[0]
+    message.objects = message.objects * OBJECTS
+    encoded = world.encode_update_object(message)
+    return encoded.header() + bytes(encoded.body)
+
+
+async def measure(name: str, data: bytes) -> None:
+    longest_stall = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal longest_stall
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            longest_stall = max(longest_stall, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    for _ in range(0, PACKETS):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        await world.read_server_opcodes_unencrypted(reader)
+    elapsed = time.perf_counter() - start
+
+    running = False
+    await task
+
+    print(f"{name}: {elapsed / PACKETS * 1e3:.1f} ms/packet, longest loop stall {longest_stall * 1e3:.1f} ms")
+
+
+async def main():
+    data = zone_in_packet()
+    print(f"SMSG_COMPRESSED_UPDATE_OBJECT: {len(data)} bytes, {OBJECTS} objects")
+
+    world.set_compression_executor(None)
+    await measure("inline", data)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        world.set_compression_executor(executor, threshold=0)
+        await measure("executor", data)
+        world.set_compression_executor(None)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
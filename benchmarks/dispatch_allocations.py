@@ -0,0 +1,66 @@
+import asyncio
+import struct
+import time
+import tracemalloc
+
+import wow_world_messages.vanilla as world
+
+PACKETS = 10_000
+
+
+def packets() -> bytes:
+    data = bytearray()
+    for i in range(0, PACKETS):
+        # CMSG_PING: u16 big endian size, u32 opcode, u32 sequence_id, u32 round_time_in_ms
+        data += struct.pack(">H", 4 + 8) + struct.pack("<III", 0x01DC, i, 0)
+    return bytes(data)
+
+
+async def read_stream_reader_body(reader: asyncio.StreamReader) -> world.ClientOpcode:
+    size = int.from_bytes(await reader.readexactly(2), "big")
+    opcode = int.from_bytes(await reader.readexactly(4), "little")
+
+    body_size = size - 4
+    body = await reader.readexactly(body_size)
+    body_reader = asyncio.StreamReader()
+    body_reader.feed_data(body)
+    body_reader.feed_eof()
+
+    return await world.read_client_opcode_body(body_reader, opcode, body_size)
+
+
+async def measure(name: str, data: bytes, read) -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+
+    peak = 0
+    tracemalloc.start()
+    for _ in range(0, PACKETS):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        await read(reader)
+        _, after = tracemalloc.get_traced_memory()
+        peak += after - before
+    tracemalloc.stop()
+
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+
+    start = time.perf_counter()
+    for _ in range(0, PACKETS):
+        await read(reader)
+    elapsed = time.perf_counter() - start
+
+    print(f"{name}: {peak / PACKETS:.0f} peak bytes/packet, {elapsed / PACKETS * 1e6:.2f} us/packet")
+
+
+async def main():
+    data = packets()
+    await measure("StreamReader per body", data, read_stream_reader_body)
+    await measure("read_client_opcodes_unencrypted", data, world.read_client_opcodes_unencrypted)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
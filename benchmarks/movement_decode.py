@@ -0,0 +1,39 @@
+import struct
+import timeit
+
+import wow_world_messages.vanilla as world
+
+ITERATIONS = 100_000
+
+
+def heartbeat() -> bytes:
+    # MovementInfo: flags, timestamp, position, orientation, fall_time and the JUMPING fields
+    return struct.pack(
+        "<IIfffffffff",
+        world.MovementFlags.JUMPING.value,
+        1234,
+        1.0,
+        2.0,
+        3.0,
+        0.5,
+        0.0,
+        1.0,
+        1.0,
+        0.0,
+        7.0,
+    )
+
+
+def main():
+    body = heartbeat()
+    body_size = len(body)
+
+    elapsed = timeit.timeit(
+        lambda: world.MSG_MOVE_HEARTBEAT_Client.from_buffer(body, 0, body_size),
+        number=ITERATIONS,
+    )
+    print(f"MSG_MOVE_HEARTBEAT_Client.from_buffer: {elapsed / ITERATIONS * 1e6:.2f} us/packet")
+
+
+if __name__ == "__main__":
+    main()
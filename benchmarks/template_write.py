@@ -0,0 +1,62 @@
+import timeit
+
+import wow_srp
+
+import wow_world_messages.vanilla as world
+
+ITERATIONS = 200_000
+
+
+def server_header_crypto() -> wow_srp.VanillaHeaderCrypto:
+    client_seed = wow_srp.VanillaProofSeed()
+    server_seed = wow_srp.VanillaProofSeed()
+    session_key = bytes(range(40))
+
+    client_proof, _client = client_seed.into_client_header_crypto("A", session_key, server_seed.seed())
+    return server_seed.into_server_header_crypto("A", session_key, client_proof, client_seed.seed())
+
+
+class Sink:
+    def write(self, data):
+        pass
+
+
+def heartbeat(timestamp: int) -> world.MSG_MOVE_HEARTBEAT_Server:
+    return world.MSG_MOVE_HEARTBEAT_Server(
+        guid=0x1234,
+        info=world.MovementInfo(
+            flags=world.MovementFlags.NONE,
+            timestamp=timestamp,
+            position=world.Vector3d(x=1.0, y=2.0, z=3.0),
+            orientation=0.5,
+            fall_time=0.0,
+        ),
+    )
+
+
+def main():
+    crypto = server_header_crypto()
+    sink = Sink()
+
+    pong = world.SMSG_PONG(sequence_id=0).template()
+    cooldown = world.SMSG_CLEAR_COOLDOWN(id=0, target=0).template()
+    movement = heartbeat(0).template()
+    position = world.Vector3d(x=4.0, y=5.0, z=6.0)
+
+    cases = [
+        ("SMSG_PONG", lambda: world.SMSG_PONG(sequence_id=1).write_encrypted_server(sink, crypto),
+         lambda: pong.patch(1).write(sink, crypto)),
+        ("SMSG_CLEAR_COOLDOWN", lambda: world.SMSG_CLEAR_COOLDOWN(id=1, target=2).write_encrypted_server(sink, crypto),
+         lambda: cooldown.patch(1, 2).write(sink, crypto)),
+        ("MSG_MOVE_HEARTBEAT", lambda: heartbeat(1).write_encrypted_server(sink, crypto),
+         lambda: movement.patch(1, position).write(sink, crypto)),
+    ]
+
+    for name, construct, patch in cases:
+        for method, function in [("construct + write_encrypted_server", construct), ("template.patch + write", patch)]:
+            elapsed = min(timeit.repeat(function, number=ITERATIONS, repeat=5))
+            print(f"{name} {method}: {elapsed / ITERATIONS * 1e6:.2f} us/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import random
+import struct
+import timeit
+
+import wow_world_messages.vanilla as world
+
+ITERATIONS = 10_000
+
+
+def player_create_mask() -> bytes:
+    # Roughly the shape of a player create block: 40 mask blocks with a few hundred fields set.
+    random.seed(0)
+    fields = sorted(random.sample(range(0, 40 * 32), 300))
+    blocks = [0] * 40
+    for key in fields:
+        blocks[key // 32] |= 1 << (key % 32)
+
+    return struct.pack(f"<B{len(blocks)}I{len(fields)}I", len(blocks), *blocks, *fields)
+
+
+def main():
+    data = player_create_mask()
+
+    elapsed = timeit.timeit(lambda: world.UpdateMask.from_buffer(data, 0), number=ITERATIONS)
+    print(f"UpdateMask.from_buffer: {elapsed / ITERATIONS * 1e6:.2f} us/mask")
+
+
+if __name__ == "__main__":
+    main()
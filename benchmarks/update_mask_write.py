@@ -0,0 +1,49 @@
+import struct
+import timeit
+
+import wow_world_messages.vanilla as world
+
+ITERATIONS = 2_000
+
+
+def player_create() -> world.UpdateMask:
+    fields = world.UpdateMaskFields
+    mask = world.UpdateMask(fields={})
+
+    mask.set(fields.OBJECT_GUID, 0x0000000000000007)
+    mask.set(fields.OBJECT_TYPE, 0x19)
+    mask.set(fields.OBJECT_SCALE_X, 1.0)
+    mask.set(fields.UNIT_HEALTH, 100)
+    mask.set(fields.UNIT_MAXHEALTH, 100)
+    mask.set(fields.UNIT_LEVEL, 1)
+    mask.set(fields.UNIT_BYTES_0, 1, 1, 0, 1)
+    mask.set(fields.UNIT_BOUNDINGRADIUS, 0.389)
+    mask.set(fields.UNIT_COMBATREACH, 1.5)
+    mask.set(fields.UNIT_DISPLAYID, 50)
+    mask.set(fields.UNIT_NATIVEDISPLAYID, 50)
+    for i in range(0, 128):
+        mask.set(getattr(fields, f"PLAYER_SKILL_INFO_{i}_SKILL_0"), i + 1)
+        mask.set(getattr(fields, f"PLAYER_SKILL_INFO_{i}_MINIMUM_0"), 1)
+        mask.set(getattr(fields, f"PLAYER_SKILL_INFO_{i}_MAXIMUM_1"), 300)
+    mask.set(fields.PLAYER_EXPLORED_ZONES_1, *range(0, 64))
+
+    return mask
+
+
+def main():
+    typed = player_create()
+    # Floats assigned directly to fields take the per-field path
+    untyped = world.UpdateMask(fields=dict(typed.fields))
+    untyped.fields[world.UpdateMaskValue.OBJECT_SCALE_X] = 1.0
+
+    for name, mask in [("fields with floats", untyped), ("fields set through UpdateMaskFields", typed)]:
+        def write():
+            fmt, data = mask.write("<", [])
+            struct.pack(fmt, *data)
+
+        elapsed = min(timeit.repeat(write, number=ITERATIONS, repeat=5))
+        print(f"{name} ({len(mask.fields)} fields): {elapsed / ITERATIONS * 1e6:.1f} us/write")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import struct
+import tracemalloc
+
+import wow_world_messages.vanilla as world
+
+from broadcast import UPDATE_OBJECT
+
+MESSAGES = 10_000
+
+
+def main():
+    data = struct.pack(">H", len(UPDATE_OBJECT) + 2) + struct.pack("<H", 0x00A9) + UPDATE_OBJECT
+    decoder = world.WorldFrameDecoder(world.server_opcodes, False)
+    decoder.feed(data)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    messages = [decoder.feed(data)[0] for _ in range(0, MESSAGES)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"SMSG_UPDATE_OBJECT ({len(UPDATE_OBJECT)} byte body): "
+          f"{(after - before) / len(messages):.0f} bytes per decoded message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import asyncio
+import struct
+import sys
+import time
+
+import wow_world_messages.vanilla as world
+
+CONNECTIONS = 5_000
+PACKETS_PER_CONNECTION = 50
+CONNECT_BATCH = 500
+
+
+def packets() -> bytes:
+    data = bytearray()
+    for i in range(0, PACKETS_PER_CONNECTION):
+        # CMSG_PING: u16 big endian size, u32 opcode, u32 sequence_id, u32 round_time_in_ms
+        data += struct.pack(">H", 4 + 8) + struct.pack("<III", 0x01DC, i, 0)
+    return bytes(data)
+
+
+class Counter:
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.received = 0
+        self.done = asyncio.get_running_loop().create_future()
+
+    def add(self):
+        self.received += 1
+        if self.received == self.expected:
+            self.done.set_result(None)
+
+
+async def stream_reader_server(counter: Counter):
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                await world.read_client_opcodes_unencrypted(reader)
+                counter.add()
+        except asyncio.IncompleteReadError:
+            pass
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0, backlog=CONNECTIONS)
+
+
+async def protocol_server(counter: Counter):
+    def handler(protocol: world.WorldProtocol, message):
+        counter.add()
+
+    def factory():
+        return world.WorldProtocol(world.WorldFrameDecoder(world.client_opcodes, True), handler)
+
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(factory, "127.0.0.1", 0, backlog=CONNECTIONS)
+
+
+async def measure(name: str, connections: int, create_server) -> None:
+    counter = Counter(connections * PACKETS_PER_CONNECTION)
+    server = await create_server(counter)
+    port = server.sockets[0].getsockname()[1]
+
+    writers = []
+    for i in range(0, connections, CONNECT_BATCH):
+        batch = range(i, min(i + CONNECT_BATCH, connections))
+        opened = await asyncio.gather(*(asyncio.open_connection("127.0.0.1", port) for _ in batch))
+        writers += [writer for _, writer in opened]
+
+    data = packets()
+    start = time.perf_counter()
+    for writer in writers:
+        writer.write(data)
+    await counter.done
+    elapsed = time.perf_counter() - start
+
+    for writer in writers:
+        writer.close()
+    server.close()
+    await server.wait_closed()
+
+    print(f"{name}: {connections} connections, {elapsed * 1e3:.0f} ms, "
+          f"{elapsed / counter.expected * 1e6:.2f} us/packet")
+
+
+async def main():
+    connections = int(sys.argv[1]) if len(sys.argv) > 1 else CONNECTIONS
+    await measure("StreamReader", connections, stream_reader_server)
+    await measure("WorldProtocol", connections, protocol_server)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
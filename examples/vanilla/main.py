@@ -26,10 +26,10 @@ async def login_path(
     response = login.CMD_AUTH_LOGON_CHALLENGE_Server(
         login.LoginResult.SUCCESS,
         server.server_public_key(),
-        [wow_srp.generator()],
+        bytes([wow_srp.generator()]),
         wow_srp.large_safe_prime(),
         server.salt(),
-        [0] * 16,
+        bytes(16),
         login.SecurityFlag(0),
         None,
         None,
@@ -17,6 +17,18 @@ def print_login_utils(s: Writer, messages: list[model.Container], v: int):
     s.close("]")  # ClientOpcode
     s.double_newline()
 
+    s.open("client_opcodes: dict[int, ClientOpcode] = {")
+    for e in messages:
+        if not login_version_matches(e.tags, v):
+            continue
+
+        match e.object_type:
+            case model.ObjectTypeClogin(opcode=opcode):
+                s.wln(f"0x{opcode:02X}: {e.name},")
+
+    s.close("}")
+    s.double_newline()
+
     s.open("async def read_client_opcode(reader: asyncio.StreamReader) -> typing.Optional[ClientOpcode]:")
     s.wln("opcode = int.from_bytes(await reader.readexactly(1), 'little')")
 
@@ -67,6 +79,18 @@ def print_login_utils(s: Writer, messages: list[model.Container], v: int):
     s.close("]")  # ServerOpcode
     s.double_newline()
 
+    s.open("server_opcodes: dict[int, ServerOpcode] = {")
+    for e in messages:
+        if not login_version_matches(e.tags, v):
+            continue
+
+        match e.object_type:
+            case model.ObjectTypeSlogin(opcode=opcode):
+                s.wln(f"0x{opcode:02X}: {e.name},")
+
+    s.close("}")
+    s.double_newline()
+
     s.open("async def read_server_opcode(reader: asyncio.StreamReader) -> typing.Optional[ServerOpcode]:")
     s.wln("opcode = int.from_bytes(await reader.readexactly(1), 'little')")
 
@@ -44,9 +44,13 @@ LOGIN_UTIL_FILE = f"{LOGIN_MESSAGE_DIR}/util.py"
 
 def print_includes(s: Writer, world: typing.Optional[model.WorldVersion]):
     s.wln("from __future__ import annotations")
+    if world is not None:
+        s.wln("import array")
     s.wln("import asyncio")
     s.wln("import dataclasses")
     s.wln("import enum")
+    if world is not None:
+        s.wln("import operator")
     s.wln("import struct")
     s.wln("import typing")
     if world is not None:
@@ -55,18 +59,57 @@ def print_includes(s: Writer, world: typing.Optional[model.WorldVersion]):
 
     if world is not None:
         s.wln("import wow_srp")
+        s.wln("from .util import LazyMessage")
+        s.wln("from .util import RawPacket")
+        if world_version_is_wrath(world):
+            s.wln("from .util import WorldFrameDecoder as _WorldFrameDecoder")
+        else:
+            s.wln("from .util import WorldFrameDecoder")
+        s.wln("from .util import WorldProtocol")
+        s.wln("from .util import PacketBatch")
+        s.wln("from .util import EncodedMessage")
+        s.wln("from .util import MessageTemplate")
+        s.wln("from .util import broadcast")
+        s.wln("from .util import seal")
+        s.wln("from .util import unseal")
+        s.wln("from .util import compress")
+        s.wln("from .util import set_compression")
+        s.wln("from .util import encode_update_object")
+        s.wln("from .util import encode_update_object_async")
+        s.wln("from .util import encode_async")
+        s.wln("from .util import set_compression_executor")
+        s.wln("from .util import run_compression")
         s.wln("from .util import packed_guid_size")
+        s.wln("from .util import pack_u8_into")
+        s.wln("from .util import pack_i8_into")
+        s.wln("from .util import pack_u16_into")
+        s.wln("from .util import pack_i16_into")
+        s.wln("from .util import pack_u32_into")
+        s.wln("from .util import pack_i32_into")
+        s.wln("from .util import pack_u64_into")
+        s.wln("from .util import pack_i64_into")
+        s.wln("from .util import pack_f32_into")
         s.wln("from .util import packed_guid_write")
         s.wln("from .util import read_packed_guid")
 
         s.wln("from .util import read_sized_cstring")
+        s.wln("from .util import read_packed_guid_buffer")
+        s.wln("from .util import read_sized_cstring_buffer")
     else:
+        s.wln("from .util import LoginFrameDecoder")
         s.wln("from .util import read_string")
+        s.wln("from .util import read_string_buffer")
 
+    s.wln("from .util import slots_dataclass")
     s.wln("from .util import read_bool")
     s.wln("from .util import read_int")
     s.wln("from .util import read_cstring")
     s.wln("from .util import read_float")
+    s.wln("from .util import read_bool_buffer")
+    s.wln("from .util import read_int_buffer")
+    s.wln("from .util import read_cstring_buffer")
+    s.wln("from .util import read_float_buffer")
+    s.wln("from .util import read_bytes_buffer")
 
     s.newline()
 
@@ -126,6 +169,23 @@ def print_world(m: model.Objects, update_mask: list[model.UpdateMask], v: model.
     all_types.wln('"expect_client_opcode_encrypted",')
     all_types.wln('"expect_server_opcode_unencrypted",')
     all_types.wln('"expect_server_opcode_encrypted",')
+    all_types.wln('"LazyMessage",')
+    all_types.wln('"RawPacket",')
+    all_types.wln('"WorldFrameDecoder",')
+    all_types.wln('"WorldProtocol",')
+    all_types.wln('"PacketBatch",')
+    all_types.wln('"EncodedMessage",')
+    all_types.wln('"MessageTemplate",')
+    all_types.wln('"broadcast",')
+    all_types.wln('"seal",')
+    all_types.wln('"unseal",')
+    all_types.wln('"set_compression",')
+    all_types.wln('"encode_update_object",')
+    all_types.wln('"split_update_object",')
+    all_types.wln('"update_object_deltas",')
+    all_types.wln('"encode_update_object_async",')
+    all_types.wln('"encode_async",')
+    all_types.wln('"set_compression_executor",')
 
     s = Writer()
 
@@ -157,6 +217,9 @@ def print_world(m: model.Objects, update_mask: list[model.UpdateMask], v: model.
 
     print_update_mask(s, update_mask)
     all_types.wln('"UpdateMask",')
+    all_types.wln('"UpdateMaskArray",')
+    all_types.wln('"UpdateMaskField",')
+    all_types.wln('"UpdateMaskFields",')
 
     for d in m.enums:
         if not world_version_matches(d.tags, v):
@@ -193,7 +256,7 @@ def print_world(m: model.Objects, update_mask: list[model.UpdateMask], v: model.
         if not should_print_container(e, v):
             continue
 
-        print_struct(s, e)
+        print_struct(s, e, large_server_header=world_version_is_wrath(v))
 
         all_types.wln(f'"{e.name}",')
 
@@ -3,7 +3,7 @@ from writer import Writer
 
 def print_achievement_done_array(s: Writer):
     s.write_block("""
-@dataclasses.dataclass
+@slots_dataclass
 class AchievementDoneArray:
     data: list[AchievementDone]
 
@@ -20,6 +20,19 @@ class AchievementDoneArray:
 
         return AchievementDoneArray(data=data)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[AchievementDoneArray, int]:
+        data = []
+        achievement, _offset = read_int_buffer(buf, _offset, 4)
+
+        while achievement != 0xFFFFFFFF:
+            time, _offset = read_int_buffer(buf, _offset, 4)
+            data.append(AchievementDone(achievement=achievement, time=time))
+
+            achievement, _offset = read_int_buffer(buf, _offset, 4)
+
+        return AchievementDoneArray(data=data), _offset
+
     def write(self, fmt, data):
         for d in self.data:
             fmt, data = d.write(fmt, data)
@@ -3,7 +3,7 @@ from writer import Writer
 
 def print_achievement_in_progress_array(s: Writer):
     s.write_block("""
-@dataclasses.dataclass
+@slots_dataclass
 class AchievementInProgressArray:
     data: list[AchievementInProgress]
 
@@ -39,6 +39,38 @@ class AchievementInProgressArray:
 
         return AchievementInProgressArray(data=data)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[AchievementInProgressArray, int]:
+        data = []
+        achievement, _offset = read_int_buffer(buf, _offset, 4)
+
+        while achievement != 0xFFFFFFFF:
+            counter, _offset = read_packed_guid_buffer(buf, _offset)
+
+            player, _offset = read_packed_guid_buffer(buf, _offset)
+
+            timed_criteria_failed, _offset = read_bool_buffer(buf, _offset, 4)
+
+            progress_date, _offset = read_int_buffer(buf, _offset, 4)
+
+            time_since_progress, _offset = read_int_buffer(buf, _offset, 4)
+
+            time_since_progress2, _offset = read_int_buffer(buf, _offset, 4)
+
+            data.append(AchievementInProgress(
+                                              achievement=achievement,
+                                              counter=counter,
+                                              player=player,
+                                              timed_criteria_failed=timed_criteria_failed,
+                                              progress_date=progress_date,
+                                              time_since_progress=time_since_progress,
+                                              time_since_progress2=time_since_progress2,
+                                              ))
+
+            achievement, _offset = read_int_buffer(buf, _offset, 4)
+
+        return AchievementInProgressArray(data=data), _offset
+
     def write(self, fmt, data):
         for d in self.data:
             fmt, data = d.write(fmt, data)
@@ -3,7 +3,7 @@ from writer import Writer
 
 def print_addon_array(s: Writer):
     s.write_block("""
-@dataclasses.dataclass
+@slots_dataclass
 class AddonArray:
     data: list[Addon]
 
@@ -11,6 +11,10 @@ class AddonArray:
     async def read(reader: asyncio.StreamReader):
         raise Exception('read for AddonArray is unimplemented. Create an issue on Github if this is relevant for you.')
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[AddonArray, int]:
+        raise Exception('read for AddonArray is unimplemented. Create an issue on Github if this is relevant for you.')
+
     def write(self, fmt, data):
         for d in self.data:
             fmt, data = d.write(fmt, data)
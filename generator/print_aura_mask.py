@@ -8,7 +8,7 @@ def print_aura_mask(s: Writer, v: model.WorldVersion):
     block = ""
     if world_version_is_vanilla(v):
         block = """
-@dataclasses.dataclass
+@slots_dataclass
 class AuraMask:
     fields: dict[int, int]
 
@@ -23,6 +23,17 @@ class AuraMask:
 
         return AuraMask(fields=fields)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[AuraMask, int]:
+        mask, _offset = read_int_buffer(buf, _offset, 4)
+
+        fields = {}
+        for index in range(0, 32):
+            if mask & 1 << index:
+                fields[index], _offset = read_int_buffer(buf, _offset, 2)
+
+        return AuraMask(fields=fields), _offset
+
     def write(self, fmt, data):
         mask = 0
         for key in self.fields:
@@ -41,7 +52,7 @@ class AuraMask:
 """
     elif world_version_is_tbc(v):
         block = """
-@dataclasses.dataclass
+@slots_dataclass
 class AuraMask:
     fields: dict[int, Aura]
 
@@ -57,6 +68,17 @@ class AuraMask:
 
         return AuraMask(fields=fields)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[AuraMask, int]:
+        mask, _offset = read_int_buffer(buf, _offset, 8)
+
+        fields = {}
+        for index in range(0, 64):
+            if mask & 1 << index:
+                fields[index], _offset = Aura.from_buffer(buf, _offset)
+
+        return AuraMask(fields=fields), _offset
+
     def write(self, fmt, data):
         mask = 0
         for i, _ in enumerate(self.fields):
@@ -75,7 +97,7 @@ class AuraMask:
 """
     elif world_version_is_wrath(v):
         block = """
-@dataclasses.dataclass
+@slots_dataclass
 class AuraMask:
     fields: dict[int, Aura]
 
@@ -91,6 +113,17 @@ class AuraMask:
 
         return AuraMask(fields=fields)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[AuraMask, int]:
+        mask, _offset = read_int_buffer(buf, _offset, 8)
+
+        fields = {}
+        for index in range(0, 64):
+            if mask & 1 << index:
+                fields[index], _offset = Aura.from_buffer(buf, _offset)
+
+        return AuraMask(fields=fields), _offset
+
     def write(self, fmt, data):
         mask = 0
         for i, _ in enumerate(self.fields):
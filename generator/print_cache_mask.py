@@ -3,7 +3,7 @@ from writer import Writer
 
 def print_cache_mask(s: Writer):
     s.write_block("""
-@dataclasses.dataclass
+@slots_dataclass
 class CacheMask:
     fields: dict[int, int]
 
@@ -18,6 +18,17 @@ class CacheMask:
 
         return AuraMask(fields=fields)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CacheMask, int]:
+        mask, _offset = read_int_buffer(buf, _offset, 4)
+
+        fields = {}
+        for index in range(0, 32):
+            if mask & 1 << index:
+                fields[index], _offset = read_int_buffer(buf, _offset, 2)
+
+        return CacheMask(fields=fields), _offset
+
     def write(self, fmt, data):
         mask = 0
         for key in self.fields:
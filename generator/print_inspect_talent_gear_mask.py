@@ -3,7 +3,7 @@ from writer import Writer
 
 def print_inspect_talent_gear_mask(s: Writer):
     s.write_block("""
-@dataclasses.dataclass
+@slots_dataclass
 class InspectTalentGearMask:
     fields: dict[int, InspectTalentGear]
 
@@ -19,6 +19,17 @@ class InspectTalentGearMask:
 
         return InspectTalentGearMask(fields=fields)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[InspectTalentGearMask, int]:
+        mask, _offset = read_int_buffer(buf, _offset, 4)
+
+        fields = {}
+        for index in range(0, 32):
+            if mask & 1 << index:
+                fields[index], _offset = InspectTalentGear.from_buffer(buf, _offset)
+
+        return InspectTalentGearMask(fields=fields), _offset
+
     def write(self, fmt, data):
         mask = 0
         for i, _ in enumerate(self.fields):
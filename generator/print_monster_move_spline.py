@@ -3,7 +3,7 @@ from writer import Writer
 
 def print_monster_move_spline(s: Writer):
     s.write_block("""
-@dataclasses.dataclass
+@slots_dataclass
 class MonsterMoveSpline:
     splines: list[Vector3d]
 
@@ -28,6 +28,28 @@ class MonsterMoveSpline:
 
         return MonsterMoveSpline(splines=splines)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[MonsterMoveSpline, int]:
+        def packed_to_vec(packed: int) -> Vector3d:
+            x = float(packed & 0x7FF) / 4
+            y = float((packed >> 11) & 0x7FF) / 4
+            z = float((packed >> 22) & 0x3FF) / 4
+            return Vector3d(x=x, y=y, z=z)
+
+        amount_of_splines, _offset = read_int_buffer(buf, _offset, 4)
+
+        if amount_of_splines == 0:
+            return MonsterMoveSpline(splines=[]), _offset
+
+        first, _offset = Vector3d.from_buffer(buf, _offset)
+        splines = [first]
+
+        for i in range(1, amount_of_splines): # subtract the 'real' one
+            packed, _offset = read_int_buffer(buf, _offset, 4)
+            splines.append(packed_to_vec(packed))
+
+        return MonsterMoveSpline(splines=splines), _offset
+
     def write(self, fmt, data):
         def vec_to_packed(vec: Vector3d) -> int:
             packed = 0
@@ -3,7 +3,7 @@ from writer import Writer
 
 def print_named_guid(s: Writer):
     s.write_block("""
-@dataclasses.dataclass
+@slots_dataclass
 class NamedGuid:
     guid: int
     name: typing.Optional[int]
@@ -20,6 +20,19 @@ class NamedGuid:
             name=name,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[NamedGuid, int]:
+        guid, _offset = read_int_buffer(buf, _offset, 8)
+
+        name = None
+        if guid != 0:
+            name, _offset = read_cstring_buffer(buf, _offset)
+
+        return NamedGuid(
+            guid=guid,
+            name=name,
+        ), _offset
+
     def write(self, _fmt, _data):
         if self.guid != 0:
             _fmt += f"Q{len(self.name)}sB"
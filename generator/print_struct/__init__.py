@@ -1,14 +1,20 @@
 import model
 from model import Container
 from print_struct.print_members import print_members_definitions
-from print_struct.print_read import print_read
+from print_struct.print_read import print_read, print_read_structs
 from print_struct.print_size import print_size
-from print_struct.print_write import print_write
+from print_struct.print_write import print_write, print_write_structs, print_template, \
+    print_template_class
 from writer import Writer
 
 
-def print_struct(s: Writer, container: Container):
-    s.wln("@dataclasses.dataclass")
+def print_struct(s: Writer, container: Container, large_server_header: bool = False):
+    printed_read = print_read_structs(s, container)
+    printed_write = print_write_structs(s, container)
+    if printed_read or printed_write:
+        s.double_newline()
+
+    s.wln("@slots_dataclass")
     s.wln(f"class {container.name}:")
     s.inc_indent()
 
@@ -19,11 +25,15 @@ def print_struct(s: Writer, container: Container):
     match container.object_type:
         case model.ObjectTypeMsg(opcode=opcode):
             print_write(s, container, model.ObjectTypeCmsg("CMsg", opcode))
-            print_write(s, container, model.ObjectTypeSmsg("SMsg", opcode))
+            print_write(s, container, model.ObjectTypeSmsg("SMsg", opcode), large_server_header)
         case _:
-            print_write(s, container, container.object_type)
+            print_write(s, container, container.object_type, large_server_header)
+
+    print_template(s, container)
 
     print_size(s, container)
 
     s.dec_indent()  # class
     s.newline()
+
+    print_template_class(s, container)
@@ -1,6 +1,6 @@
 import model
 from model import Container
-from print_struct.util import type_to_python_str
+from print_struct.util import type_to_python_str, container_should_have_size_function
 from writer import Writer
 
 
@@ -21,9 +21,17 @@ def print_members_definitions(s: Writer, container: Container):
     s.append(non_optional)
     s.append(optionals)
 
+    if container_has_sealed_size(container):
+        s.wln("_sealed_size: typing.Optional[int] = dataclasses.field(default=None, init=False, repr=False, compare=False)")
+
     s.newline()
 
 
+def container_has_sealed_size(container: Container) -> bool:
+    return container_should_have_size_function(container) and isinstance(container.tags.version,
+                                                                         model.ObjectVersionsWorld)
+
+
 def print_member_definition(
         non_optional: Writer, optionals: Writer, member: model.StructMember, optional: bool
 ):
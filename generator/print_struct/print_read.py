@@ -1,15 +1,252 @@
+import struct
+import typing
+
 import model
 from model import Container
 from print_struct.util import (
     integer_type_to_size,
     all_members_from_container,
-    print_if_statement_header, type_to_wowm_str,
+    print_if_statement_header, type_to_wowm_str, array_type_is_bytes,
 )
 from util import container_needs_size_in_read
 from writer import Writer
 
 
-def print_read_struct_member(s: Writer, d: model.Definition, needs_size: bool, container_is_compressed: bool):
+def container_is_message(container: Container) -> bool:
+    match container.object_type:
+        case model.ObjectTypeCmsg() | model.ObjectTypeSmsg() | model.ObjectTypeMsg():
+            return True
+    return False
+
+
+def fixed_read_format(d: model.Definition) -> typing.Optional[str]:
+    match d.data_type:
+        case model.DataTypeInteger(integer_type=integer_type) \
+             | model.DataTypeBool(integer_type=integer_type) \
+             | model.DataTypeFlag(integer_type=integer_type) \
+             | model.DataTypeEnum(integer_type=integer_type):
+            match integer_type_to_size(integer_type):
+                case 1:
+                    return "B"
+                case 2:
+                    return "H"
+                case 4:
+                    return "I"
+                case 8:
+                    return "Q"
+        case model.DataTypeDateTime() \
+             | model.DataTypeGold() \
+             | model.DataTypeSeconds() \
+             | model.DataTypeMilliseconds() \
+             | model.DataTypeIPAddress() \
+             | model.DataTypeLevel32() \
+             | model.DataTypeSpell() \
+             | model.DataTypeItem():
+            return "I"
+        case model.DataTypeGUID():
+            return "Q"
+        case model.DataTypeLevel():
+            return "B"
+        case model.DataTypeLevel16() | model.DataTypeSpell16():
+            return "H"
+        case model.DataTypePopulation() | model.DataTypeFloatingPoint():
+            return "f"
+        case model.DataTypeStruct(struct_data=e):
+            if struct_is_flattened(e):
+                return "".join(fixed_read_format(m.struct_member_content) for m in e.members)
+
+    return None
+
+
+# Structs with only fixed size members are read as part of the run in the container that uses them
+def struct_is_flattened(e: Container) -> bool:
+    if e.optional is not None:
+        return False
+
+    for m in e.members:
+        match m:
+            case model.StructMemberDefinition(struct_member_content=d):
+                if d.constant_value is not None \
+                        or d.size_of_fields_before_size is not None \
+                        or d.used_as_size_in is not None:
+                    return False
+                if fixed_read_format(d) is None:
+                    return False
+            case _:
+                return False
+
+    return True
+
+
+def fixed_read_names(d: model.Definition, prefix: str = "") -> list[str]:
+    match d.data_type:
+        case model.DataTypeStruct(struct_data=e):
+            return [name for m in e.members for name in fixed_read_names(m.struct_member_content, f"{prefix}_{d.name}")]
+
+    if prefix == "":
+        return [read_variable_name(d)]
+
+    return [f"{prefix}_{d.name}"]
+
+
+def fixed_read_value(d: model.Definition, name: str) -> str:
+    match d.data_type:
+        case model.DataTypeBool():
+            return f"{name} == 1"
+        case model.DataTypeFlag(type_name=type_name) | model.DataTypeEnum(type_name=type_name):
+            return f"{type_name}({name})"
+        case model.DataTypeStruct(struct_data=e):
+            arguments = ", ".join(
+                f"{m.struct_member_content.name}={fixed_read_value(m.struct_member_content, f'{name}_{m.struct_member_content.name}')}"
+                for m in e.members)
+            return f"{e.name}({arguments})"
+
+    return name
+
+
+def fixed_read_runs(container: Container) -> dict[str, typing.Tuple[str, list[model.Definition]]]:
+    runs: dict[str, typing.Tuple[str, list[model.Definition]]] = {}
+    amount_of_runs = 0
+
+    def visit(members: list[model.StructMember]):
+        run: list[model.Definition] = []
+
+        def flush():
+            nonlocal amount_of_runs
+            if len(run) > 1:
+                name = f"_{container.name}_{amount_of_runs}"
+                amount_of_runs += 1
+                for d in run:
+                    runs[d.name] = (name, list(run))
+            run.clear()
+
+        for m in members:
+            match m:
+                case model.StructMemberDefinition(struct_member_content=d):
+                    if fixed_read_format(d) is not None:
+                        run.append(d)
+                        continue
+
+                    flush()
+                case model.StructMemberIfStatement(struct_member_content=statement):
+                    flush()
+                    visit_if_statement(statement)
+
+        flush()
+
+    def visit_if_statement(statement: model.IfStatement):
+        visit(statement.members)
+
+        for elseif in statement.else_if_statements:
+            visit_if_statement(elseif)
+
+    visit(container.members)
+
+    if container.optional is not None:
+        visit(container.optional.members)
+
+    return runs
+
+
+def fixed_read_run_format(run: list[model.Definition]) -> str:
+    return "<" + "".join(fixed_read_format(d) for d in run)
+
+
+def print_read_structs(s: Writer, container: Container) -> bool:
+    printed = set()
+    for name, run in fixed_read_runs(container).values():
+        if name in printed:
+            continue
+        printed.add(name)
+
+        s.wln(f'{name} = struct.Struct("{fixed_read_run_format(run)}")')
+
+    return len(printed) != 0
+
+
+def read_variable_name(d: model.Definition) -> str:
+    match d.data_type:
+        case model.DataTypeInteger():
+            if d.constant_value is not None or d.size_of_fields_before_size is not None:
+                return f"_{d.name}"
+
+    return d.name
+
+
+def print_read_run(s: Writer, name: str, run: list[model.Definition], needs_size: bool, buffer: bool):
+    for d in run:
+        s.wln(f"# {d.name}: {type_to_wowm_str(d.data_type)}")
+
+    size = struct.calcsize(fixed_read_run_format(run))
+    names = ", ".join(name for d in run for name in fixed_read_names(d))
+    if buffer:
+        s.wln(f"{names} = {name}.unpack_from(buf, _offset)")
+        s.wln(f"_offset += {size}")
+    else:
+        s.wln(f"{names} = {name}.unpack(await reader.readexactly({size}))")
+
+    for d in run:
+        match d.data_type:
+            case model.DataTypeBool():
+                s.wln(f"{d.name} = {d.name} == 1")
+            case model.DataTypeFlag(type_name=type_name) | model.DataTypeEnum(type_name=type_name):
+                s.wln(f"{d.name} = {type_name}({d.name})")
+            case model.DataTypeStruct():
+                s.wln(f"{d.name} = {fixed_read_value(d, f'_{d.name}')}")
+
+    if needs_size:
+        s.wln(f"_size += {size}")
+
+    s.newline()
+
+
+def print_read_value(
+        s: Writer,
+        buffer: bool,
+        name: str,
+        function: str,
+        args: str = "",
+        reader: str = "",
+        wrap: typing.Optional[str] = None,
+        append: bool = False,
+):
+    if buffer:
+        if function.endswith(".read"):
+            function = function.removesuffix(".read") + ".from_buffer"
+        else:
+            function = f"{function}_buffer"
+
+        offset = f"{reader}offset" if reader != "" else "_offset"
+        arguments = f"{reader}buf, {offset}"
+        if args != "":
+            arguments += f", {args}"
+
+        target = name
+        if append:
+            target = "_element"
+
+        s.wln(f"{target}, {offset} = {function}({arguments})")
+        if wrap is not None:
+            s.wln(f"{target} = {wrap}({target})")
+        if append:
+            s.wln(f"{name}.append(_element)")
+    else:
+        arguments = f"{reader}reader"
+        if args != "":
+            arguments += f", {args}"
+
+        value = f"await {function}({arguments})"
+        if wrap is not None:
+            value = f"{wrap}({value})"
+
+        if append:
+            s.wln(f"{name}.append({value})")
+        else:
+            s.wln(f"{name} = {value}")
+
+
+def print_read_struct_member(s: Writer, d: model.Definition, needs_size: bool, container_is_compressed: bool,
+                             buffer: bool):
     s.wln(f"# {d.name}: {type_to_wowm_str(d.data_type)}")
     match d.data_type:
         case model.DataTypeInteger(integer_type=integer_type):
@@ -18,17 +255,13 @@ def print_read_struct_member(s: Writer, d: model.Definition, needs_size: bool, c
             if d.constant_value is not None or d.size_of_fields_before_size is not None:
                 prefix = "_"
 
-            s.wln(
-                f"{prefix}{d.name} = await read_int(reader, {size})"
-            )
+            print_read_value(s, buffer, f"{prefix}{d.name}", "read_int", str(size))
 
             if needs_size:
                 s.wln(f"_size += {size}")
         case model.DataTypeBool(integer_type=integer_type):
             size = integer_type_to_size(integer_type)
-            s.wln(
-                f"{d.name} = await read_bool(reader, {size})"
-            )
+            print_read_value(s, buffer, d.name, "read_bool", str(size))
 
             if needs_size:
                 s.wln(f"_size += {size}")
@@ -37,91 +270,85 @@ def print_read_struct_member(s: Writer, d: model.Definition, needs_size: bool, c
             type_name=type_name, integer_type=integer_type
         ):
             size = integer_type_to_size(integer_type)
-            s.wln(
-                f"{d.name} = {type_name}(await read_int(reader, {size}))"
-            )
+            print_read_value(s, buffer, d.name, "read_int", str(size), wrap=type_name)
 
             if needs_size:
                 s.wln(f"_size += {size}")
 
         case model.DataTypeEnum(integer_type=integer_type, type_name=type_name):
             size = integer_type_to_size(integer_type)
-            s.wln(
-                f"{d.name} = {type_name}(await read_int(reader, {size}))"
-            )
+            print_read_value(s, buffer, d.name, "read_int", str(size), wrap=type_name)
 
             if needs_size:
                 s.wln(f"_size += {size}")
 
         case model.DataTypeString():
-            s.wln(f"{d.name} = await read_string(reader)")
+            print_read_value(s, buffer, d.name, "read_string")
 
             if needs_size:
                 s.wln(f"_size += len({d.name}) + 1")
 
         case model.DataTypeCstring():
-            s.wln(
-                f"{d.name} = await read_cstring(reader)"
-            )
+            print_read_value(s, buffer, d.name, "read_cstring")
 
             if needs_size:
                 s.wln(f"_size += len({d.name}) + 1")
 
         case model.DataTypeSizedCstring():
-            s.wln(f"{d.name} = await read_sized_cstring(reader)")
+            print_read_value(s, buffer, d.name, "read_sized_cstring")
 
             if needs_size:
                 s.wln(f"_size += len({d.name}) + 5")
 
         case model.DataTypeDateTime() | model.DataTypeGold() | model.DataTypeSeconds() | model.DataTypeMilliseconds() | model.DataTypeIPAddress():
-            s.wln(f"{d.name} = await read_int(reader, 4)")
+            print_read_value(s, buffer, d.name, "read_int", "4")
 
             if needs_size:
                 s.wln(f"_size += 4")
 
         case model.DataTypeGUID():
-            s.wln(f"{d.name} = await read_int(reader, 8)")
+            print_read_value(s, buffer, d.name, "read_int", "8")
 
             if needs_size:
                 s.wln(f"_size += 8")
 
         case model.DataTypeLevel():
-            s.wln(f"{d.name} = await read_int(reader, 1)")
+            print_read_value(s, buffer, d.name, "read_int", "1")
 
             if needs_size:
                 s.wln(f"_size += 1")
 
         case model.DataTypeLevel16() | model.DataTypeSpell16():
-            s.wln(f"{d.name} = await read_int(reader, 2)")
+            print_read_value(s, buffer, d.name, "read_int", "2")
 
             if needs_size:
                 s.wln(f"_size += 2")
         case model.DataTypeLevel32() | model.DataTypeSpell() | model.DataTypeItem():
-            s.wln(f"{d.name} = await read_int(reader, 4)")
+            print_read_value(s, buffer, d.name, "read_int", "4")
 
             if needs_size:
                 s.wln(f"_size += 4")
 
         case model.DataTypePopulation():
-            s.wln(f"{d.name} = await read_float(reader)")
+            print_read_value(s, buffer, d.name, "read_float")
 
             if needs_size:
                 s.wln(f"_size += 4")
 
         case model.DataTypePackedGUID():
-            s.wln(f"{d.name} = await read_packed_guid(reader)")
+            print_read_value(s, buffer, d.name, "read_packed_guid")
 
             if needs_size:
                 s.wln(f"_size += packed_guid_size({d.name})")
 
         case model.DataTypeFloatingPoint():
-            s.wln(f"{d.name} = await read_float(reader)")
+            print_read_value(s, buffer, d.name, "read_float")
 
             if needs_size:
                 s.wln(f"_size += 4")
 
         case model.DataTypeStruct(struct_data=e):
-            s.wln(f"{d.name} = await {e.name}.read(reader)")
+            print_read_value(s, buffer, d.name, f"{e.name}.read")
 
             if needs_size:
                 if e.sizes.constant_sized:
@@ -129,94 +356,60 @@ def print_read_struct_member(s: Writer, d: model.Definition, needs_size: bool, c
                 else:
                     s.wln(f"_size += {d.name}.size()")
 
-        case model.DataTypeUpdateMask():
-            s.wln(f"{d.name} = await UpdateMask.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeAuraMask():
-            s.wln(f"{d.name} = await AuraMask.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeMonsterMoveSpline():
-            s.wln(f"{d.name} = await MonsterMoveSpline.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeEnchantMask():
-            s.wln(f"{d.name} = await EnchantMask.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeNamedGUID():
-            s.wln(f"{d.name} = await NamedGuid.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeInspectTalentGearMask():
-            s.wln(f"{d.name} = await InspectTalentGearMask.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeVariableItemRandomProperty():
-            s.wln(f"{d.name} = await VariableItemRandomProperty.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeCacheMask():
-            s.wln(f"{d.name} = await CacheMask.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeAddonArray():
-            s.wln(f"{d.name} = await CacheMask.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeAchievementDoneArray():
-            s.wln(f"{d.name} = await CacheMask.read(reader)")
-
-            if needs_size:
-                s.wln(f"_size += {d.name}.size()")
-
-        case model.DataTypeAchievementInProgressArray():
-            s.wln(f"{d.name} = await CacheMask.read(reader)")
+        case model.DataTypeUpdateMask() \
+             | model.DataTypeAuraMask() \
+             | model.DataTypeMonsterMoveSpline() \
+             | model.DataTypeEnchantMask() \
+             | model.DataTypeNamedGUID() \
+             | model.DataTypeInspectTalentGearMask() \
+             | model.DataTypeVariableItemRandomProperty() \
+             | model.DataTypeCacheMask() \
+             | model.DataTypeAddonArray() \
+             | model.DataTypeAchievementDoneArray() \
+             | model.DataTypeAchievementInProgressArray():
+            print_read_value(s, buffer, d.name, f"{type_to_wowm_str(d.data_type)}.read")
 
             if needs_size:
                 s.wln(f"_size += {d.name}.size()")
 
         case model.DataTypeArray(compressed=compressed, size=size, inner_type=inner_type):
-            reader = "reader"
+            reader = ""
             if compressed:
                 s.wln("# {d.name}_decompressed_size: u32")
                 s.wln("_size += 4  # decompressed_size")
                 s.newline()
 
-                s.wln(f"{d.name}_decompressed_size = await read_int(reader, 4)")
+                print_read_value(s, buffer, f"{d.name}_decompressed_size", "read_int", "4")
 
-                s.wln(f"{d.name}_bytes = await reader.readexactly(body_size - _size)")
-                s.newline()
+                if buffer:
+                    s.wln(f"{d.name}_bytes, _offset = read_bytes_buffer(buf, _offset, body_size - _size)")
+                    s.newline()
+
+                    s.wln(f"{d.name}_buf = b''")
+                    if not array_type_is_bytes(inner_type):
+                        s.wln(f"{d.name}_offset = 0")
+                    s.open(f"if len({d.name}_bytes) != 0:")
+                    s.wln(f"{d.name}_buf = zlib.decompress({d.name}_bytes, bufsize={d.name}_decompressed_size)")
+                    s.close()
+                else:
+                    s.wln(f"{d.name}_bytes = await reader.readexactly(body_size - _size)")
+                    s.newline()
 
-                s.wln(f"{d.name}_reader = reader")
-                s.open(f"if len({d.name}_bytes) != 0:")
-                s.wln(f"{d.name}_bytes = zlib.decompress({d.name}_bytes, bufsize={d.name}_decompressed_size)")
-                s.wln(f"{d.name}_reader = asyncio.StreamReader()")
-                s.wln(f"{d.name}_reader.feed_data({d.name}_bytes)")
-                s.wln(f"{d.name}_reader.feed_eof()")
-                s.close()
+                    s.wln(f"{d.name}_reader = reader")
+                    s.open(f"if len({d.name}_bytes) != 0:")
+                    s.wln(f"{d.name}_bytes = zlib.decompress({d.name}_bytes, bufsize={d.name}_decompressed_size)")
+                    s.wln(f"{d.name}_reader = asyncio.StreamReader()")
+                    s.wln(f"{d.name}_reader.feed_data({d.name}_bytes)")
+                    s.wln(f"{d.name}_reader.feed_eof()")
+                    s.close()
+
+                s.newline()
+                reader = f"{d.name}_"
 
+            if array_type_is_bytes(inner_type):
+                print_read_bytes(s, d, size, needs_size, compressed, container_is_compressed, buffer)
                 s.newline()
-                reader = f"{d.name}_reader"
+                return
 
             s.wln(f"{d.name} = []")
             match size:
@@ -226,43 +419,39 @@ def print_read_struct_member(s: Writer, d: model.Definition, needs_size: bool, c
                     s.open(f"for _ in range(0, {size}):")
                 case model.ArraySizeEndless():
                     if container_is_compressed:
-                        s.open(f"while not reader.at_eof():")
+                        if buffer:
+                            s.open("while _offset < len(buf):")
+                        else:
+                            s.open(f"while not reader.at_eof():")
                     elif not compressed:
                         s.open("while _size < body_size:")
                     else:
-                        s.open(f"while not {d.name}_reader.at_eof():")
+                        if buffer:
+                            s.open(f"while {d.name}_offset < len({d.name}_buf):")
+                        else:
+                            s.open(f"while not {d.name}_reader.at_eof():")
                 case v:
                     raise Exception(f"{v}")
 
             match inner_type:
                 case model.ArrayTypeInteger(integer_type=integer_type):
                     size = integer_type_to_size(integer_type)
-                    s.wln(
-                        f"{d.name}.append(await read_int({reader}, {size}))"
-                    )
+                    print_read_value(s, buffer, d.name, "read_int", str(size), reader, append=True)
 
                 case model.ArrayTypeStruct(struct_data=e):
-                    s.wln(f"{d.name}.append(await {e.name}.read({reader}))")
+                    print_read_value(s, buffer, d.name, f"{e.name}.read", reader=reader, append=True)
 
                 case model.ArrayTypeCstring():
-                    s.wln(
-                        f"{d.name}.append(await read_cstring({reader}))"
-                    )
+                    print_read_value(s, buffer, d.name, "read_cstring", reader=reader, append=True)
 
                 case model.ArrayTypeGUID():
-                    s.wln(
-                        f"{d.name}.append(await read_int({reader}, 8))"
-                    )
+                    print_read_value(s, buffer, d.name, "read_int", "8", reader, append=True)
 
                 case model.ArrayTypeSpell():
-                    s.wln(
-                        f"{d.name}.append(await read_int({reader}, 4))"
-                    )
+                    print_read_value(s, buffer, d.name, "read_int", "4", reader, append=True)
 
                 case model.ArrayTypePackedGUID():
-                    s.wln(
-                        f"{d.name}.append(await read_packed_guid({reader}))"
-                    )
+                    print_read_value(s, buffer, d.name, "read_packed_guid", reader=reader, append=True)
 
                 case v2:
                     raise Exception(f"{v2}")
@@ -302,14 +491,66 @@ def print_read_struct_member(s: Writer, d: model.Definition, needs_size: bool, c
     s.newline()
 
 
-def print_read_member(s: Writer, m: model.StructMember, container: model.Container, needs_size: bool):
+def print_read_bytes(
+        s: Writer,
+        d: model.Definition,
+        size: model.ArraySize,
+        needs_size: bool,
+        compressed: bool,
+        container_is_compressed: bool,
+        buffer: bool,
+):
+    match size:
+        case model.ArraySizeFixed(size=size) | model.ArraySizeVariable(size=size):
+            if buffer:
+                s.wln(f"{d.name}, _offset = read_bytes_buffer(buf, _offset, {size})")
+            else:
+                s.wln(f"{d.name} = await reader.readexactly({size})")
+        case model.ArraySizeEndless():
+            if compressed:
+                if buffer:
+                    s.wln(f"{d.name} = {d.name}_buf")
+                else:
+                    s.wln(f"{d.name} = await {d.name}_reader.read()")
+            elif container_is_compressed:
+                if buffer:
+                    s.wln(f"{d.name} = buf[_offset:]")
+                    s.wln(f"_offset = len(buf)")
+                else:
+                    s.wln(f"{d.name} = await reader.read()")
+            else:
+                if buffer:
+                    s.wln(f"{d.name}, _offset = read_bytes_buffer(buf, _offset, body_size - _size)")
+                else:
+                    s.wln(f"{d.name} = await reader.readexactly(body_size - _size)")
+        case v:
+            raise Exception(f"{v}")
+
+    if needs_size or isinstance(size, model.ArraySizeEndless):
+        s.wln(f"_size += len({d.name})")
+
+
+def print_read_member(
+        s: Writer,
+        m: model.StructMember,
+        container: model.Container,
+        needs_size: bool,
+        buffer: bool,
+        runs: dict[str, typing.Tuple[str, list[model.Definition]]],
+):
     match m:
         case model.StructMemberDefinition(_tag, definition):
+            if definition.name in runs:
+                name, run = runs[definition.name]
+                if run[0] is definition:
+                    print_read_run(s, name, run, needs_size, buffer)
+                return
+
             compressed = container.tags.compressed is not None and container.tags.compressed
-            print_read_struct_member(s, definition, needs_size, compressed)
+            print_read_struct_member(s, definition, needs_size, compressed, buffer)
 
         case model.StructMemberIfStatement(_tag, statement):
-            print_read_if_statement(s, statement, container, False, needs_size)
+            print_read_if_statement(s, statement, container, False, needs_size, buffer, runs)
 
         case _:
             raise Exception("invalid struct member")
@@ -321,6 +562,8 @@ def print_read_if_statement(
         container: model.Container,
         is_else_if: bool,
         needs_size: bool,
+        buffer: bool,
+        runs: dict[str, typing.Tuple[str, list[model.Definition]]],
 ):
     extra_elseif = ""
     if is_else_if:
@@ -331,41 +574,76 @@ def print_read_if_statement(
     s.inc_indent()
 
     for member in statement.members:
-        print_read_member(s, member, container, needs_size)
+        print_read_member(s, member, container, needs_size, buffer, runs)
 
     s.dec_indent()  # if
 
     for elseif in statement.else_if_statements:
-        print_read_if_statement(s, elseif, container, True, needs_size)
+        print_read_if_statement(s, elseif, container, True, needs_size, buffer, runs)
 
 
 def print_read(s: Writer, container: Container):
     s.wln("@staticmethod")
 
-    match container.object_type:
-        case model.ObjectTypeCmsg() | model.ObjectTypeSmsg() | model.ObjectTypeMsg():
-            s.wln(f"async def read(reader: asyncio.StreamReader, body_size: int) -> {container.name}:")
-        case _:
-            s.wln(f"async def read(reader: asyncio.StreamReader) -> {container.name}:")
+    if container_is_message(container):
+        s.open(f"async def read(reader: asyncio.StreamReader, body_size: int) -> {container.name}:")
+        s.wln(f"return {container.name}.from_buffer(await reader.readexactly(body_size), 0, body_size)[0]")
+        s.close()
+        s.newline()
+    else:
+        s.wln(f"async def read(reader: asyncio.StreamReader) -> {container.name}:")
+        s.inc_indent()
+        print_read_body(s, container, False)
+        s.dec_indent()  # read
+        s.newline()
+
+    print_from_buffer(s, container)
+
+
+def print_from_buffer(s: Writer, container: Container):
+    s.wln("@staticmethod")
+
+    if container_is_message(container):
+        s.wln(f"def from_buffer(buf: bytes, _offset: int, body_size: int) -> typing.Tuple[{container.name}, int]:")
+    else:
+        s.wln(f"def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[{container.name}, int]:")
     s.inc_indent()
 
+    print_read_body(s, container, True)
+
+    s.dec_indent()  # from_buffer
+    s.newline()
+
+
+def print_read_body(s: Writer, container: Container, buffer: bool):
     print_optional_names(s, container)
 
+    end = ""
+    if buffer:
+        end = ", _offset"
+
     if len(container.members) == 0 and container.optional is None:
-        s.wln(f"return {container.name}()")
-        s.dec_indent()
-        s.newline()
+        s.wln(f"return {container.name}(){end}")
         return
 
     if container.tags.compressed:
-        s.write_block("""
+        if buffer:
+            s.write_block("""
+decompressed_size, _offset = read_int_buffer(buf, _offset, 4)
+compressed_bytes, _end = read_bytes_buffer(buf, _offset, body_size - 4)
+buf = zlib.decompress(compressed_bytes, bufsize=decompressed_size)
+_offset = 0
+            """)
+            end = ", _end"
+        else:
+            s.write_block("""
 decompressed_size = await read_int(reader, 4)
 compressed_bytes = await reader.readexactly(body_size - 4)
 decompressed_bytes = zlib.decompress(compressed_bytes, bufsize=decompressed_size)
 reader = asyncio.StreamReader()
 reader.feed_data(decompressed_bytes)
 reader.feed_eof()
-        """)
+            """)
         s.newline()
 
     needs_size = container_needs_size_in_read(container)
@@ -374,15 +652,17 @@ reader.feed_eof()
         s.wln("_size = 0")
         s.newline()
 
+    runs = fixed_read_runs(container)
+
     for m in container.members:
-        print_read_member(s, m, container, needs_size)
+        print_read_member(s, m, container, needs_size, buffer, runs)
 
     if container.optional is not None:
         s.wln(f"# {container.optional.name}: optional")
         s.open("if _size < body_size:")
 
         for member in container.optional.members:
-            print_read_member(s, member, container, True)
+            print_read_member(s, member, container, True, buffer, runs)
 
         s.close()
 
@@ -397,12 +677,7 @@ reader.feed_eof()
             continue
         s.wln(f"{d.name}={d.name},")
     s.dec_indent()  # return container name
-    s.wln(")")
-
-    s.dec_indent()  # read
-    s.newline()
-
-
+    s.wln(f"){end}")
 def print_optional_names(s: Writer, container: Container):
     def traverse(s: Writer, m: model.StructMember, should_print: bool):
         def traverse_if_statement(s: Writer, statement: model.IfStatement):
@@ -1,10 +1,12 @@
 import typing
 
 import model
+from print_struct.print_members import container_has_sealed_size
 from print_struct.print_write import print_array_write_inner, print_write_member
 from print_struct.util import (
     integer_type_to_size,
     print_if_statement_header, type_to_wowm_str, container_should_have_size_function, print_optional_statement_header, )
+from util import container_has_compression
 from writer import Writer
 
 
@@ -13,16 +15,29 @@ def print_size(s: Writer, container: model.Container):
         return
 
     s.open("def size(self) -> int:")
+    if container_has_sealed_size(container):
+        s.open("if self._sealed_size is not None:")
+        s.wln("return self._sealed_size")
+        s.close()
+        s.newline()
 
+    print_size_body(s, container, False)
+
+    if container_has_compression(container):
+        s.open("def _uncompressed_size(self) -> int:")
+        print_size_body(s, container, True)
+
+
+def print_size_body(s: Writer, container: model.Container, uncompressed: bool):
     if container.tags.compressed:
-        print_size_for_compressed_container(s, container)
+        print_size_for_compressed_container(s, container, uncompressed)
     else:
         print_size_until_inner_members(s, container.members, container.manual_size_subtraction,
-                                       True, container.optional is not None)
+                                       True, container.optional is not None, uncompressed)
         if container.optional is not None:
             print_optional_statement_header(s, container.optional)
             print_size_until_inner_members(s, container.optional.members, container.manual_size_subtraction, False,
-                                           False)
+                                           False, uncompressed)
             s.close()
             s.newline()
 
@@ -34,7 +49,7 @@ def print_size(s: Writer, container: model.Container):
 
 def print_size_until_inner_members(s: Writer, members: list[model.StructMember],
                                    manual_size_subtraction: typing.Optional[int], return_early: bool,
-                                   has_optional: bool):
+                                   has_optional: bool, uncompressed: bool):
     count, strings, uncounted_members = get_size_and_remaining_members(members)
 
     if manual_size_subtraction is not None:
@@ -56,20 +71,24 @@ def print_size_until_inner_members(s: Writer, members: list[model.StructMember],
             s.newline()
 
         for m in uncounted_members:
-            print_size_inner(s, m)
+            print_size_inner(s, m, uncompressed)
 
         if return_early and not has_optional:
             s.wln(f"return _size")
 
 
-def print_size_for_compressed_container(s, container):
-    s.wln("_fmt = ''")
+def print_size_for_compressed_container(s, container, uncompressed: bool):
+    s.wln("_fmt = '<'")
     s.wln("_data = []")
     s.newline()
     for m in container.members:
         print_write_member(s, m, "_")
+    if uncompressed:
+        s.wln("return struct.calcsize(_fmt) + 4")
+        return
+
     s.wln("_uncompressed_data = struct.pack(_fmt, *_data)")
-    s.wln("_compressed_data = zlib.compress(_uncompressed_data)")
+    s.wln("_compressed_data = compress(_uncompressed_data)")
     s.wln("return len(_compressed_data) + 4")
 
 
@@ -189,7 +208,7 @@ def get_size_and_remaining_members(members: list[model.StructMember]) -> typing.
     return count, strings, uncounted_members
 
 
-def print_size_inner(s: Writer, m: model.StructMember):
+def print_size_inner(s: Writer, m: model.StructMember, uncompressed: bool):
     extra_self = "self."
 
     match m:
@@ -199,7 +218,7 @@ def print_size_inner(s: Writer, m: model.StructMember):
             match d.data_type:
                 case model.DataTypeArray(compressed=compressed, inner_type=inner_type):
                     if compressed:
-                        s.wln(f"_{d.name}_fmt = ''")
+                        s.wln(f"_{d.name}_fmt = '<'")
                         s.wln(f"_{d.name}_data = []")
                         s.newline()
 
@@ -207,8 +226,11 @@ def print_size_inner(s: Writer, m: model.StructMember):
 
                         print_array_write_inner(s, d, inner_type, f"_{d.name}_", extra_self)
 
-                        s.wln(f"_{d.name}_bytes = struct.pack(_{d.name}_fmt, *_{d.name}_data)")
-                        s.wln(f"_size += len(_{d.name}_bytes) + 4")
+                        if uncompressed:
+                            s.wln(f"_size += struct.calcsize(_{d.name}_fmt) + 4")
+                        else:
+                            s.wln(f"_{d.name}_bytes = compress(struct.pack(_{d.name}_fmt, *_{d.name}_data))")
+                            s.wln(f"_size += len(_{d.name}_bytes) + 4")
                         s.close()
 
                         s.open("else:")
@@ -221,7 +243,7 @@ def print_size_inner(s: Writer, m: model.StructMember):
                     raise Exception(f"{v}")
 
         case model.StructMemberIfStatement(struct_member_content=statement):
-            print_size_if_statement(s, statement, False)
+            print_size_if_statement(s, statement, False, uncompressed)
 
         case v:
             raise Exception(f"{v}")
@@ -229,7 +251,7 @@ def print_size_inner(s: Writer, m: model.StructMember):
     s.newline()
 
 
-def print_size_if_statement(s: Writer, statement: model.IfStatement, is_else_if: bool):
+def print_size_if_statement(s: Writer, statement: model.IfStatement, is_else_if: bool, uncompressed: bool):
     extra_elseif = ""
     if is_else_if:
         extra_elseif = "el"
@@ -240,9 +262,9 @@ def print_size_if_statement(s: Writer, statement: model.IfStatement, is_else_if:
 
     s.inc_indent()
 
-    print_size_until_inner_members(s, statement.members, None, False, False)
+    print_size_until_inner_members(s, statement.members, None, False, False, uncompressed)
 
     s.dec_indent()  # if
 
     for elseif in statement.else_if_statements:
-        print_size_if_statement(s, elseif, True)
+        print_size_if_statement(s, elseif, True, uncompressed)
@@ -1,5 +1,6 @@
 import model
 from print_struct.util import container_should_have_size_function, all_members_from_container
+from print_struct.print_write import template_layout
 from util import login_version_to_module_name, first_login_version, VERSIONS, world_version_to_module_name, \
     should_print_container, container_is_unencrypted, write_null_header_crypto
 from writer import Writer
@@ -27,16 +28,22 @@ def print_tests_for_login_message(s: Writer, e: model.Container, i: int):
         version = login_version_to_module_name(first_login_version(e.tags))
 
         version = f"wow_login_messages.{version}"
+        side = ""
         match e.object_type:
             case model.ObjectTypeClogin():
+                side = "client"
                 s.wln(f"r = await {version}.expect_client_opcode(reader, {version}.{e.name})")
             case model.ObjectTypeSlogin():
+                side = "server"
                 s.wln(f"r = await {version}.expect_server_opcode(reader, {version}.{e.name})")
             case v:
                 raise Exception(f"{v}")
 
         s.wln("self.assertIsNotNone(r)")
         s.wln("self.assertTrue(reader.at_eof())")
+        s.wln(f"self.assertEqual((r, len(data)), {version}.{e.name}.from_buffer(data, 1))")
+        s.wln(f"decoder = {version}.LoginFrameDecoder({version}.{side}_opcodes)")
+        s.wln("self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])")
         if container_should_have_size_function(e):
             negative = 1  # opcode
             if e.manual_size_subtraction is not None:
@@ -46,6 +53,9 @@ def print_tests_for_login_message(s: Writer, e: model.Container, i: int):
         s.wln("written = bytearray(len(data))")
         s.wln("r.write(written)")
         s.wln("self.assertEqual(data, written)")
+        s.wln("written = bytearray(len(data) + 3)")
+        s.wln("self.assertEqual(len(data) + 3, r.write_into(written, 3))")
+        s.wln("self.assertEqual(data, written[3:])")
 
         s.close()  # async def test
         s.newline()
@@ -102,13 +112,14 @@ def print_tests_for_world_message(s: Writer, e: model.Container, version: str):
 
         side = ""
         header_length = 0
+        opcode = 0
 
         match e.object_type:
-            case model.ObjectTypeCmsg():
+            case model.ObjectTypeCmsg(opcode=opcode):
                 side = "client"
                 s.wln(f"r = await {version}.expect_client_opcode_unencrypted(reader, {version}.{e.name})")
                 header_length = 6
-            case model.ObjectTypeSmsg():
+            case model.ObjectTypeSmsg(opcode=opcode):
                 side = "server"
                 s.wln(f"r = await {version}.expect_server_opcode_unencrypted(reader, {version}.{e.name})")
                 header_length = 4
@@ -117,6 +128,9 @@ def print_tests_for_world_message(s: Writer, e: model.Container, version: str):
 
         s.wln("self.assertIsNotNone(r)")
         s.wln("self.assertTrue(reader.at_eof())")
+        s.wln(f"self.assertEqual(r, {version}.LazyMessage({version}.{e.name}, 0x{opcode:04X}, data[{header_length}:])._decode())")
+        s.wln(f"decoder = {version}.WorldFrameDecoder({version}.{side}_opcodes, {side == 'client'})")
+        s.wln("self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])")
         if container_should_have_size_function(e) and not any_fields_are_compressed:
             negative = 0
 
@@ -129,6 +143,8 @@ def print_tests_for_world_message(s: Writer, e: model.Container, version: str):
                     raise Exception("invalid object type for size")
 
             s.wln(f"self.assertEqual(len(data) - {negative}, r.size())")
+            s.wln(f"self.assertEqual(len(data) - {negative}, {version}.seal(r).size())")
+            s.wln(f"{version}.unseal(r)")
 
         if any_fields_are_compressed:
             s.wln(f"written = bytearray(r.size() + {header_length})")
@@ -143,6 +159,27 @@ def print_tests_for_world_message(s: Writer, e: model.Container, version: str):
 
         if not any_fields_are_compressed:
             s.wln("self.assertEqual(data, written)")
+            s.wln("written = bytearray(len(data) + 3)")
+            if container_is_unencrypted(e.name):
+                s.wln("self.assertEqual(len(data) + 3, r.write_unencrypted_into(written, 3))")
+            else:
+                s.wln(f"self.assertEqual(len(data) + 3, r.write_encrypted_{side}_into(written, 3, NullHeaderCrypto()))")
+            s.wln("self.assertEqual(data, written[3:])")
+            s.wln(f"batch = {version}.PacketBatch(NullHeaderCrypto(), {side == 'client'})")
+            s.wln("batch.extend([r, r])")
+            s.wln("self.assertEqual(data + data, batch.flush())")
+            s.wln(f"encoded = {version}.EncodedMessage(r, {side == 'client'})")
+            s.wln("self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)")
+            fields, _ = template_layout(e)
+            if len(fields) != 0:
+                patch = ", ".join(f"{f.name}=r.{f.path}" for f in fields)
+                s.wln("template = r.template()")
+                s.wln(f"self.assertEqual(data[{header_length}:], template.patch({patch}).body)")
+                s.wln("self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)")
+        else:
+            s.wln(f"encoded = {version}.EncodedMessage(r, {side == 'client'})")
+            s.wln(f"self.assertEqual(r, {version}.LazyMessage({version}.{e.name}, 0x{opcode:04X}, encoded.body)._decode())")
+            s.wln(f"self.assertEqual(encoded.body, written[{header_length}:])")
 
         s.close()  # async def test
         s.newline()
@@ -1,8 +1,12 @@
+import dataclasses
+import struct
 import typing
 
 import model
 from model import Container
-from print_struct.util import print_if_statement_header, type_to_wowm_str, print_optional_statement_header
+from print_struct.print_read import struct_is_flattened
+from print_struct.util import print_if_statement_header, type_to_wowm_str, print_optional_statement_header, \
+    array_type_is_bytes, type_to_python_str
 from util import container_is_unencrypted
 from writer import Writer
 
@@ -95,6 +99,9 @@ def addable_write_values(
             if compressed:
                 return None
 
+            if array_type_is_bytes(inner_type):
+                return f"{{len(self.{d.name})}}s", f"bytes(self.{d.name})"
+
             match inner_type:
                 case model.ArrayTypeInteger(integer_type=integer_type):
                     ty = integer_type_to_struct_pack(integer_type)
@@ -145,7 +152,7 @@ def print_write_struct_member(s: Writer, d: model.Definition, prefix: str):
         match d.data_type:
             case model.DataTypeArray(inner_type=inner_type, compressed=compressed):
                 if compressed:
-                    s.wln(f"_{d.name}_fmt = ''")
+                    s.wln(f"_{d.name}_fmt = '<'")
                     s.wln(f"_{d.name}_data = []")
                     s.newline()
 
@@ -156,16 +163,16 @@ def print_write_struct_member(s: Writer, d: model.Definition, prefix: str):
 
                     s.wln(f"_{d.name}_bytes = struct.pack(_{d.name}_fmt, *_{d.name}_data)")
                     s.wln(f"_{d.name}_decompressed_size = len(_{d.name}_bytes)")
-                    s.wln(f"_{d.name}_bytes = list(_{d.name}_bytes)")
+                    s.wln(f"_{d.name}_bytes = compress(_{d.name}_bytes)")
                     s.newline()
 
                     s.wln("_fmt += 'I'")
                     s.wln(f"_data.append(_{d.name}_decompressed_size)")
                     s.newline()
 
-                    s.wln(f"_fmt += f'{{len(_{d.name}_bytes)}}B'")
+                    s.wln(f"_fmt += f'{{len(_{d.name}_bytes)}}s'")
 
-                    s.wln(f"_data.extend(list(_{d.name}_bytes))")
+                    s.wln(f"_data.append(_{d.name}_bytes)")
                     s.close()  # if len( != 0
 
                     s.open("else:")
@@ -195,6 +202,11 @@ def print_write_struct_member(s: Writer, d: model.Definition, prefix: str):
 
 
 def print_array_write_inner(s: Writer, d: model.Definition, inner_type: model.ArrayType, prefix: str, extra_self: str):
+    if array_type_is_bytes(inner_type):
+        s.wln(f"{prefix}fmt += f'{{len({extra_self}{d.name})}}s'")
+        s.wln(f"{prefix}data.append(bytes({extra_self}{d.name}))")
+        return
+
     match inner_type:
         case model.ArrayTypeInteger(integer_type=integer_type):
             ty = integer_type_to_struct_pack(integer_type)
@@ -261,44 +273,321 @@ def get_write_and_remaining_members(
     return fmt, data, []
 
 
-def print_write(s: Writer, container: Container, object_type: model.ObjectType):
+def write_function_name(container: Container, object_type: model.ObjectType) -> str:
+    match object_type:
+        case model.ObjectTypeCmsg() | model.ObjectTypeSmsg():
+            if container_is_unencrypted(container.name):
+                return "write_unencrypted"
+
+            match object_type:
+                case model.ObjectTypeCmsg():
+                    return "write_encrypted_client"
+                case model.ObjectTypeSmsg():
+                    return "write_encrypted_server"
+
+    return "write"
+
+
+def write_header_format(object_type: model.ObjectType) -> str:
+    match object_type:
+        case model.ObjectTypeClogin() | model.ObjectTypeSlogin():
+            return "B"
+        case model.ObjectTypeCmsg():
+            return "6s"
+        case model.ObjectTypeSmsg():
+            return "4s"
+        case v:
+            raise Exception(f"{v}")
+
+
+def write_struct_name(container: Container, object_type: model.ObjectType) -> str:
+    return f"_{container.name}_{write_function_name(container, object_type)}"
+
+
+def fixed_write_format(container: Container) -> typing.Optional[str]:
+    if container.tags.compressed or container.optional is not None:
+        return None
+
+    fmt, _, extra_members = get_write_and_remaining_members(container.members)
+    if len(extra_members) != 0 or "{" in fmt:
+        return None
+
+    return fmt
+
+
+def print_write_structs(s: Writer, container: Container) -> bool:
+    fmt = fixed_write_format(container)
+    if fmt is None:
+        return False
+
+    match container.object_type:
+        case model.ObjectTypeStruct():
+            return False
+        case model.ObjectTypeMsg(opcode=opcode):
+            object_types = [model.ObjectTypeCmsg("CMsg", opcode), model.ObjectTypeSmsg("SMsg", opcode)]
+        case v:
+            object_types = [v]
+
+    for object_type in object_types:
+        s.wln(f'{write_struct_name(container, object_type)} = struct.Struct("<{write_header_format(object_type)}{fmt}")')
+
+    return True
+
+
+@dataclasses.dataclass
+class TemplateField:
+    name: str
+    path: str
+    definition: model.Definition
+    fmt: str
+    base: int
+    offset: int
+
+
+def template_format(d: model.Definition) -> typing.Optional[str]:
+    match d.data_type:
+        case model.DataTypeStruct(struct_data=e):
+            if not struct_is_flattened(e):
+                return None
+            return "".join(template_format(m.struct_member_content) for m in e.members)
+
+    addable = addable_write_values(d)
+    if addable is None or "{" in addable[0]:
+        return None
+
+    return addable[0]
+
+
+def if_statement_variables(members: list[model.StructMember]) -> set[str]:
+    variables = set()
+    for m in members:
+        match m:
+            case model.StructMemberIfStatement(struct_member_content=statement):
+                for s in [statement, *statement.else_if_statements]:
+                    variables.add(s.variable_name)
+                    variables |= if_statement_variables(s.members)
+
+    return variables
+
+
+def template_layout(container: Container) -> typing.Tuple[list[TemplateField], list[typing.Tuple[int, str]]]:
+    # Fields of the fixed size prefix of the body, and the packed guids that move the fields after them.
+    # A field is at offset bytes from the end of packed guid number base, or from the start of the body.
+    match container.object_type:
+        case model.ObjectTypeCmsg() | model.ObjectTypeSmsg() | model.ObjectTypeMsg():
+            pass
+        case _:
+            return [], []
+
+    if container.tags.compressed:
+        return [], []
+
+    fields = []
+    guids = []
+    offset = 0
+
+    def walk(e: Container, path: str) -> bool:
+        nonlocal offset
+        conditions = if_statement_variables(e.members)
+
+        for m in e.members:
+            match m:
+                case model.StructMemberDefinition(struct_member_content=d):
+                    pass
+                case _:
+                    return False
+
+            fmt = template_format(d)
+            if fmt is not None:
+                if (len(fmt) == 1 or isinstance(d.data_type, model.DataTypeStruct)) \
+                        and d.constant_value is None \
+                        and d.size_of_fields_before_size is None \
+                        and d.used_as_size_in is None \
+                        and d.name not in conditions:
+                    fields.append(TemplateField(f"{path}{d.name}".replace(".", "_"), f"{path}{d.name}", d, fmt,
+                                                len(guids), offset))
+                offset += struct.calcsize(f"<{fmt}")
+                continue
+
+            match d.data_type:
+                case model.DataTypePackedGUID():
+                    guids.append((offset, f"{path}{d.name}"))
+                    offset = 0
+                case model.DataTypeStruct(struct_data=inner):
+                    if inner.optional is not None or not walk(inner, f"{path}{d.name}."):
+                        return False
+                case _:
+                    return False
+
+        return True
+
+    walk(container, "")
+    return fields, guids
+
+
+def template_values(d: model.Definition, name: str) -> str:
+    match d.data_type:
+        case model.DataTypeStruct(struct_data=e):
+            return ", ".join(template_values(m.struct_member_content, f"{name}.{m.struct_member_content.name}")
+                             for m in e.members)
+        case model.DataTypeEnum() | model.DataTypeFlag():
+            return f"{name}.value"
+
+    return name
+
+
+def template_pack_into(container: Container, f: TemplateField) -> str:
+    if isinstance(f.definition.data_type, model.DataTypeStruct):
+        return f"_{container.name}_{f.name}_pack_into"
+
+    match f.fmt:
+        case "B":
+            return "pack_u8_into"
+        case "b":
+            return "pack_i8_into"
+        case "H":
+            return "pack_u16_into"
+        case "h":
+            return "pack_i16_into"
+        case "I":
+            return "pack_u32_into"
+        case "i":
+            return "pack_i32_into"
+        case "Q":
+            return "pack_u64_into"
+        case "q":
+            return "pack_i64_into"
+        case "f":
+            return "pack_f32_into"
+        case v:
+            raise Exception(f"{v}")
+
+
+def print_template(s: Writer, container: Container):
+    fields, _ = template_layout(container)
+    if len(fields) == 0:
+        return
+
+    match container.object_type:
+        case model.ObjectTypeMsg():
+            s.wln(f"def template(self, client: bool = False) -> _{container.name}_Template:")
+            s.inc_indent()
+            s.wln(f"return _{container.name}_Template(self, client)")
+        case model.ObjectTypeCmsg():
+            s.wln(f"def template(self) -> _{container.name}_Template:")
+            s.inc_indent()
+            s.wln(f"return _{container.name}_Template(self, True)")
+        case _:
+            s.wln(f"def template(self) -> _{container.name}_Template:")
+            s.inc_indent()
+            s.wln(f"return _{container.name}_Template(self)")
+
+    s.dec_indent()
+    s.newline()
+
+
+def print_template_class(s: Writer, container: Container):
+    fields, guids = template_layout(container)
+    if len(fields) == 0:
+        return
+
+    struct_fields = [f for f in fields if isinstance(f.definition.data_type, model.DataTypeStruct)]
+    for f in struct_fields:
+        s.wln(f'{template_pack_into(container, f)} = struct.Struct("<{f.fmt}").pack_into')
+    if len(struct_fields) != 0:
+        s.double_newline()
+
+    s.open(f"class _{container.name}_Template(MessageTemplate):")
+
+    slots = [f'"_offset{i + 1}"' for i in range(len(guids)) if any(f.base == i + 1 for f in fields)]
+    if len(slots) == 1:
+        s.wln(f"__slots__ = ({slots[0]},)")
+    else:
+        s.wln(f"__slots__ = ({', '.join(slots)})")
+    s.newline()
+
+    if len(slots) != 0:
+        s.open(f"def __init__(self, message: {container.name}, client: bool = False):")
+        s.wln("super().__init__(message, client)")
+        base = "6"
+        for i, (offset, path) in enumerate(guids):
+            if not any(f.base > i for f in fields):
+                break
+            value = f"{base} + {offset} + packed_guid_size(message.{path})" if offset != 0 \
+                else f"{base} + packed_guid_size(message.{path})"
+            if any(f.base == i + 1 for f in fields):
+                s.wln(f"self._offset{i + 1} = {value}")
+                base = f"self._offset{i + 1}"
+            else:
+                s.wln(f"_offset{i + 1} = {value}")
+                base = f"_offset{i + 1}"
+        s.close()
+        s.newline()
+
+    s.wln("def patch(")
+    s.inc_indent()
+    s.wln("self,")
+    for f in fields:
+        s.wln(f"{f.name}: typing.Optional[{type_to_python_str(f.definition.data_type)}] = None,")
+    s.dec_indent()
+    s.open(f") -> _{container.name}_Template:")
+    for f in fields:
+        offset = str(6 + f.offset) if f.base == 0 else f"self._offset{f.base} + {f.offset}"
+        if f.base != 0 and f.offset == 0:
+            offset = f"self._offset{f.base}"
+        s.open(f"if {f.name} is not None:")
+        s.wln(f"{template_pack_into(container, f)}(self.buffer, {offset}, {template_values(f.definition, f.name)})")
+        s.close()
+    s.newline()
+    s.wln("return self")
+    s.close()  # def patch
+    s.newline()
+    s.close()  # class
+    s.newline()
+
+
+def print_write(s: Writer, container: Container, object_type: model.ObjectType, large_server_header: bool = False):
     unencrypted = container_is_unencrypted(container.name)
 
-    writer = "writer: typing.Union[asyncio.StreamWriter, bytearray]"
+    name = write_function_name(container, object_type)
+    crypto_parameter = ""
     match object_type:
         case model.ObjectTypeStruct():
             s.wln("def write(self, _fmt, _data):")
         case model.ObjectTypeCmsg() | model.ObjectTypeSmsg():
-            if unencrypted:
-                s.wln(f"def write_unencrypted(self, {writer}):")
-            else:
+            if not unencrypted:
                 version_string = "Vanilla"
-                match object_type:
-                    case model.ObjectTypeCmsg():
-                        s.wln("def write_encrypted_client(")
-                    case model.ObjectTypeSmsg():
-                        s.wln("def write_encrypted_server(")
-                    case _:
-                        raise Exception("unknown object_type")
-                s.inc_indent()
-                s.wln("self,")
-                s.wln(f"{writer},")
-                s.wln(f"header_crypto: wow_srp.{version_string}HeaderCrypto,")
-                s.dec_indent()
-                s.wln("):")
+                crypto_parameter = f"header_crypto: wow_srp.{version_string}HeaderCrypto"
+
+            print_write_wrappers(s, name, crypto_parameter, fixed_write_format(container) is not None)
+            if crypto_parameter != "":
+                s.wln(f"def _{name}_fmt(self, {crypto_parameter}):")
+            else:
+                s.wln(f"def _{name}_fmt(self):")
         case _:
-            s.wln(f"def write(self, {writer}):")
+            print_write_wrappers(s, name, crypto_parameter, fixed_write_format(container) is not None)
+            s.wln(f"def _{name}_fmt(self):")
     s.inc_indent()
 
+    if isinstance(object_type, model.ObjectTypeStruct):
+        print_write_members_addable(s, container.members, "_")
+
+        if container.optional is not None:
+            print_optional_statement_header(s, container.optional)
+            print_write_members_addable(s, container.optional.members, "_")
+            s.close()
+
+        s.wln("return _fmt, _data")
+        s.dec_indent()  # def write
+        s.newline()
+        return
+
+    deferred_header = None
     match object_type:
-        case model.ObjectTypeStruct():
-            pass
         case model.ObjectTypeClogin(opcode=opcode) | model.ObjectTypeSlogin(
             opcode=opcode
         ):
-            s.wln("_fmt = '<B' # opcode")
-            s.wln(f"_data = [{opcode}]")
-            s.newline()
+            header = str(opcode)
 
         case model.ObjectTypeCmsg(opcode=opcode) | model.ObjectTypeSmsg(opcode=opcode):
             opcode_size = 0
@@ -310,14 +599,19 @@ def print_write(s: Writer, container: Container, object_type: model.ObjectType):
                 case v:
                     raise Exception(f"{v}")
 
-            size = "self.size()"
-            if container.sizes.constant_sized:
-                size = str(container.sizes.maximum_size)
+            size = str(container.sizes.maximum_size)
 
-            if not unencrypted:
-                s.wln(
-                    f"_data = bytes(header_crypto.encrypt_server_header({size} + {opcode_size}, 0x{opcode:04X}))"
-                )
+            if not container.sizes.constant_sized:
+                # Header is filled in after the body has been laid out
+                header = 'b""'
+                if not unencrypted:
+                    deferred_header = f"bytes(header_crypto.encrypt_server_header(struct.calcsize(_fmt) - 2, 0x{opcode:04X}))"
+                elif opcode_size == 4:
+                    deferred_header = f'struct.pack(">H", struct.calcsize(_fmt) - 2) + struct.pack("<I", 0x{opcode:04X})'
+                else:
+                    deferred_header = f'struct.pack(">H", struct.calcsize(_fmt) - 2) + struct.pack("<H", 0x{opcode:04X})'
+            elif not unencrypted:
+                header = f"bytes(header_crypto.encrypt_server_header({size} + {opcode_size}, 0x{opcode:04X}))"
             else:
                 s.wln(f"_data = bytearray({opcode_size + 2})")
                 s.wln(f'struct.pack_into(">H", _data, 0, {size} + {opcode_size})')
@@ -327,68 +621,132 @@ def print_write(s: Writer, container: Container, object_type: model.ObjectType):
                     s.wln(f'struct.pack_into("<H", _data, 2, 0x{opcode:04X})')
                 else:
                     raise Exception("invalid opcode size")
-
-            s.wln(f'_fmt = "<{opcode_size + 2}s"')
-            s.wln("_data = [_data]")
-            s.newline()
-
-            if container.tags.compressed:
-                s.wln('_compressed_fmt = "<"')
-                s.wln("_compressed_data = []")
-                s.newline()
+                header = "_data"
 
         case _:
             raise Exception("unsupported write header")
 
+    header_format = write_header_format(object_type)
+    fmt, data, extra_members = get_write_and_remaining_members(container.members)
+    if container.tags.compressed:
+        fmt, data, extra_members = "", "", container.members
+
+    values = header
+    if len(data) != 0:
+        values += f", {data}"
+
+    if fixed_write_format(container) is not None:
+        s.wln(f"return {write_struct_name(container, object_type)}, [{values}]")
+        s.dec_indent()  # def write
+        s.newline()
+        return
+
+    extra_format = ""
+    if "{" in fmt:
+        extra_format = "f"
+    s.wln(f'_fmt = {extra_format}"<{header_format}{fmt}"')
+    s.wln(f"_data = [{values}]")
+    s.newline()
+
     prefix = "_"
     if container.tags.compressed:
         prefix = "_compressed_"
+        s.wln('_compressed_fmt = "<"')
+        s.wln("_compressed_data = []")
+        s.newline()
 
-    print_write_members_addable(s, container.members, prefix)
+        print_write_members_addable(s, extra_members, prefix)
+    else:
+        for m in extra_members:
+            print_write_member(s, m, prefix)
 
     if container.optional is not None:
         print_optional_statement_header(s, container.optional)
         print_write_members_addable(s, container.optional.members, prefix)
         s.close()
 
-    match object_type:
-        case model.ObjectTypeStruct():
-            s.wln("return _fmt, _data")
-        case model.ObjectTypeClogin() \
-             | model.ObjectTypeSlogin() \
-             | model.ObjectTypeCmsg() \
-             | model.ObjectTypeSmsg():
-            if container.tags.compressed:
-                s.wln("_uncompressed_data = struct.pack(_compressed_fmt, *_compressed_data)")
-                s.wln("_compressed_data = zlib.compress(_uncompressed_data)")
-                s.newline()
-
-                s.wln("_fmt += 'I'")
-                s.wln("_data.append(len(_uncompressed_data))")
-                s.newline()
-
-                s.wln("_fmt += f'{len(_compressed_data)}s'")
-                s.wln("_data.append(_compressed_data)")
-                s.newline()
-
-            s.wln("_data = struct.pack(_fmt, *_data)")
-
-            s.open("if isinstance(writer, bytearray):")
-
-            s.open("for i in range(0, len(_data)):")
-            s.wln("writer[i] = _data[i]")
+    if container.tags.compressed:
+        s.wln("_uncompressed_data = struct.pack(_compressed_fmt, *_compressed_data)")
+        s.wln("_compressed_data = compress(_uncompressed_data)")
+        s.newline()
+
+        s.wln("_fmt += 'I'")
+        s.wln("_data.append(len(_uncompressed_data))")
+        s.newline()
+
+        s.wln("_fmt += f'{len(_compressed_data)}s'")
+        s.wln("_data.append(_compressed_data)")
+        s.newline()
+
+    if deferred_header is not None:
+        s.wln(f"_data[0] = {deferred_header}")
+        if large_server_header and not unencrypted and isinstance(object_type, model.ObjectTypeSmsg):
+            s.open("if len(_data[0]) != 4:")
+            s.wln('_fmt = f"<{len(_data[0])}s" + _fmt[3:]')
             s.close()
-            s.wln("return")
+    s.wln("return _fmt, _data")
 
-            s.close()
+    s.dec_indent()  # def write
+    s.newline()
 
-            s.wln("writer.write(_data)")
-        case _:
-            raise Exception("unsupported write header")
 
+def print_write_wrappers(s: Writer, name: str, crypto_parameter: str, fixed: bool):
+    crypto_argument = ""
+    if crypto_parameter != "":
+        crypto_argument = "header_crypto"
+
+    writer = "writer: typing.Union[asyncio.StreamWriter, bytearray]"
+    if crypto_parameter == "":
+        s.wln(f"def {name}(self, {writer}):")
+    else:
+        s.wln(f"def {name}(")
+        s.inc_indent()
+        s.wln("self,")
+        s.wln(f"{writer},")
+        s.wln(f"{crypto_parameter},")
+        s.dec_indent()
+        s.wln("):")
+    s.inc_indent()
+    if fixed:
+        s.wln(f"_struct, _data = self._{name}_fmt({crypto_argument})")
+        s.open("if isinstance(writer, bytearray):")
+        s.wln("_struct.pack_into(writer, 0, *_data)")
+        s.wln("return")
+        s.close()
+        s.wln("writer.write(_struct.pack(*_data))")
+    else:
+        s.wln(f"_fmt, _data = self._{name}_fmt({crypto_argument})")
+        s.open("if isinstance(writer, bytearray):")
+        s.wln("struct.pack_into(_fmt, writer, 0, *_data)")
+        s.wln("return")
+        s.close()
+        s.wln("writer.write(struct.pack(_fmt, *_data))")
     s.dec_indent()  # def write
     s.newline()
 
+    if crypto_parameter == "":
+        s.wln(f"def {name}_into(self, buf: bytearray, offset: int) -> int:")
+    else:
+        s.wln(f"def {name}_into(")
+        s.inc_indent()
+        s.wln("self,")
+        s.wln("buf: bytearray,")
+        s.wln("offset: int,")
+        s.wln(f"{crypto_parameter},")
+        s.dec_indent()
+        s.wln(") -> int:")
+    s.inc_indent()
+    if fixed:
+        s.wln(f"_struct, _data = self._{name}_fmt({crypto_argument})")
+        s.wln("_struct.pack_into(buf, offset, *_data)")
+        s.wln("return offset + _struct.size")
+    else:
+        s.wln(f"_fmt, _data = self._{name}_fmt({crypto_argument})")
+        s.wln("struct.pack_into(_fmt, buf, offset, *_data)")
+        s.wln("return offset + struct.calcsize(_fmt)")
+    s.dec_indent()  # def write_into
+    s.newline()
+
 
 def print_write_members_addable(s: Writer, members: list[model.StructMember], prefix: str):
     fmt, data, extra_members = get_write_and_remaining_members(members)
@@ -397,11 +755,11 @@ def print_write_members_addable(s: Writer, members: list[model.StructMember], pr
             extra_format = ""
             if "{" in fmt:
                 extra_format = "f"
-            s.wln(f"_fmt += {extra_format}'{fmt}'")
+            s.wln(f"{prefix}fmt += {extra_format}'{fmt}'")
             if "," in data or "*" in data:
-                s.wln(f"_data.extend([{data}])")
+                s.wln(f"{prefix}data.extend([{data}])")
             else:
-                s.wln(f"_data.append({data})")
+                s.wln(f"{prefix}data.append({data})")
 
         for m in extra_members:
             print_write_member(s, m, prefix)
@@ -180,6 +180,9 @@ def type_to_python_str(ty: model.DataType) -> str:
             return type_name
 
         case model.DataTypeArray(inner_type=inner_type):
+            if array_type_is_bytes(inner_type):
+                return "bytes"
+
             inner_type = array_type_to_python_str(inner_type)
             return f"typing.List[{inner_type}]"
 
@@ -239,6 +242,14 @@ def type_to_python_str(ty: model.DataType) -> str:
             raise Exception(f"{v}")
 
 
+def array_type_is_bytes(ty: model.ArrayType) -> bool:
+    match ty:
+        case model.ArrayTypeInteger(integer_type=integer_type):
+            return integer_type == model.IntegerType.U8
+
+    return False
+
+
 def array_type_to_python_str(ty: model.ArrayType):
     match ty:
         case model.ArrayTypeCstring():
@@ -2,35 +2,160 @@ import model
 from writer import Writer
 
 
+def update_mask_struct_member_format(member: model.UpdateMaskStructMember) -> str:
+    if isinstance(member.member.data_type, model.DataTypeFloatingPoint):
+        return "f"
+
+    match member.size:
+        case 1:
+            return "B"
+        case 2:
+            return "H"
+        case 4:
+            return "I"
+        case 8:
+            return "Q"
+        case v:
+            return f"{v // 4}I"
+
+
+def update_mask_field_format(value: model.UpdateMask) -> str:
+    match value.data_type:
+        case model.UpdateMaskDataTypeGUID():
+            amount, fmt = value.size // 2, "Q"
+        case model.UpdateMaskDataTypeFloat():
+            amount, fmt = value.size, "f"
+        case model.UpdateMaskDataTypeBytes():
+            amount, fmt = value.size * 4, "B"
+        case model.UpdateMaskDataTypeTwoShort():
+            amount, fmt = value.size * 2, "H"
+        case _:
+            amount, fmt = value.size, "I"
+
+    if amount == 1:
+        return f"<{fmt}"
+    return f"<{amount}{fmt}"
+
+
+def update_mask_object_types() -> list[list[model.UpdateMaskObjectType]]:
+    t = model.UpdateMaskObjectType
+    # In the order of the ObjectType enum, along with the object types each one inherits fields from
+    return [
+        [t.OBJECT],
+        [t.OBJECT, t.ITEM],
+        [t.OBJECT, t.ITEM, t.CONTAINER],
+        [t.OBJECT, t.UNIT],
+        [t.OBJECT, t.UNIT, t.PLAYER],
+        [t.OBJECT, t.GAME_OBJECT],
+        [t.OBJECT, t.DYNAMIC_OBJECT],
+        [t.OBJECT, t.CORPSE],
+    ]
+
+
+def update_mask_lengths(update_mask: list[model.UpdateMask]) -> list[int]:
+    ends: dict[model.UpdateMaskObjectType, int] = {}
+    for value in update_mask:
+        ends[value.object_type] = max(ends.get(value.object_type, 0), value.offset + value.size)
+
+    return [max(ends[object_type] for object_type in types) for types in update_mask_object_types()]
+
+
+def update_mask_float_words(update_mask: list[model.UpdateMask]) -> list[list[int]]:
+    words: dict[model.UpdateMaskObjectType, list[int]] = {}
+    for value in update_mask:
+        floats = words.setdefault(value.object_type, [])
+        match value.data_type:
+            case model.UpdateMaskDataTypeFloat():
+                floats.extend(range(value.offset, value.offset + value.size))
+            case model.UpdateMaskDataTypeArrayOfStruct(content=content):
+                for i in range(0, value.size // content.size):
+                    for word_index, word in enumerate(content.update_mask_struct.members):
+                        if any(isinstance(member.member.data_type, model.DataTypeFloatingPoint) for member in word):
+                            floats.append(value.offset + i * content.size + word_index)
+
+    return [sorted(word for object_type in types for word in words.get(object_type, []))
+            for types in update_mask_object_types()]
+
+
 def print_update_mask(s: Writer, update_mask: list[model.UpdateMask]):
     s.write_block("""
-@dataclasses.dataclass
+class UpdateMaskField(typing.NamedTuple):
+    offset: int
+    words: int
+    format: str
+    position: int = 0
+
+
+@slots_dataclass
 class UpdateMask:
     fields: dict[int, int]
+    # OBJECT_TYPE of the mask a delta was made from, since deltas rarely contain it
+    _object_type: typing.Optional[int] = dataclasses.field(default=None, repr=False, compare=False)
     
     @staticmethod
     async def read(reader: asyncio.StreamReader):
         amount_of_blocks = await read_int(reader, 1)
+        blocks = struct.unpack(f"<{amount_of_blocks}I", await reader.readexactly(amount_of_blocks * 4))
+
+        keys = UpdateMask._keys(blocks)
+        values = struct.unpack(f"<{len(keys)}I", await reader.readexactly(len(keys) * 4))
+
+        return UpdateMask(fields=dict(zip(keys, values)))
+
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[UpdateMask, int]:
+        amount_of_blocks, _offset = read_int_buffer(buf, _offset, 1)
+        blocks = struct.unpack_from(f"<{amount_of_blocks}I", buf, _offset)
+        _offset += amount_of_blocks * 4
+
+        keys = UpdateMask._keys(blocks)
+        values = struct.unpack_from(f"<{len(keys)}I", buf, _offset)
+        _offset += len(keys) * 4
 
-        blocks = []
-        for _ in range(0, amount_of_blocks):
-            blocks.append(await read_int(reader, 4))
+        return UpdateMask(fields=dict(zip(keys, values))), _offset
 
-        fields = {}
+    @staticmethod
+    def _keys(blocks: typing.Sequence[int]) -> typing.List[int]:
+        keys = []
         for block_index, block in enumerate(blocks):
-            for bit in range(0, 32):
-                if block & 1 << bit:
-                    value = await read_int(reader, 4)
-                    key = block_index * 32 + bit
-                    fields[key] = value
+            base = block_index * 32
+            while block:
+                lowest_bit = block & -block
+                keys.append(base + lowest_bit.bit_length() - 1)
+                block ^= lowest_bit
+
+        return keys
+
+    def delta(self, previous: UpdateMask) -> UpdateMask:
+        fields = {key: value for key, value in self.fields.items() if previous.fields.get(key) != value}
+        for key, value in previous.fields.items():
+            if key not in self.fields and value != 0:
+                fields[key] = 0
+
+        return UpdateMask(fields=fields, _object_type=self.fields.get(UpdateMaskValue.OBJECT_TYPE, self._object_type))
+
+    def get(self, field: UpdateMaskField) -> typing.Any:
+        offset, words, fmt, position = field
+        fields = self.fields
+        data = struct.pack(f"<{words}I", *[fields.get(key, 0) for key in range(offset, offset + words)])
+
+        values = struct.unpack_from(fmt, data, position)
+        if len(values) == 1:
+            return values[0]
+        return values
 
-        return UpdateMask(fields=fields)
+    def set(self, field: UpdateMaskField, *values: typing.Any):
+        offset, words, fmt, position = field
+        fields = self.fields
+        data = bytearray(struct.pack(f"<{words}I", *[fields.get(key, 0) for key in range(offset, offset + words)]))
+
+        struct.pack_into(fmt, data, position, *values)
+        fields.update(zip(range(offset, offset + words), struct.unpack(f"<{words}I", data)))
 
     def write(self, fmt, data):
-        highest_key = max(self.fields, default=0)
-        amount_of_blocks = highest_key // 32
-        if highest_key % 32 != 0:
-            amount_of_blocks += 1
+        amount_of_blocks = 0
+        if len(self.fields) != 0:
+            amount_of_blocks = max(self.fields) // 32 + 1
 
         fmt += 'B'
         data.append(amount_of_blocks)
@@ -45,26 +170,30 @@ class UpdateMask:
         fmt += f'{len(blocks)}I'
         data.extend(blocks)
 
-        for key in sorted(self.fields):
-            if isinstance(self.fields[key], float):
-                fmt += 'f'
-            else:
-                fmt += 'I'
-            data.append(self.fields[key])
+        keys = sorted(self.fields)
+        values = [self.fields[key] for key in keys]
+        try:
+            body = struct.pack(f"<{len(values)}I", *values)
+        except struct.error:
+            # Floats assigned directly to fields instead of through set, which fields are floats depends on the object type
+            object_type = self.fields.get(UpdateMaskValue.OBJECT_TYPE, self._object_type)
+            if not object_type:
+                raise Exception("UpdateMask with float values needs OBJECT_TYPE to find the float fields, use set instead")
+
+            float_words = _update_mask_float_words[object_type.bit_length() - 1]
+            body = struct.pack("<" + "".join("f" if key in float_words else "I" for key in keys), *values)
+
+        fmt += f'{len(body)}s'
+        data.append(body)
 
         return fmt, data
 
     def size(self):
-        highest_key = max(self.fields, default=0)
-        amount_of_blocks = highest_key // 32
-
-        extra = highest_key % 32
-        if extra != 0:
-            extra = 1
-        else:
-            extra = 0
+        amount_of_blocks = 0
+        if len(self.fields) != 0:
+            amount_of_blocks = max(self.fields) // 32 + 1
 
-        return 1 + (extra + amount_of_blocks + len(self.fields)) * 4
+        return 1 + (amount_of_blocks + len(self.fields)) * 4
 """)
 
     s.double_newline()
@@ -99,3 +228,151 @@ class UpdateMask:
 
     s.close()
     s.double_newline()
+
+    s.open("class UpdateMaskFields:")
+
+    for value in update_mask:
+        name = f"{value.object_type.name}_{value.name}"
+        match value.data_type:
+            case model.UpdateMaskDataTypeGUIDArrayUsingEnum(content=content):
+                for enumerator in content.definer.enumerators:
+                    s.wln(f'{name}_{enumerator.name} = UpdateMaskField({value.offset + int(enumerator.value.value) * 2}, 2, "<Q")')
+            case model.UpdateMaskDataTypeArrayOfStruct(content=content):
+                amount_of_items = value.size // content.size
+                mask = content.update_mask_struct
+                for i in range(0, amount_of_items):
+                    for word_index, word in enumerate(mask.members):
+                        position = 0
+                        for member_index, member in enumerate(word):
+                            val = value.offset + i * content.size + word_index
+                            extra = member.member.name.upper()
+                            fmt = update_mask_struct_member_format(member)
+
+                            if member.size == 4 or member.size == 8:
+                                s.wln(f'{name}_{i}_{extra} = UpdateMaskField({val}, {member.size // 4}, "<{fmt}")')
+                            elif member.size < 4:
+                                s.wln(f'{name}_{i}_{extra}_{member_index} = UpdateMaskField({val}, 1, "<{fmt}", {position})')
+                            else:
+                                s.wln(f'{name}_{i}_{extra}_{member_index} = UpdateMaskField({val}, {member.size // 4}, "<{fmt}")')
+
+                            position += member.size
+
+            case _:
+                s.wln(f'{name} = UpdateMaskField({value.offset}, {value.size}, "{update_mask_field_format(value)}")')
+
+    s.close()
+    s.double_newline()
+
+    lengths = ", ".join(str(length) for length in update_mask_lengths(update_mask))
+    s.wln(f"_update_mask_lengths = ({lengths})")
+    s.open("_update_mask_float_words = (")
+    for words in update_mask_float_words(update_mask):
+        s.wln(f"frozenset({{{', '.join(str(word) for word in words)}}}),")
+    s.close(")")
+    s.double_newline()
+
+    s.write_block("""
+class UpdateMaskArray:
+    __slots__ = ("values", "dirty")
+
+    def __init__(self, length: int):
+        self.values = array.array("I", bytes(length * 4))
+        self.dirty = array.array("I", bytes((length + 31) // 32 * 4))
+
+    @staticmethod
+    def from_object_type(object_type: ObjectType) -> UpdateMaskArray:
+        return UpdateMaskArray(_update_mask_lengths[object_type.value])
+
+    @staticmethod
+    def from_update_mask(mask: UpdateMask, length: typing.Optional[int] = None) -> UpdateMaskArray:
+        if length is None:
+            length = max(mask.fields, default=-1) + 1
+
+        update_mask = UpdateMaskArray(length)
+        for key, value in mask.fields.items():
+            if isinstance(value, float):
+                update_mask.set_float(key, value)
+            else:
+                update_mask.set_int(key, value)
+
+        return update_mask
+
+    def to_update_mask(self) -> UpdateMask:
+        values = self.values
+        return UpdateMask(fields={key: values[key] for key in UpdateMask._keys(self.dirty)})
+
+    def get(self, field: UpdateMaskField) -> typing.Any:
+        offset, words, fmt, position = field
+        values = struct.unpack_from(fmt, self.values[offset:offset + words].tobytes(), position)
+        if len(values) == 1:
+            return values[0]
+        return values
+
+    def set(self, field: UpdateMaskField, *values: typing.Any):
+        offset, words, fmt, position = field
+        data = bytearray(self.values[offset:offset + words].tobytes())
+        struct.pack_into(fmt, data, position, *values)
+
+        self.values[offset:offset + words] = array.array("I", data)
+        for key in range(offset, offset + words):
+            self.dirty[key >> 5] |= 1 << (key & 31)
+
+    def get_int(self, key: UpdateMaskValue) -> int:
+        return self.values[key]
+
+    def set_int(self, key: UpdateMaskValue, value: int):
+        self.values[key] = value
+        self.dirty[key >> 5] |= 1 << (key & 31)
+
+    def get_float(self, key: UpdateMaskValue) -> float:
+        return struct.unpack("<f", struct.pack("<I", self.values[key]))[0]
+
+    def set_float(self, key: UpdateMaskValue, value: float):
+        self.set_int(key, struct.unpack("<I", struct.pack("<f", value))[0])
+
+    def get_guid(self, key: UpdateMaskValue) -> int:
+        return self.values[key] | self.values[key + 1] << 32
+
+    def set_guid(self, key: UpdateMaskValue, value: int):
+        self.set_int(key, value & 0xFFFFFFFF)
+        self.set_int(key + 1, value >> 32)
+
+    def mark_nonzero(self):
+        for key, value in enumerate(self.values):
+            if value != 0:
+                self.dirty[key >> 5] |= 1 << (key & 31)
+
+    def clear_dirty(self):
+        self.dirty = array.array("I", bytes(len(self.dirty) * 4))
+
+    def _amount_of_blocks(self) -> int:
+        amount_of_blocks = len(self.dirty)
+        while amount_of_blocks != 0 and self.dirty[amount_of_blocks - 1] == 0:
+            amount_of_blocks -= 1
+
+        return amount_of_blocks
+
+    def write(self, fmt, data):
+        amount_of_blocks = self._amount_of_blocks()
+        blocks = self.dirty[:amount_of_blocks]
+        values = self.values
+        keys = UpdateMask._keys(blocks)
+
+        fmt += f'B{amount_of_blocks}I{len(keys)}I'
+        data.append(amount_of_blocks)
+        data.extend(blocks)
+        if len(keys) == 1:
+            data.append(values[keys[0]])
+        elif len(keys) != 0:
+            data.extend(operator.itemgetter(*keys)(values))
+
+        return fmt, data
+
+    def size(self):
+        amount_of_blocks = self._amount_of_blocks()
+        amount_of_fields = sum(bin(block).count("1") for block in self.dirty[:amount_of_blocks])
+
+        return 1 + (amount_of_blocks + amount_of_fields) * 4
+""")
+
+    s.double_newline()
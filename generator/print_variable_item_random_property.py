@@ -3,7 +3,7 @@ from writer import Writer
 
 def print_variable_item_random_property(s: Writer):
     s.write_block("""
-@dataclasses.dataclass
+@slots_dataclass
 class VariableItemRandomProperty:
     first: int
     second: typing.Optional[int]
@@ -18,6 +18,16 @@ class VariableItemRandomProperty:
 
         return VariableItemRandomProperty(first=first, second=second)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[VariableItemRandomProperty, int]:
+        first, _offset = read_int_buffer(buf, _offset, 4)
+        
+        second = None
+        if first != 0:
+            second, _offset = read_int_buffer(buf, _offset, 4)
+
+        return VariableItemRandomProperty(first=first, second=second), _offset
+
     def write(self, fmt, data):
         fmt += 'I'
         data.append(first)
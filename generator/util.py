@@ -175,6 +175,40 @@ class NullHeaderCrypto:
     s.double_newline()
 
 
+def container_has_compression(container: model.Container) -> bool:
+    if container.tags.compressed:
+        return True
+
+    def inner_if(statement: model.IfStatement) -> bool:
+        for m in statement.members:
+            if inner(m):
+                return True
+
+        for elseif in statement.else_if_statements:
+            if inner_if(elseif):
+                return True
+
+        return False
+
+    def inner(m: model.StructMember) -> bool:
+        match m:
+            case model.StructMemberDefinition(struct_member_content=d):
+                match d.data_type:
+                    case model.DataTypeArray(compressed=compressed):
+                        return compressed
+
+            case model.StructMemberIfStatement(struct_member_content=statement):
+                return inner_if(statement)
+
+        return False
+
+    for m in container.members:
+        if inner(m):
+            return True
+
+    return False
+
+
 def container_needs_size_in_read(container: model.Container) -> bool:
     def inner_if(statement: model.IfStatement) -> bool:
         for m in statement.members:
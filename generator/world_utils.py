@@ -1,5 +1,6 @@
 import model
-from util import should_print_container, world_version_to_title_name
+from util import should_print_container, world_version_to_title_name, container_has_compression, \
+    world_version_is_wrath
 from writer import Writer
 
 
@@ -90,15 +91,27 @@ def read_functions(
         s: Writer, v: model.WorldVersion, side: str, opcode: str, size_field_size: int
 ):
     s.wln(
-        f"async def read_{side}_opcodes_unencrypted(reader: asyncio.StreamReader) -> {opcode}:"
+        f"async def read_{side}_opcodes_unencrypted("
     )
     s.inc_indent()
+    s.wln("reader: asyncio.StreamReader,")
+    s.wln("lazy: bool = False,")
+    s.wln("opcodes: typing.Optional[typing.Collection[int]] = None,")
+    s.wln("raw_unknown_opcodes: bool = False,")
+    s.dec_indent()
+    s.wln(f") -> typing.Union[{opcode}, LazyMessage, RawPacket]:")
+    s.inc_indent()
 
     s.wln("opcode_size = 2")
     s.wln(f"size_field_size = {size_field_size}")
     s.newline()
 
     s.wln('size = int.from_bytes(await reader.readexactly(opcode_size), "big")')
+    if side == "server" and world_version_is_wrath(v):
+        s.open("if size & 0x8000:")
+        s.wln("# Large header, the size is 3 bytes with the high bit set")
+        s.wln("size = (size & 0x7FFF) << 8 | (await reader.readexactly(1))[0]")
+        s.close()
     s.wln(
         'opcode = int.from_bytes(await reader.readexactly(size_field_size), "little")'
     )
@@ -106,13 +119,30 @@ def read_functions(
 
     s.wln("body_size = size - size_field_size")
     s.wln("body = await reader.readexactly(body_size)")
-    s.wln("body_reader = asyncio.StreamReader()")
-    s.wln("body_reader.feed_data(body)")
-    s.wln("body_reader.feed_eof()")
+    s.newline()
+
+    s.open("if opcodes is not None and opcode not in opcodes:")
+    s.wln("return RawPacket(opcode, body)")
+    s.close()
+    s.newline()
+
+    s.open(f"if raw_unknown_opcodes and opcode not in {side}_opcodes:")
+    s.wln("return RawPacket(opcode, body)")
+    s.close()
+    s.newline()
+
+    s.open("if lazy:")
+    s.wln(f"return LazyMessage({side}_opcodes[opcode], opcode, body)")
+    s.close()
+    s.newline()
+
+    s.open(f"if {side}_opcodes.get(opcode) in compressed_messages:")
+    s.wln(f"return await run_compression(read_{side}_opcode_body_buffer, body_size, body, opcode, body_size)")
+    s.close()
     s.newline()
 
     s.wln(
-        f"return await read_{side}_opcode_body(body_reader, opcode, body_size)"
+        f"return read_{side}_opcode_body_buffer(body, opcode, body_size)"
     )
     s.dec_indent()  # async def read_
 
@@ -126,9 +156,12 @@ def read_functions(
     s.wln(
         f"header_crypto: wow_srp.{world_version_to_title_name(v)}HeaderCrypto,"
     )
+    s.wln("lazy: bool = False,")
+    s.wln("opcodes: typing.Optional[typing.Collection[int]] = None,")
+    s.wln("raw_unknown_opcodes: bool = False,")
     s.dec_indent()
 
-    s.wln(f") -> {opcode}:")
+    s.wln(f") -> typing.Union[{opcode}, LazyMessage, RawPacket]:")
     s.inc_indent()
 
     s.wln(f"size_field_size = {size_field_size}")
@@ -139,18 +172,43 @@ def read_functions(
     s.wln("data = await reader.readexactly(header_size)")
     s.newline()
 
-    s.wln("size, opcode = header_crypto.decrypt_client_header(data)")
+    if side == "server" and world_version_is_wrath(v):
+        s.wln("# The 5th byte is only part of large headers, so a placeholder is decrypted in its place.")
+        s.wln("# The header cipher is a plain stream cipher, which means the real byte can be applied afterwards.")
+        s.wln('size, opcode = header_crypto.decrypt_server_header(data + b"\\x00")')
+        s.open("if size > 0x7FFF:")
+        s.wln("opcode ^= (await reader.readexactly(1))[0] << 8")
+        s.close()
+    else:
+        s.wln(f"size, opcode = header_crypto.decrypt_{side}_header(data)")
     s.newline()
 
     s.wln("body_size = size - size_field_size")
     s.wln("body = await reader.readexactly(body_size)")
-    s.wln("body_reader = asyncio.StreamReader()")
-    s.wln("body_reader.feed_data(body)")
-    s.wln("body_reader.feed_eof()")
+    s.newline()
+
+    s.open("if opcodes is not None and opcode not in opcodes:")
+    s.wln("return RawPacket(opcode, body)")
+    s.close()
+    s.newline()
+
+    s.open(f"if raw_unknown_opcodes and opcode not in {side}_opcodes:")
+    s.wln("return RawPacket(opcode, body)")
+    s.close()
+    s.newline()
+
+    s.open("if lazy:")
+    s.wln(f"return LazyMessage({side}_opcodes[opcode], opcode, body)")
+    s.close()
+    s.newline()
+
+    s.open(f"if {side}_opcodes.get(opcode) in compressed_messages:")
+    s.wln(f"return await run_compression(read_{side}_opcode_body_buffer, body_size, body, opcode, body_size)")
+    s.close()
     s.newline()
 
     s.wln(
-        f"return await read_{side}_opcode_body(body_reader, opcode, body_size)"
+        f"return read_{side}_opcode_body_buffer(body, opcode, body_size)"
     )
     s.dec_indent()  # ) -> opcode
 
@@ -162,6 +220,12 @@ def print_reads(s: Writer, v: model.WorldVersion):
     read_functions(s, v, "client", "ClientOpcode", 4)
     read_functions(s, v, "server", "ServerOpcode", 2)
 
+    if world_version_is_wrath(v):
+        s.open("class WorldFrameDecoder(_WorldFrameDecoder):")
+        s.wln("LARGE_SERVER_HEADER = True")
+        s.close()
+        s.double_newline()
+
 
 def print_read_body(s: Writer, messages: list[model.Container], v: model.WorldVersion):
     s.open("client_opcodes: dict[int, ClientOpcode] = {")
@@ -185,11 +249,17 @@ def print_read_body(s: Writer, messages: list[model.Container], v: model.WorldVe
     s.wln("reader: asyncio.StreamReader,")
     s.wln("opcode: int,")
     s.wln("body_size: int,")
+    s.wln("raw_unknown_opcodes: bool = False,")
     s.dec_indent()
 
-    s.wln(") -> ClientOpcode:")
+    s.wln(") -> typing.Union[ClientOpcode, RawPacket]:")
     s.inc_indent()
 
+    s.open("if raw_unknown_opcodes and opcode not in client_opcodes:")
+    s.wln("return RawPacket(opcode, await reader.readexactly(body_size))")
+    s.close()
+    s.newline()
+
     s.wln("return await client_opcodes[opcode].read(reader, body_size)")
 
     s.dec_indent()  # ) -> ClientOpcode
@@ -197,6 +267,24 @@ def print_read_body(s: Writer, messages: list[model.Container], v: model.WorldVe
     s.newline()
     s.newline()
 
+    s.wln("def read_client_opcode_body_buffer(")
+    s.inc_indent()
+
+    s.wln("buf: bytes,")
+    s.wln("opcode: int,")
+    s.wln("body_size: int,")
+    s.dec_indent()
+
+    s.wln(") -> ClientOpcode:")
+    s.inc_indent()
+
+    s.wln("return client_opcodes[opcode].from_buffer(buf, 0, body_size)[0]")
+
+    s.dec_indent()  # ) -> ClientOpcode
+
+    s.newline()
+    s.newline()
+
     s.open("server_opcodes: dict[int, ServerOpcode] = {")
     for e in messages:
         if not should_print_container(e, v):
@@ -218,18 +306,130 @@ def print_read_body(s: Writer, messages: list[model.Container], v: model.WorldVe
     s.wln("reader: asyncio.StreamReader,")
     s.wln("opcode: int,")
     s.wln("body_size: int,")
+    s.wln("raw_unknown_opcodes: bool = False,")
     s.dec_indent()
 
-    s.wln(") -> ServerOpcode:")
+    s.wln(") -> typing.Union[ServerOpcode, RawPacket]:")
     s.inc_indent()
 
+    s.open("if raw_unknown_opcodes and opcode not in server_opcodes:")
+    s.wln("return RawPacket(opcode, await reader.readexactly(body_size))")
+    s.close()
+    s.newline()
+
     s.wln("return await server_opcodes[opcode].read(reader, body_size)")
 
+    s.dec_indent()  # ) -> ServerOpcode
+
+    s.newline()
+    s.newline()
+
+    s.wln("def read_server_opcode_body_buffer(")
+    s.inc_indent()
+
+    s.wln("buf: bytes,")
+    s.wln("opcode: int,")
+    s.wln("body_size: int,")
+    s.dec_indent()
+
+    s.wln(") -> ServerOpcode:")
+    s.inc_indent()
+
+    s.wln("return server_opcodes[opcode].from_buffer(buf, 0, body_size)[0]")
+
+    s.dec_indent()
+
+    s.newline()
+    s.newline()
+
+    s.open("compressed_messages: set[type] = {")
+    for e in messages:
+        if not should_print_container(e, v):
+            continue
+
+        if container_has_compression(e):
+            s.wln(f"{e.name},")
+
+    s.dec_indent()
+    s.wln("}")
+    s.double_newline()
+
+
+def print_update_object_deltas(s: Writer, v: model.WorldVersion):
+    if world_version_is_wrath(v):
+        header_size = 4
+        message = "SMSG_UPDATE_OBJECT(objects=batch)"
+    else:
+        header_size = 5
+        message = "SMSG_UPDATE_OBJECT(has_transport=0, objects=batch)"
+
+    s.wln("def split_update_object(")
+    s.inc_indent()
+    s.wln("objects: typing.Iterable[Object],")
+    s.wln("max_size: int = 0xFFFF - 2,")
+    s.wln("compression_threshold: int = 100,")
     s.dec_indent()
+    s.wln(") -> typing.List[EncodedMessage]:")
+    s.inc_indent()
+
+    s.wln("batches = [[]]")
+    s.wln(f"size = {header_size}")
+    s.newline()
+
+    s.open("for o in objects:")
+    s.wln("object_size = o.size()")
+    s.open("if len(batches[-1]) != 0 and size + object_size > max_size:")
+    s.wln("batches.append([])")
+    s.wln(f"size = {header_size}")
+    s.close()
+    s.newline()
+
+    s.wln("batches[-1].append(o)")
+    s.wln("size += object_size")
+    s.close()
+    s.newline()
 
+    s.wln("messages = []")
+    s.open("for batch in batches:")
+    s.open("if len(batch) == 0:")
+    s.wln("continue")
+    s.close()
     s.newline()
+
+    s.wln(f"encoded = encode_update_object({message}, compression_threshold)")
+    s.open("if len(encoded.body) > max_size:")
+    s.wln('raise Exception(f"update object of {len(encoded.body)} bytes does not fit in {max_size} bytes")')
+    s.close()
+    s.wln("messages.append(encoded)")
+    s.close()
     s.newline()
 
+    s.wln("return messages")
+    s.dec_indent()
+    s.double_newline()
+
+    s.wln("def update_object_deltas(")
+    s.inc_indent()
+    s.wln("states: typing.Iterable[typing.Tuple[int, UpdateMask, UpdateMask]],")
+    s.wln("budget: int = 0xFFFF - 2,")
+    s.wln("compression_threshold: int = 100,")
+    s.dec_indent()
+    s.wln(") -> typing.List[EncodedMessage]:")
+    s.inc_indent()
+
+    s.wln("objects = []")
+    s.open("for guid, previous, current in states:")
+    s.wln("mask = current.delta(previous)")
+    s.open("if len(mask.fields) != 0:")
+    s.wln("objects.append(Object(update_type=UpdateType.VALUES, guid1=guid, mask1=mask))")
+    s.close()
+    s.close()
+    s.newline()
+
+    s.wln("return split_update_object(objects, budget, compression_threshold)")
+    s.dec_indent()
+    s.double_newline()
+
 
 def print_world_utils(
         s: Writer, messages: list[model.Container], v: model.WorldVersion
@@ -241,3 +441,5 @@ def print_world_utils(
     print_reads(s, v)
 
     print_expects(s, v)
+
+    print_update_object_deltas(s, v)
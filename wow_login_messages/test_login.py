@@ -21,9 +21,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server0(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_CHALLENGE_Server1(unittest.IsolatedAsyncioTestCase):
@@ -38,9 +44,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server1(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version3.expect_server_opcode(reader, wow_login_messages.version3.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version3.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version3.LoginFrameDecoder(wow_login_messages.version3.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -53,9 +65,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server1(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version3.expect_server_opcode(reader, wow_login_messages.version3.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version3.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version3.LoginFrameDecoder(wow_login_messages.version3.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_CHALLENGE_Server2(unittest.IsolatedAsyncioTestCase):
@@ -70,9 +88,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server2(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version5.expect_server_opcode(reader, wow_login_messages.version5.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version5.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version5.LoginFrameDecoder(wow_login_messages.version5.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_CHALLENGE_Server3(unittest.IsolatedAsyncioTestCase):
@@ -87,9 +111,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server3(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -102,9 +132,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server3(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test2(self):
         reader = asyncio.StreamReader()
@@ -117,9 +153,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server3(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test3(self):
         reader = asyncio.StreamReader()
@@ -132,9 +174,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server3(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test4(self):
         reader = asyncio.StreamReader()
@@ -147,9 +195,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server3(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test5(self):
         reader = asyncio.StreamReader()
@@ -162,9 +216,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server3(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test6(self):
         reader = asyncio.StreamReader()
@@ -177,9 +237,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server3(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_CHALLENGE_Client4(unittest.IsolatedAsyncioTestCase):
@@ -194,10 +260,16 @@ class CMD_AUTH_LOGON_CHALLENGE_Client4(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.all.expect_client_opcode(reader, wow_login_messages.all.CMD_AUTH_LOGON_CHALLENGE_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.all.CMD_AUTH_LOGON_CHALLENGE_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.all.LoginFrameDecoder(wow_login_messages.all.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_PROOF_Client5(unittest.IsolatedAsyncioTestCase):
@@ -212,9 +284,15 @@ class CMD_AUTH_LOGON_PROOF_Client5(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_client_opcode(reader, wow_login_messages.version2.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -227,9 +305,15 @@ class CMD_AUTH_LOGON_PROOF_Client5(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_client_opcode(reader, wow_login_messages.version2.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test2(self):
         reader = asyncio.StreamReader()
@@ -242,9 +326,15 @@ class CMD_AUTH_LOGON_PROOF_Client5(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_client_opcode(reader, wow_login_messages.version2.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_PROOF_Server6(unittest.IsolatedAsyncioTestCase):
@@ -259,9 +349,15 @@ class CMD_AUTH_LOGON_PROOF_Server6(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_AUTH_LOGON_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_LOGON_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_PROOF_Client7(unittest.IsolatedAsyncioTestCase):
@@ -276,9 +372,15 @@ class CMD_AUTH_LOGON_PROOF_Client7(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version3.expect_client_opcode(reader, wow_login_messages.version3.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version3.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version3.LoginFrameDecoder(wow_login_messages.version3.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -291,9 +393,15 @@ class CMD_AUTH_LOGON_PROOF_Client7(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version3.expect_client_opcode(reader, wow_login_messages.version3.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version3.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version3.LoginFrameDecoder(wow_login_messages.version3.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test2(self):
         reader = asyncio.StreamReader()
@@ -306,9 +414,15 @@ class CMD_AUTH_LOGON_PROOF_Client7(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version3.expect_client_opcode(reader, wow_login_messages.version3.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version3.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version3.LoginFrameDecoder(wow_login_messages.version3.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test3(self):
         reader = asyncio.StreamReader()
@@ -321,9 +435,15 @@ class CMD_AUTH_LOGON_PROOF_Client7(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version3.expect_client_opcode(reader, wow_login_messages.version3.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version3.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version3.LoginFrameDecoder(wow_login_messages.version3.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_PROOF_Client8(unittest.IsolatedAsyncioTestCase):
@@ -338,9 +458,15 @@ class CMD_AUTH_LOGON_PROOF_Client8(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version5.expect_client_opcode(reader, wow_login_messages.version5.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version5.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version5.LoginFrameDecoder(wow_login_messages.version5.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_PROOF_Server9(unittest.IsolatedAsyncioTestCase):
@@ -355,9 +481,15 @@ class CMD_AUTH_LOGON_PROOF_Server9(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version5.expect_server_opcode(reader, wow_login_messages.version5.CMD_AUTH_LOGON_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version5.CMD_AUTH_LOGON_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version5.LoginFrameDecoder(wow_login_messages.version5.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_PROOF_Client10(unittest.IsolatedAsyncioTestCase):
@@ -372,9 +504,15 @@ class CMD_AUTH_LOGON_PROOF_Client10(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_client_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -387,9 +525,15 @@ class CMD_AUTH_LOGON_PROOF_Client10(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_client_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test2(self):
         reader = asyncio.StreamReader()
@@ -402,9 +546,15 @@ class CMD_AUTH_LOGON_PROOF_Client10(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_client_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test3(self):
         reader = asyncio.StreamReader()
@@ -417,9 +567,15 @@ class CMD_AUTH_LOGON_PROOF_Client10(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_client_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_LOGON_PROOF_Server11(unittest.IsolatedAsyncioTestCase):
@@ -434,9 +590,15 @@ class CMD_AUTH_LOGON_PROOF_Server11(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -449,9 +611,15 @@ class CMD_AUTH_LOGON_PROOF_Server11(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_LOGON_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_RECONNECT_CHALLENGE_Server12(unittest.IsolatedAsyncioTestCase):
@@ -466,9 +634,15 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Server12(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_AUTH_RECONNECT_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_RECONNECT_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -481,9 +655,15 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Server12(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_AUTH_RECONNECT_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_RECONNECT_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_RECONNECT_CHALLENGE_Server13(unittest.IsolatedAsyncioTestCase):
@@ -498,9 +678,15 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Server13(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_RECONNECT_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_RECONNECT_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -513,9 +699,15 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Server13(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_RECONNECT_CHALLENGE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_RECONNECT_CHALLENGE_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_RECONNECT_CHALLENGE_Client14(unittest.IsolatedAsyncioTestCase):
@@ -530,10 +722,16 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Client14(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.all.expect_client_opcode(reader, wow_login_messages.all.CMD_AUTH_RECONNECT_CHALLENGE_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.all.CMD_AUTH_RECONNECT_CHALLENGE_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.all.LoginFrameDecoder(wow_login_messages.all.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -546,10 +744,16 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Client14(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.all.expect_client_opcode(reader, wow_login_messages.all.CMD_AUTH_RECONNECT_CHALLENGE_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.all.CMD_AUTH_RECONNECT_CHALLENGE_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.all.LoginFrameDecoder(wow_login_messages.all.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_RECONNECT_PROOF_Server15(unittest.IsolatedAsyncioTestCase):
@@ -564,9 +768,15 @@ class CMD_AUTH_RECONNECT_PROOF_Server15(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_AUTH_RECONNECT_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_RECONNECT_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -579,9 +789,15 @@ class CMD_AUTH_RECONNECT_PROOF_Server15(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_AUTH_RECONNECT_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_RECONNECT_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test2(self):
         reader = asyncio.StreamReader()
@@ -594,9 +810,15 @@ class CMD_AUTH_RECONNECT_PROOF_Server15(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_AUTH_RECONNECT_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_RECONNECT_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_RECONNECT_PROOF_Client16(unittest.IsolatedAsyncioTestCase):
@@ -611,9 +833,15 @@ class CMD_AUTH_RECONNECT_PROOF_Client16(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_client_opcode(reader, wow_login_messages.version2.CMD_AUTH_RECONNECT_PROOF_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_AUTH_RECONNECT_PROOF_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_RECONNECT_PROOF_Server17(unittest.IsolatedAsyncioTestCase):
@@ -628,9 +856,15 @@ class CMD_AUTH_RECONNECT_PROOF_Server17(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version5.expect_server_opcode(reader, wow_login_messages.version5.CMD_AUTH_RECONNECT_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version5.CMD_AUTH_RECONNECT_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version5.LoginFrameDecoder(wow_login_messages.version5.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_AUTH_RECONNECT_PROOF_Server18(unittest.IsolatedAsyncioTestCase):
@@ -645,9 +879,15 @@ class CMD_AUTH_RECONNECT_PROOF_Server18(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_RECONNECT_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_RECONNECT_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -660,9 +900,15 @@ class CMD_AUTH_RECONNECT_PROOF_Server18(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_AUTH_RECONNECT_PROOF_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_AUTH_RECONNECT_PROOF_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_SURVEY_RESULT19(unittest.IsolatedAsyncioTestCase):
@@ -677,9 +923,15 @@ class CMD_SURVEY_RESULT19(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version3.expect_client_opcode(reader, wow_login_messages.version3.CMD_SURVEY_RESULT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version3.CMD_SURVEY_RESULT.from_buffer(data, 1))
+        decoder = wow_login_messages.version3.LoginFrameDecoder(wow_login_messages.version3.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_REALM_LIST_Server20(unittest.IsolatedAsyncioTestCase):
@@ -694,10 +946,16 @@ class CMD_REALM_LIST_Server20(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_REALM_LIST_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_REALM_LIST_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 3, r.size())
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -710,10 +968,16 @@ class CMD_REALM_LIST_Server20(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_REALM_LIST_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_REALM_LIST_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 3, r.size())
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_REALM_LIST_Client21(unittest.IsolatedAsyncioTestCase):
@@ -728,9 +992,15 @@ class CMD_REALM_LIST_Client21(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_client_opcode(reader, wow_login_messages.version2.CMD_REALM_LIST_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_REALM_LIST_Client.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_REALM_LIST_Server22(unittest.IsolatedAsyncioTestCase):
@@ -745,10 +1015,16 @@ class CMD_REALM_LIST_Server22(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version5.expect_server_opcode(reader, wow_login_messages.version5.CMD_REALM_LIST_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version5.CMD_REALM_LIST_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version5.LoginFrameDecoder(wow_login_messages.version5.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 3, r.size())
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_REALM_LIST_Server23(unittest.IsolatedAsyncioTestCase):
@@ -763,10 +1039,16 @@ class CMD_REALM_LIST_Server23(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version6.expect_server_opcode(reader, wow_login_messages.version6.CMD_REALM_LIST_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version6.CMD_REALM_LIST_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version6.LoginFrameDecoder(wow_login_messages.version6.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 3, r.size())
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_REALM_LIST_Server24(unittest.IsolatedAsyncioTestCase):
@@ -781,10 +1063,16 @@ class CMD_REALM_LIST_Server24(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_REALM_LIST_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_REALM_LIST_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 3, r.size())
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -797,10 +1085,16 @@ class CMD_REALM_LIST_Server24(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version8.expect_server_opcode(reader, wow_login_messages.version8.CMD_REALM_LIST_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version8.CMD_REALM_LIST_Server.from_buffer(data, 1))
+        decoder = wow_login_messages.version8.LoginFrameDecoder(wow_login_messages.version8.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 3, r.size())
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_XFER_INITIATE25(unittest.IsolatedAsyncioTestCase):
@@ -815,9 +1109,15 @@ class CMD_XFER_INITIATE25(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_XFER_INITIATE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_XFER_INITIATE.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_XFER_DATA26(unittest.IsolatedAsyncioTestCase):
@@ -832,9 +1132,15 @@ class CMD_XFER_DATA26(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_server_opcode(reader, wow_login_messages.version2.CMD_XFER_DATA)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_XFER_DATA.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.server_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_XFER_ACCEPT27(unittest.IsolatedAsyncioTestCase):
@@ -849,9 +1155,15 @@ class CMD_XFER_ACCEPT27(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_client_opcode(reader, wow_login_messages.version2.CMD_XFER_ACCEPT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_XFER_ACCEPT.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_XFER_RESUME28(unittest.IsolatedAsyncioTestCase):
@@ -866,9 +1178,15 @@ class CMD_XFER_RESUME28(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_client_opcode(reader, wow_login_messages.version2.CMD_XFER_RESUME)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_XFER_RESUME.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
 class CMD_XFER_CANCEL29(unittest.IsolatedAsyncioTestCase):
@@ -883,8 +1201,14 @@ class CMD_XFER_CANCEL29(unittest.IsolatedAsyncioTestCase):
         r = await wow_login_messages.version2.expect_client_opcode(reader, wow_login_messages.version2.CMD_XFER_CANCEL)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual((r, len(data)), wow_login_messages.version2.CMD_XFER_CANCEL.from_buffer(data, 1))
+        decoder = wow_login_messages.version2.LoginFrameDecoder(wow_login_messages.version2.client_opcodes)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_into(written, 3))
+        self.assertEqual(data, written[3:])
 
 
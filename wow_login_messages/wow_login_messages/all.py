@@ -5,11 +5,19 @@ import enum
 import struct
 import typing
 
+from .util import LoginFrameDecoder
 from .util import read_string
+from .util import read_string_buffer
+from .util import slots_dataclass
 from .util import read_bool
 from .util import read_int
 from .util import read_cstring
 from .util import read_float
+from .util import read_bool_buffer
+from .util import read_int_buffer
+from .util import read_cstring_buffer
+from .util import read_float_buffer
+from .util import read_bytes_buffer
 
 
 
@@ -59,7 +67,10 @@ class ProtocolVersion(enum.Enum):
     EIGHT = 8
 
 
-@dataclasses.dataclass
+_Version_0 = struct.Struct("<BBBH")
+
+
+@slots_dataclass
 class Version:
     major: int
     minor: int
@@ -69,16 +80,10 @@ class Version:
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> Version:
         # major: u8
-        major = await read_int(reader, 1)
-
         # minor: u8
-        minor = await read_int(reader, 1)
-
         # patch: u8
-        patch = await read_int(reader, 1)
-
         # build: u16
-        build = await read_int(reader, 2)
+        major, minor, patch, build = _Version_0.unpack(await reader.readexactly(5))
 
         return Version(
             major=major,
@@ -87,13 +92,33 @@ class Version:
             build=build,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[Version, int]:
+        # major: u8
+        # minor: u8
+        # patch: u8
+        # build: u16
+        major, minor, patch, build = _Version_0.unpack_from(buf, _offset)
+        _offset += 5
+
+        return Version(
+            major=major,
+            minor=minor,
+            patch=patch,
+            build=build,
+        ), _offset
+
     def write(self, _fmt, _data):
         _fmt += 'BBBH'
         _data.extend([self.major, self.minor, self.patch, self.build])
         return _fmt, _data
 
 
-@dataclasses.dataclass
+_CMD_AUTH_LOGON_CHALLENGE_Client_0 = struct.Struct("<BHI")
+_CMD_AUTH_LOGON_CHALLENGE_Client_1 = struct.Struct("<IIIII")
+
+
+@slots_dataclass
 class CMD_AUTH_LOGON_CHALLENGE_Client:
     protocol_version: ProtocolVersion
     version: Version
@@ -107,31 +132,23 @@ class CMD_AUTH_LOGON_CHALLENGE_Client:
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_LOGON_CHALLENGE_Client:
         # protocol_version: ProtocolVersion
-        protocol_version = ProtocolVersion(await read_int(reader, 1))
-
         # size: u16
-        _size = await read_int(reader, 2)
-
         # game_name: u32
-        _game_name = await read_int(reader, 4)
+        protocol_version, _size, _game_name = _CMD_AUTH_LOGON_CHALLENGE_Client_0.unpack(await reader.readexactly(7))
+        protocol_version = ProtocolVersion(protocol_version)
 
         # version: Version
         version = await Version.read(reader)
 
         # platform: Platform
-        platform = Platform(await read_int(reader, 4))
-
         # os: Os
-        os = Os(await read_int(reader, 4))
-
         # locale: Locale
-        locale = Locale(await read_int(reader, 4))
-
         # utc_timezone_offset: i32
-        utc_timezone_offset = await read_int(reader, 4)
-
         # client_ip_address: IpAddress
-        client_ip_address = await read_int(reader, 4)
+        platform, os, locale, utc_timezone_offset, client_ip_address = _CMD_AUTH_LOGON_CHALLENGE_Client_1.unpack(await reader.readexactly(20))
+        platform = Platform(platform)
+        os = Os(os)
+        locale = Locale(locale)
 
         # account_name: String
         account_name = await read_string(reader)
@@ -147,12 +164,59 @@ class CMD_AUTH_LOGON_CHALLENGE_Client:
             account_name=account_name,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_LOGON_CHALLENGE_Client, int]:
+        # protocol_version: ProtocolVersion
+        # size: u16
+        # game_name: u32
+        protocol_version, _size, _game_name = _CMD_AUTH_LOGON_CHALLENGE_Client_0.unpack_from(buf, _offset)
+        _offset += 7
+        protocol_version = ProtocolVersion(protocol_version)
+
+        # version: Version
+        version, _offset = Version.from_buffer(buf, _offset)
+
+        # platform: Platform
+        # os: Os
+        # locale: Locale
+        # utc_timezone_offset: i32
+        # client_ip_address: IpAddress
+        platform, os, locale, utc_timezone_offset, client_ip_address = _CMD_AUTH_LOGON_CHALLENGE_Client_1.unpack_from(buf, _offset)
+        _offset += 20
+        platform = Platform(platform)
+        os = Os(os)
+        locale = Locale(locale)
+
+        # account_name: String
+        account_name, _offset = read_string_buffer(buf, _offset)
+
+        return CMD_AUTH_LOGON_CHALLENGE_Client(
+            protocol_version=protocol_version,
+            version=version,
+            platform=platform,
+            os=os,
+            locale=locale,
+            utc_timezone_offset=utc_timezone_offset,
+            client_ip_address=client_ip_address,
+            account_name=account_name,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [0]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BBHI"
+        _data = [0, self.protocol_version.value, self.size(), 5730135]
 
-        _fmt += 'BHI'
-        _data.extend([self.protocol_version.value, self.size(), 5730135])
         # version: Version
         _fmt, _data = self.version.write(_fmt, _data)
 
@@ -180,18 +244,17 @@ class CMD_AUTH_LOGON_CHALLENGE_Client:
         _fmt += f'B{len(self.account_name)}s'
         _data.extend([len(self.account_name), self.account_name.encode('utf-8')])
 
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+        return _fmt, _data
 
     def size(self) -> int:
         return 30 + len(self.account_name)
 
 
-@dataclasses.dataclass
+_CMD_AUTH_RECONNECT_CHALLENGE_Client_0 = struct.Struct("<BHI")
+_CMD_AUTH_RECONNECT_CHALLENGE_Client_1 = struct.Struct("<IIIII")
+
+
+@slots_dataclass
 class CMD_AUTH_RECONNECT_CHALLENGE_Client:
     protocol_version: ProtocolVersion
     version: Version
@@ -205,31 +268,23 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Client:
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_RECONNECT_CHALLENGE_Client:
         # protocol_version: ProtocolVersion
-        protocol_version = ProtocolVersion(await read_int(reader, 1))
-
         # size: u16
-        _size = await read_int(reader, 2)
-
         # game_name: u32
-        _game_name = await read_int(reader, 4)
+        protocol_version, _size, _game_name = _CMD_AUTH_RECONNECT_CHALLENGE_Client_0.unpack(await reader.readexactly(7))
+        protocol_version = ProtocolVersion(protocol_version)
 
         # version: Version
         version = await Version.read(reader)
 
         # platform: Platform
-        platform = Platform(await read_int(reader, 4))
-
         # os: Os
-        os = Os(await read_int(reader, 4))
-
         # locale: Locale
-        locale = Locale(await read_int(reader, 4))
-
         # utc_timezone_offset: i32
-        utc_timezone_offset = await read_int(reader, 4)
-
         # client_ip_address: IpAddress
-        client_ip_address = await read_int(reader, 4)
+        platform, os, locale, utc_timezone_offset, client_ip_address = _CMD_AUTH_RECONNECT_CHALLENGE_Client_1.unpack(await reader.readexactly(20))
+        platform = Platform(platform)
+        os = Os(os)
+        locale = Locale(locale)
 
         # account_name: String
         account_name = await read_string(reader)
@@ -245,12 +300,59 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Client:
             account_name=account_name,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_RECONNECT_CHALLENGE_Client, int]:
+        # protocol_version: ProtocolVersion
+        # size: u16
+        # game_name: u32
+        protocol_version, _size, _game_name = _CMD_AUTH_RECONNECT_CHALLENGE_Client_0.unpack_from(buf, _offset)
+        _offset += 7
+        protocol_version = ProtocolVersion(protocol_version)
+
+        # version: Version
+        version, _offset = Version.from_buffer(buf, _offset)
+
+        # platform: Platform
+        # os: Os
+        # locale: Locale
+        # utc_timezone_offset: i32
+        # client_ip_address: IpAddress
+        platform, os, locale, utc_timezone_offset, client_ip_address = _CMD_AUTH_RECONNECT_CHALLENGE_Client_1.unpack_from(buf, _offset)
+        _offset += 20
+        platform = Platform(platform)
+        os = Os(os)
+        locale = Locale(locale)
+
+        # account_name: String
+        account_name, _offset = read_string_buffer(buf, _offset)
+
+        return CMD_AUTH_RECONNECT_CHALLENGE_Client(
+            protocol_version=protocol_version,
+            version=version,
+            platform=platform,
+            os=os,
+            locale=locale,
+            utc_timezone_offset=utc_timezone_offset,
+            client_ip_address=client_ip_address,
+            account_name=account_name,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [2]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BBHI"
+        _data = [2, self.protocol_version.value, self.size(), 5730135]
 
-        _fmt += 'BHI'
-        _data.extend([self.protocol_version.value, self.size(), 5730135])
         # version: Version
         _fmt, _data = self.version.write(_fmt, _data)
 
@@ -278,12 +380,7 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Client:
         _fmt += f'B{len(self.account_name)}s'
         _data.extend([len(self.account_name), self.account_name.encode('utf-8')])
 
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+        return _fmt, _data
 
     def size(self) -> int:
         return 30 + len(self.account_name)
@@ -295,6 +392,12 @@ ClientOpcode = typing.Union[
 ]
 
 
+client_opcodes: dict[int, ClientOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Client,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Client,
+}
+
+
 async def read_client_opcode(reader: asyncio.StreamReader) -> typing.Optional[ClientOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
@@ -1,5 +1,38 @@
 import asyncio
+import dataclasses
 import struct
+import sys
+import typing
+
+
+def slots_dataclass(cls):
+    if sys.version_info >= (3, 10):
+        return dataclasses.dataclass(cls, slots=True)
+
+    cls = dataclasses.dataclass(cls)
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    # Fields that are not in __init__ read their default from the class attribute that __slots__ replaces
+    defaults = [(field.name, field.default) for field in dataclasses.fields(cls)
+                if not field.init and field.default is not dataclasses.MISSING]
+    if len(defaults) != 0:
+        init = cls_dict["__init__"]
+
+        def __init__(self, *args, **kwargs):
+            for name, default in defaults:
+                setattr(self, name, default)
+            init(self, *args, **kwargs)
+
+        cls_dict["__init__"] = __init__
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
 
 
 async def read_int(reader: asyncio.StreamReader, size: int) -> int:
@@ -27,3 +60,92 @@ async def read_sized_cstring(reader: asyncio.StreamReader) -> str:
 async def read_float(reader: asyncio.StreamReader) -> float:
     [value] = struct.unpack('f', await reader.readexactly(4))
     return value
+
+
+_integer_structs = {
+    1: struct.Struct("<B"),
+    2: struct.Struct("<H"),
+    4: struct.Struct("<I"),
+    8: struct.Struct("<Q"),
+}
+_float_struct = struct.Struct("<f")
+
+
+def read_int_buffer(buf: bytes, offset: int, size: int) -> typing.Tuple[int, int]:
+    [value] = _integer_structs[size].unpack_from(buf, offset)
+    return value, offset + size
+
+
+def read_bool_buffer(buf: bytes, offset: int, size: int) -> typing.Tuple[bool, int]:
+    value, offset = read_int_buffer(buf, offset, size)
+    return value == 1, offset
+
+
+def read_string_buffer(buf: bytes, offset: int) -> typing.Tuple[str, int]:
+    length, offset = read_int_buffer(buf, offset, 1)
+    [value] = struct.unpack_from(f"{length}s", buf, offset)
+    return value.decode("utf-8"), offset + length
+
+
+_cstring_chunk_size = 256
+
+
+def read_cstring_buffer(buf: bytes, offset: int) -> typing.Tuple[str, int]:
+    if isinstance(buf, memoryview):
+        # memoryview has no find, so the terminator is searched for in copied chunks
+        end = offset
+        while True:
+            chunk = buf[end:end + _cstring_chunk_size].tobytes()
+            index = chunk.find(0)
+            if index != -1:
+                end += index
+                break
+            if len(chunk) < _cstring_chunk_size:
+                raise IndexError("missing cstring terminator")
+            end += _cstring_chunk_size
+    else:
+        end = buf.find(0, offset)
+        if end == -1:
+            raise IndexError("missing cstring terminator")
+
+    return str(buf[offset:end], "utf-8"), end + 1
+
+
+def read_float_buffer(buf: bytes, offset: int) -> typing.Tuple[float, int]:
+    [value] = _float_struct.unpack_from(buf, offset)
+    return value, offset + 4
+
+
+def read_bytes_buffer(buf: bytes, offset: int, size: int) -> typing.Tuple[bytes, int]:
+    [value] = struct.unpack_from(f"{size}s", buf, offset)
+    return value, offset + size
+
+
+class LoginFrameDecoder:
+    def __init__(self, message_types: typing.Dict[int, typing.Any]):
+        self.message_types = message_types
+        self._buffer = b""
+
+    def feed(self, data: bytes) -> typing.List[typing.Any]:
+        buf = self._buffer + bytes(data)
+
+        messages = []
+        offset = 0
+        while offset < len(buf):
+            opcode = buf[offset]
+            if opcode not in self.message_types:
+                raise Exception(f'incorrect opcode {opcode}')
+
+            try:
+                message, end = self.message_types[opcode].from_buffer(buf, offset + 1)
+            except (struct.error, IndexError):
+                break
+
+            if end > len(buf):
+                break
+
+            messages.append(message)
+            offset = end
+
+        self._buffer = buf[offset:]
+        return messages
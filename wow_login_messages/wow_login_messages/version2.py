@@ -5,11 +5,19 @@ import enum
 import struct
 import typing
 
+from .util import LoginFrameDecoder
 from .util import read_string
+from .util import read_string_buffer
+from .util import slots_dataclass
 from .util import read_bool
 from .util import read_int
 from .util import read_cstring
 from .util import read_float
+from .util import read_bool_buffer
+from .util import read_int_buffer
+from .util import read_cstring_buffer
+from .util import read_float_buffer
+from .util import read_bytes_buffer
 
 from .all import Locale
 from .all import Os
@@ -92,7 +100,11 @@ class RealmFlag(enum.Flag):
     FORCE_RED_FULL = 128
 
 
-@dataclasses.dataclass
+_Realm_0 = struct.Struct("<IB")
+_Realm_1 = struct.Struct("<fBBB")
+
+
+@slots_dataclass
 class Realm:
     realm_type: RealmType
     flag: RealmFlag
@@ -106,10 +118,10 @@ class Realm:
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> Realm:
         # realm_type: RealmType
-        realm_type = RealmType(await read_int(reader, 4))
-
         # flag: RealmFlag
-        flag = RealmFlag(await read_int(reader, 1))
+        realm_type, flag = _Realm_0.unpack(await reader.readexactly(5))
+        realm_type = RealmType(realm_type)
+        flag = RealmFlag(flag)
 
         # name: CString
         name = await read_cstring(reader)
@@ -118,16 +130,11 @@ class Realm:
         address = await read_cstring(reader)
 
         # population: Population
-        population = await read_float(reader)
-
         # number_of_characters_on_realm: u8
-        number_of_characters_on_realm = await read_int(reader, 1)
-
         # category: RealmCategory
-        category = RealmCategory(await read_int(reader, 1))
-
         # realm_id: u8
-        realm_id = await read_int(reader, 1)
+        population, number_of_characters_on_realm, category, realm_id = _Realm_1.unpack(await reader.readexactly(7))
+        category = RealmCategory(category)
 
         return Realm(
             realm_type=realm_type,
@@ -140,6 +147,40 @@ class Realm:
             realm_id=realm_id,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[Realm, int]:
+        # realm_type: RealmType
+        # flag: RealmFlag
+        realm_type, flag = _Realm_0.unpack_from(buf, _offset)
+        _offset += 5
+        realm_type = RealmType(realm_type)
+        flag = RealmFlag(flag)
+
+        # name: CString
+        name, _offset = read_cstring_buffer(buf, _offset)
+
+        # address: CString
+        address, _offset = read_cstring_buffer(buf, _offset)
+
+        # population: Population
+        # number_of_characters_on_realm: u8
+        # category: RealmCategory
+        # realm_id: u8
+        population, number_of_characters_on_realm, category, realm_id = _Realm_1.unpack_from(buf, _offset)
+        _offset += 7
+        category = RealmCategory(category)
+
+        return Realm(
+            realm_type=realm_type,
+            flag=flag,
+            name=name,
+            address=address,
+            population=population,
+            number_of_characters_on_realm=number_of_characters_on_realm,
+            category=category,
+            realm_id=realm_id,
+        ), _offset
+
     def write(self, _fmt, _data):
         _fmt += f'IB{len(self.name)}sB{len(self.address)}sBfBBB'
         _data.extend([self.realm_type.value, self.flag.value, self.name.encode('utf-8'), 0, self.address.encode('utf-8'), 0, self.population, self.number_of_characters_on_realm, self.category.value, self.realm_id])
@@ -149,30 +190,27 @@ class Realm:
         return 14 + len(self.name) + len(self.address)
 
 
-@dataclasses.dataclass
+_TelemetryKey_0 = struct.Struct("<HI")
+
+
+@slots_dataclass
 class TelemetryKey:
     unknown1: int
     unknown2: int
-    unknown3: typing.List[int]
-    cd_key_proof: typing.List[int]
+    unknown3: bytes
+    cd_key_proof: bytes
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> TelemetryKey:
         # unknown1: u16
-        unknown1 = await read_int(reader, 2)
-
         # unknown2: u32
-        unknown2 = await read_int(reader, 4)
+        unknown1, unknown2 = _TelemetryKey_0.unpack(await reader.readexactly(6))
 
         # unknown3: u8[4]
-        unknown3 = []
-        for _ in range(0, 4):
-            unknown3.append(await read_int(reader, 1))
+        unknown3 = await reader.readexactly(4)
 
         # cd_key_proof: u8[20]
-        cd_key_proof = []
-        for _ in range(0, 20):
-            cd_key_proof.append(await read_int(reader, 1))
+        cd_key_proof = await reader.readexactly(20)
 
         return TelemetryKey(
             unknown1=unknown1,
@@ -181,20 +219,43 @@ class TelemetryKey:
             cd_key_proof=cd_key_proof,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[TelemetryKey, int]:
+        # unknown1: u16
+        # unknown2: u32
+        unknown1, unknown2 = _TelemetryKey_0.unpack_from(buf, _offset)
+        _offset += 6
+
+        # unknown3: u8[4]
+        unknown3, _offset = read_bytes_buffer(buf, _offset, 4)
+
+        # cd_key_proof: u8[20]
+        cd_key_proof, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        return TelemetryKey(
+            unknown1=unknown1,
+            unknown2=unknown2,
+            unknown3=unknown3,
+            cd_key_proof=cd_key_proof,
+        ), _offset
+
     def write(self, _fmt, _data):
-        _fmt += f'HI{len(self.unknown3)}B{len(self.cd_key_proof)}B'
-        _data.extend([self.unknown1, self.unknown2, *self.unknown3, *self.cd_key_proof])
+        _fmt += f'HI{len(self.unknown3)}s{len(self.cd_key_proof)}s'
+        _data.extend([self.unknown1, self.unknown2, bytes(self.unknown3), bytes(self.cd_key_proof)])
         return _fmt, _data
 
 
-@dataclasses.dataclass
+_CMD_AUTH_LOGON_CHALLENGE_Server_0 = struct.Struct("<BB")
+
+
+@slots_dataclass
 class CMD_AUTH_LOGON_CHALLENGE_Server:
     result: LoginResult
-    server_public_key: typing.Optional[typing.List[int]] = None
-    generator: typing.Optional[typing.List[int]] = None
-    large_safe_prime: typing.Optional[typing.List[int]] = None
-    salt: typing.Optional[typing.List[int]] = None
-    crc_salt: typing.Optional[typing.List[int]] = None
+    server_public_key: typing.Optional[bytes] = None
+    generator: typing.Optional[bytes] = None
+    large_safe_prime: typing.Optional[bytes] = None
+    salt: typing.Optional[bytes] = None
+    crc_salt: typing.Optional[bytes] = None
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_LOGON_CHALLENGE_Server:
@@ -206,42 +267,31 @@ class CMD_AUTH_LOGON_CHALLENGE_Server:
         salt = None
         crc_salt = None
         # protocol_version: u8
-        _protocol_version = await read_int(reader, 1)
-
         # result: LoginResult
-        result = LoginResult(await read_int(reader, 1))
+        _protocol_version, result = _CMD_AUTH_LOGON_CHALLENGE_Server_0.unpack(await reader.readexactly(2))
+        result = LoginResult(result)
 
         if result == LoginResult.SUCCESS:
             # server_public_key: u8[32]
-            server_public_key = []
-            for _ in range(0, 32):
-                server_public_key.append(await read_int(reader, 1))
+            server_public_key = await reader.readexactly(32)
 
             # generator_length: u8
             generator_length = await read_int(reader, 1)
 
             # generator: u8[generator_length]
-            generator = []
-            for _ in range(0, generator_length):
-                generator.append(await read_int(reader, 1))
+            generator = await reader.readexactly(generator_length)
 
             # large_safe_prime_length: u8
             large_safe_prime_length = await read_int(reader, 1)
 
             # large_safe_prime: u8[large_safe_prime_length]
-            large_safe_prime = []
-            for _ in range(0, large_safe_prime_length):
-                large_safe_prime.append(await read_int(reader, 1))
+            large_safe_prime = await reader.readexactly(large_safe_prime_length)
 
             # salt: u8[32]
-            salt = []
-            for _ in range(0, 32):
-                salt.append(await read_int(reader, 1))
+            salt = await reader.readexactly(32)
 
             # crc_salt: u8[16]
-            crc_salt = []
-            for _ in range(0, 16):
-                crc_salt.append(await read_int(reader, 1))
+            crc_salt = await reader.readexactly(16)
 
         return CMD_AUTH_LOGON_CHALLENGE_Server(
             result=result,
@@ -252,46 +302,91 @@ class CMD_AUTH_LOGON_CHALLENGE_Server:
             crc_salt=crc_salt,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [0]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_LOGON_CHALLENGE_Server, int]:
+        server_public_key = None
+        generator_length = None
+        generator = None
+        large_safe_prime_length = None
+        large_safe_prime = None
+        salt = None
+        crc_salt = None
+        # protocol_version: u8
+        # result: LoginResult
+        _protocol_version, result = _CMD_AUTH_LOGON_CHALLENGE_Server_0.unpack_from(buf, _offset)
+        _offset += 2
+        result = LoginResult(result)
 
-        _fmt += 'BB'
-        _data.extend([0, self.result.value])
-        if self.result == LoginResult.SUCCESS:
-            _fmt += f'{len(self.server_public_key)}BB{len(self.generator)}BB{len(self.large_safe_prime)}B{len(self.salt)}B{len(self.crc_salt)}B'
-            _data.extend([*self.server_public_key, len(self.generator), *self.generator, len(self.large_safe_prime), *self.large_safe_prime, *self.salt, *self.crc_salt])
-        _data = struct.pack(_fmt, *_data)
+        if result == LoginResult.SUCCESS:
+            # server_public_key: u8[32]
+            server_public_key, _offset = read_bytes_buffer(buf, _offset, 32)
+
+            # generator_length: u8
+            generator_length, _offset = read_int_buffer(buf, _offset, 1)
+
+            # generator: u8[generator_length]
+            generator, _offset = read_bytes_buffer(buf, _offset, generator_length)
+
+            # large_safe_prime_length: u8
+            large_safe_prime_length, _offset = read_int_buffer(buf, _offset, 1)
+
+            # large_safe_prime: u8[large_safe_prime_length]
+            large_safe_prime, _offset = read_bytes_buffer(buf, _offset, large_safe_prime_length)
+
+            # salt: u8[32]
+            salt, _offset = read_bytes_buffer(buf, _offset, 32)
+
+            # crc_salt: u8[16]
+            crc_salt, _offset = read_bytes_buffer(buf, _offset, 16)
+
+        return CMD_AUTH_LOGON_CHALLENGE_Server(
+            result=result,
+            server_public_key=server_public_key,
+            generator=generator,
+            large_safe_prime=large_safe_prime,
+            salt=salt,
+            crc_salt=crc_salt,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _fmt, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            struct.pack_into(_fmt, writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BBB"
+        _data = [0, 0, self.result.value]
+
+        if self.result == LoginResult.SUCCESS:
+            _fmt += f'{len(self.server_public_key)}sB{len(self.generator)}sB{len(self.large_safe_prime)}s{len(self.salt)}s{len(self.crc_salt)}s'
+            _data.extend([bytes(self.server_public_key), len(self.generator), bytes(self.generator), len(self.large_safe_prime), bytes(self.large_safe_prime), bytes(self.salt), bytes(self.crc_salt)])
+        return _fmt, _data
 
 
-@dataclasses.dataclass
+@slots_dataclass
 class CMD_AUTH_LOGON_PROOF_Client:
-    client_public_key: typing.List[int]
-    client_proof: typing.List[int]
-    crc_hash: typing.List[int]
+    client_public_key: bytes
+    client_proof: bytes
+    crc_hash: bytes
     telemetry_keys: typing.List[TelemetryKey]
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_LOGON_PROOF_Client:
         # client_public_key: u8[32]
-        client_public_key = []
-        for _ in range(0, 32):
-            client_public_key.append(await read_int(reader, 1))
+        client_public_key = await reader.readexactly(32)
 
         # client_proof: u8[20]
-        client_proof = []
-        for _ in range(0, 20):
-            client_proof.append(await read_int(reader, 1))
+        client_proof = await reader.readexactly(20)
 
         # crc_hash: u8[20]
-        crc_hash = []
-        for _ in range(0, 20):
-            crc_hash.append(await read_int(reader, 1))
+        crc_hash = await reader.readexactly(20)
 
         # number_of_telemetry_keys: u8
         number_of_telemetry_keys = await read_int(reader, 1)
@@ -308,28 +403,60 @@ class CMD_AUTH_LOGON_PROOF_Client:
             telemetry_keys=telemetry_keys,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_LOGON_PROOF_Client, int]:
+        # client_public_key: u8[32]
+        client_public_key, _offset = read_bytes_buffer(buf, _offset, 32)
+
+        # client_proof: u8[20]
+        client_proof, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        # crc_hash: u8[20]
+        crc_hash, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        # number_of_telemetry_keys: u8
+        number_of_telemetry_keys, _offset = read_int_buffer(buf, _offset, 1)
+
+        # telemetry_keys: TelemetryKey[number_of_telemetry_keys]
+        telemetry_keys = []
+        for _ in range(0, number_of_telemetry_keys):
+            _element, _offset = TelemetryKey.from_buffer(buf, _offset)
+            telemetry_keys.append(_element)
+
+        return CMD_AUTH_LOGON_PROOF_Client(
+            client_public_key=client_public_key,
+            client_proof=client_proof,
+            crc_hash=crc_hash,
+            telemetry_keys=telemetry_keys,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [1]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = f"<B{len(self.client_public_key)}s{len(self.client_proof)}s{len(self.crc_hash)}sB"
+        _data = [1, bytes(self.client_public_key), bytes(self.client_proof), bytes(self.crc_hash), len(self.telemetry_keys)]
 
-        _fmt += f'{len(self.client_public_key)}B{len(self.client_proof)}B{len(self.crc_hash)}BB'
-        _data.extend([*self.client_public_key, *self.client_proof, *self.crc_hash, len(self.telemetry_keys)])
         # telemetry_keys: TelemetryKey[number_of_telemetry_keys]
         for i in self.telemetry_keys:
             _fmt, _data = i.write(_fmt, _data)
 
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+        return _fmt, _data
 
 
-@dataclasses.dataclass
+@slots_dataclass
 class CMD_AUTH_LOGON_PROOF_Server:
     result: LoginResult
-    server_proof: typing.Optional[typing.List[int]] = None
+    server_proof: typing.Optional[bytes] = None
     hardware_survey_id: typing.Optional[int] = None
 
     @staticmethod
@@ -341,9 +468,7 @@ class CMD_AUTH_LOGON_PROOF_Server:
 
         if result == LoginResult.SUCCESS:
             # server_proof: u8[20]
-            server_proof = []
-            for _ in range(0, 20):
-                server_proof.append(await read_int(reader, 1))
+            server_proof = await reader.readexactly(20)
 
             # hardware_survey_id: u32
             hardware_survey_id = await read_int(reader, 4)
@@ -354,28 +479,54 @@ class CMD_AUTH_LOGON_PROOF_Server:
             hardware_survey_id=hardware_survey_id,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [1]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_LOGON_PROOF_Server, int]:
+        server_proof = None
+        hardware_survey_id = None
+        # result: LoginResult
+        result, _offset = read_int_buffer(buf, _offset, 1)
+        result = LoginResult(result)
 
-        _fmt += 'B'
-        _data.append(self.result.value)
-        if self.result == LoginResult.SUCCESS:
-            _fmt += f'{len(self.server_proof)}BI'
-            _data.extend([*self.server_proof, self.hardware_survey_id])
-        _data = struct.pack(_fmt, *_data)
+        if result == LoginResult.SUCCESS:
+            # server_proof: u8[20]
+            server_proof, _offset = read_bytes_buffer(buf, _offset, 20)
+
+            # hardware_survey_id: u32
+            hardware_survey_id, _offset = read_int_buffer(buf, _offset, 4)
+
+        return CMD_AUTH_LOGON_PROOF_Server(
+            result=result,
+            server_proof=server_proof,
+            hardware_survey_id=hardware_survey_id,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _fmt, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            struct.pack_into(_fmt, writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
 
+    def _write_fmt(self):
+        _fmt = "<BB"
+        _data = [1, self.result.value]
 
-@dataclasses.dataclass
+        if self.result == LoginResult.SUCCESS:
+            _fmt += f'{len(self.server_proof)}sI'
+            _data.extend([bytes(self.server_proof), self.hardware_survey_id])
+        return _fmt, _data
+
+
+@slots_dataclass
 class CMD_AUTH_RECONNECT_CHALLENGE_Server:
     result: LoginResult
-    challenge_data: typing.Optional[typing.List[int]] = None
-    checksum_salt: typing.Optional[typing.List[int]] = None
+    challenge_data: typing.Optional[bytes] = None
+    checksum_salt: typing.Optional[bytes] = None
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_RECONNECT_CHALLENGE_Server:
@@ -386,14 +537,10 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Server:
 
         if result == LoginResult.SUCCESS:
             # challenge_data: u8[16]
-            challenge_data = []
-            for _ in range(0, 16):
-                challenge_data.append(await read_int(reader, 1))
+            challenge_data = await reader.readexactly(16)
 
             # checksum_salt: u8[16]
-            checksum_salt = []
-            for _ in range(0, 16):
-                checksum_salt.append(await read_int(reader, 1))
+            checksum_salt = await reader.readexactly(16)
 
         return CMD_AUTH_RECONNECT_CHALLENGE_Server(
             result=result,
@@ -401,24 +548,53 @@ class CMD_AUTH_RECONNECT_CHALLENGE_Server:
             checksum_salt=checksum_salt,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [2]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_RECONNECT_CHALLENGE_Server, int]:
+        challenge_data = None
+        checksum_salt = None
+        # result: LoginResult
+        result, _offset = read_int_buffer(buf, _offset, 1)
+        result = LoginResult(result)
 
-        _fmt += 'B'
-        _data.append(self.result.value)
-        if self.result == LoginResult.SUCCESS:
-            _fmt += f'{len(self.challenge_data)}B{len(self.checksum_salt)}B'
-            _data.extend([*self.challenge_data, *self.checksum_salt])
-        _data = struct.pack(_fmt, *_data)
+        if result == LoginResult.SUCCESS:
+            # challenge_data: u8[16]
+            challenge_data, _offset = read_bytes_buffer(buf, _offset, 16)
+
+            # checksum_salt: u8[16]
+            checksum_salt, _offset = read_bytes_buffer(buf, _offset, 16)
+
+        return CMD_AUTH_RECONNECT_CHALLENGE_Server(
+            result=result,
+            challenge_data=challenge_data,
+            checksum_salt=checksum_salt,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _fmt, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            struct.pack_into(_fmt, writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BB"
+        _data = [2, self.result.value]
+
+        if self.result == LoginResult.SUCCESS:
+            _fmt += f'{len(self.challenge_data)}s{len(self.checksum_salt)}s'
+            _data.extend([bytes(self.challenge_data), bytes(self.checksum_salt)])
+        return _fmt, _data
 
 
-@dataclasses.dataclass
+_CMD_AUTH_RECONNECT_PROOF_Server_write = struct.Struct("<BB")
+
+
+@slots_dataclass
 class CMD_AUTH_RECONNECT_PROOF_Server:
     result: LoginResult
 
@@ -431,42 +607,48 @@ class CMD_AUTH_RECONNECT_PROOF_Server:
             result=result,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [3]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_RECONNECT_PROOF_Server, int]:
+        # result: LoginResult
+        result, _offset = read_int_buffer(buf, _offset, 1)
+        result = LoginResult(result)
 
-        _fmt += 'B'
-        _data.append(self.result.value)
-        _data = struct.pack(_fmt, *_data)
+        return CMD_AUTH_RECONNECT_PROOF_Server(
+            result=result,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _struct, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            _struct.pack_into(writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(_struct.pack(*_data))
 
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _struct, _data = self._write_fmt()
+        _struct.pack_into(buf, offset, *_data)
+        return offset + _struct.size
 
-@dataclasses.dataclass
+    def _write_fmt(self):
+        return _CMD_AUTH_RECONNECT_PROOF_Server_write, [3, self.result.value]
+
+
+@slots_dataclass
 class CMD_AUTH_RECONNECT_PROOF_Client:
-    proof_data: typing.List[int]
-    client_proof: typing.List[int]
-    client_checksum: typing.List[int]
+    proof_data: bytes
+    client_proof: bytes
+    client_checksum: bytes
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_RECONNECT_PROOF_Client:
         # proof_data: u8[16]
-        proof_data = []
-        for _ in range(0, 16):
-            proof_data.append(await read_int(reader, 1))
+        proof_data = await reader.readexactly(16)
 
         # client_proof: u8[20]
-        client_proof = []
-        for _ in range(0, 20):
-            client_proof.append(await read_int(reader, 1))
+        client_proof = await reader.readexactly(20)
 
         # client_checksum: u8[20]
-        client_checksum = []
-        for _ in range(0, 20):
-            client_checksum.append(await read_int(reader, 1))
+        client_checksum = await reader.readexactly(20)
 
         # key_count: u8
         _key_count = await read_int(reader, 1)
@@ -477,34 +659,58 @@ class CMD_AUTH_RECONNECT_PROOF_Client:
             client_checksum=client_checksum,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [3]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_RECONNECT_PROOF_Client, int]:
+        # proof_data: u8[16]
+        proof_data, _offset = read_bytes_buffer(buf, _offset, 16)
+
+        # client_proof: u8[20]
+        client_proof, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        # client_checksum: u8[20]
+        client_checksum, _offset = read_bytes_buffer(buf, _offset, 20)
 
-        _fmt += f'{len(self.proof_data)}B{len(self.client_proof)}B{len(self.client_checksum)}BB'
-        _data.extend([*self.proof_data, *self.client_proof, *self.client_checksum, 0])
-        _data = struct.pack(_fmt, *_data)
+        # key_count: u8
+        _key_count, _offset = read_int_buffer(buf, _offset, 1)
+
+        return CMD_AUTH_RECONNECT_PROOF_Client(
+            proof_data=proof_data,
+            client_proof=client_proof,
+            client_checksum=client_checksum,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _fmt, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            struct.pack_into(_fmt, writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
 
+    def _write_fmt(self):
+        _fmt = f"<B{len(self.proof_data)}s{len(self.client_proof)}s{len(self.client_checksum)}sB"
+        _data = [3, bytes(self.proof_data), bytes(self.client_proof), bytes(self.client_checksum), 0]
 
-@dataclasses.dataclass
+        return _fmt, _data
+
+
+_CMD_REALM_LIST_Server_0 = struct.Struct("<HIB")
+
+
+@slots_dataclass
 class CMD_REALM_LIST_Server:
     realms: typing.List[Realm]
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_REALM_LIST_Server:
         # size: u16
-        _size = await read_int(reader, 2)
-
         # header_padding: u32
-        _header_padding = await read_int(reader, 4)
-
         # number_of_realms: u8
-        number_of_realms = await read_int(reader, 1)
+        _size, _header_padding, number_of_realms = _CMD_REALM_LIST_Server_0.unpack(await reader.readexactly(7))
 
         # realms: Realm[number_of_realms]
         realms = []
@@ -518,12 +724,43 @@ class CMD_REALM_LIST_Server:
             realms=realms,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_REALM_LIST_Server, int]:
+        # size: u16
+        # header_padding: u32
+        # number_of_realms: u8
+        _size, _header_padding, number_of_realms = _CMD_REALM_LIST_Server_0.unpack_from(buf, _offset)
+        _offset += 7
+
+        # realms: Realm[number_of_realms]
+        realms = []
+        for _ in range(0, number_of_realms):
+            _element, _offset = Realm.from_buffer(buf, _offset)
+            realms.append(_element)
+
+        # footer_padding: u16
+        _footer_padding, _offset = read_int_buffer(buf, _offset, 2)
+
+        return CMD_REALM_LIST_Server(
+            realms=realms,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [16]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BHIB"
+        _data = [16, self.size(), 0, len(self.realms)]
 
-        _fmt += 'HIB'
-        _data.extend([self.size(), 0, len(self.realms)])
         # realms: Realm[number_of_realms]
         for i in self.realms:
             _fmt, _data = i.write(_fmt, _data)
@@ -532,18 +769,16 @@ class CMD_REALM_LIST_Server:
         _fmt += 'H'
         _data.append(0)
 
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+        return _fmt, _data
 
     def size(self) -> int:
         return 7 + sum([i.size() for i in self.realms])
 
 
-@dataclasses.dataclass
+_CMD_REALM_LIST_Client_write = struct.Struct("<BI")
+
+
+@slots_dataclass
 class CMD_REALM_LIST_Client:
 
     @staticmethod
@@ -554,25 +789,35 @@ class CMD_REALM_LIST_Client:
         return CMD_REALM_LIST_Client(
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [16]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_REALM_LIST_Client, int]:
+        # padding: u32
+        _padding, _offset = read_int_buffer(buf, _offset, 4)
 
-        _fmt += 'I'
-        _data.append(0)
-        _data = struct.pack(_fmt, *_data)
+        return CMD_REALM_LIST_Client(
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _struct, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            _struct.pack_into(writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(_struct.pack(*_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _struct, _data = self._write_fmt()
+        _struct.pack_into(buf, offset, *_data)
+        return offset + _struct.size
+
+    def _write_fmt(self):
+        return _CMD_REALM_LIST_Client_write, [16, 0]
 
 
-@dataclasses.dataclass
+@slots_dataclass
 class CMD_XFER_INITIATE:
     filename: str
     file_size: int
-    file_md5: typing.List[int]
+    file_md5: bytes
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_XFER_INITIATE:
@@ -583,9 +828,7 @@ class CMD_XFER_INITIATE:
         file_size = await read_int(reader, 8)
 
         # file_md5: u8[16]
-        file_md5 = []
-        for _ in range(0, 16):
-            file_md5.append(await read_int(reader, 1))
+        file_md5 = await reader.readexactly(16)
 
         return CMD_XFER_INITIATE(
             filename=filename,
@@ -593,23 +836,45 @@ class CMD_XFER_INITIATE:
             file_md5=file_md5,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [48]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_XFER_INITIATE, int]:
+        # filename: String
+        filename, _offset = read_string_buffer(buf, _offset)
+
+        # file_size: u64
+        file_size, _offset = read_int_buffer(buf, _offset, 8)
+
+        # file_md5: u8[16]
+        file_md5, _offset = read_bytes_buffer(buf, _offset, 16)
 
-        _fmt += f'B{len(self.filename)}sQ{len(self.file_md5)}B'
-        _data.extend([len(self.filename), self.filename.encode('utf-8'), self.file_size, *self.file_md5])
-        _data = struct.pack(_fmt, *_data)
+        return CMD_XFER_INITIATE(
+            filename=filename,
+            file_size=file_size,
+            file_md5=file_md5,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _fmt, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            struct.pack_into(_fmt, writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = f"<BB{len(self.filename)}sQ{len(self.file_md5)}s"
+        _data = [48, len(self.filename), self.filename.encode('utf-8'), self.file_size, bytes(self.file_md5)]
+
+        return _fmt, _data
 
 
-@dataclasses.dataclass
+@slots_dataclass
 class CMD_XFER_DATA:
-    data: typing.List[int]
+    data: bytes
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_XFER_DATA:
@@ -617,48 +882,77 @@ class CMD_XFER_DATA:
         size = await read_int(reader, 2)
 
         # data: u8[size]
-        data = []
-        for _ in range(0, size):
-            data.append(await read_int(reader, 1))
+        data = await reader.readexactly(size)
 
         return CMD_XFER_DATA(
             data=data,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [49]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_XFER_DATA, int]:
+        # size: u16
+        size, _offset = read_int_buffer(buf, _offset, 2)
 
-        _fmt += f'H{len(self.data)}B'
-        _data.extend([len(self.data), *self.data])
-        _data = struct.pack(_fmt, *_data)
+        # data: u8[size]
+        data, _offset = read_bytes_buffer(buf, _offset, size)
+
+        return CMD_XFER_DATA(
+            data=data,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _fmt, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            struct.pack_into(_fmt, writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
 
+    def _write_fmt(self):
+        _fmt = f"<BH{len(self.data)}s"
+        _data = [49, len(self.data), bytes(self.data)]
+
+        return _fmt, _data
 
-@dataclasses.dataclass
+
+_CMD_XFER_ACCEPT_write = struct.Struct("<B")
+
+
+@slots_dataclass
 class CMD_XFER_ACCEPT:
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_XFER_ACCEPT:
         return CMD_XFER_ACCEPT()
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [50]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_XFER_ACCEPT, int]:
+        return CMD_XFER_ACCEPT(), _offset
 
-        _data = struct.pack(_fmt, *_data)
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _struct, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            _struct.pack_into(writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(_struct.pack(*_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _struct, _data = self._write_fmt()
+        _struct.pack_into(buf, offset, *_data)
+        return offset + _struct.size
+
+    def _write_fmt(self):
+        return _CMD_XFER_ACCEPT_write, [50]
+
 
+_CMD_XFER_RESUME_write = struct.Struct("<BQ")
 
-@dataclasses.dataclass
+
+@slots_dataclass
 class CMD_XFER_RESUME:
     offset: int
 
@@ -671,37 +965,59 @@ class CMD_XFER_RESUME:
             offset=offset,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [51]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_XFER_RESUME, int]:
+        # offset: u64
+        offset, _offset = read_int_buffer(buf, _offset, 8)
 
-        _fmt += 'Q'
-        _data.append(self.offset)
-        _data = struct.pack(_fmt, *_data)
+        return CMD_XFER_RESUME(
+            offset=offset,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _struct, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            _struct.pack_into(writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(_struct.pack(*_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _struct, _data = self._write_fmt()
+        _struct.pack_into(buf, offset, *_data)
+        return offset + _struct.size
 
+    def _write_fmt(self):
+        return _CMD_XFER_RESUME_write, [51, self.offset]
 
-@dataclasses.dataclass
+
+_CMD_XFER_CANCEL_write = struct.Struct("<B")
+
+
+@slots_dataclass
 class CMD_XFER_CANCEL:
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_XFER_CANCEL:
         return CMD_XFER_CANCEL()
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [52]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_XFER_CANCEL, int]:
+        return CMD_XFER_CANCEL(), _offset
 
-        _data = struct.pack(_fmt, *_data)
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _struct, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            _struct.pack_into(writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(_struct.pack(*_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _struct, _data = self._write_fmt()
+        _struct.pack_into(buf, offset, *_data)
+        return offset + _struct.size
+
+    def _write_fmt(self):
+        return _CMD_XFER_CANCEL_write, [52]
 
 
 ClientOpcode = typing.Union[
@@ -716,6 +1032,18 @@ ClientOpcode = typing.Union[
 ]
 
 
+client_opcodes: dict[int, ClientOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Client,
+    0x01: CMD_AUTH_LOGON_PROOF_Client,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Client,
+    0x03: CMD_AUTH_RECONNECT_PROOF_Client,
+    0x10: CMD_REALM_LIST_Client,
+    0x32: CMD_XFER_ACCEPT,
+    0x33: CMD_XFER_RESUME,
+    0x34: CMD_XFER_CANCEL,
+}
+
+
 async def read_client_opcode(reader: asyncio.StreamReader) -> typing.Optional[ClientOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
@@ -757,6 +1085,17 @@ ServerOpcode = typing.Union[
 ]
 
 
+server_opcodes: dict[int, ServerOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Server,
+    0x01: CMD_AUTH_LOGON_PROOF_Server,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Server,
+    0x03: CMD_AUTH_RECONNECT_PROOF_Server,
+    0x10: CMD_REALM_LIST_Server,
+    0x30: CMD_XFER_INITIATE,
+    0x31: CMD_XFER_DATA,
+}
+
+
 async def read_server_opcode(reader: asyncio.StreamReader) -> typing.Optional[ServerOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
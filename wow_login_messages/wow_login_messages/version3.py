@@ -5,11 +5,19 @@ import enum
 import struct
 import typing
 
+from .util import LoginFrameDecoder
 from .util import read_string
+from .util import read_string_buffer
+from .util import slots_dataclass
 from .util import read_bool
 from .util import read_int
 from .util import read_cstring
 from .util import read_float
+from .util import read_bool_buffer
+from .util import read_int_buffer
+from .util import read_cstring_buffer
+from .util import read_float_buffer
+from .util import read_bytes_buffer
 
 from .all import Locale
 from .version2 import LoginResult
@@ -67,17 +75,20 @@ class SecurityFlag(enum.Enum):
     PIN = 1
 
 
-@dataclasses.dataclass
+_CMD_AUTH_LOGON_CHALLENGE_Server_0 = struct.Struct("<BB")
+
+
+@slots_dataclass
 class CMD_AUTH_LOGON_CHALLENGE_Server:
     result: LoginResult
-    server_public_key: typing.Optional[typing.List[int]] = None
-    generator: typing.Optional[typing.List[int]] = None
-    large_safe_prime: typing.Optional[typing.List[int]] = None
-    salt: typing.Optional[typing.List[int]] = None
-    crc_salt: typing.Optional[typing.List[int]] = None
+    server_public_key: typing.Optional[bytes] = None
+    generator: typing.Optional[bytes] = None
+    large_safe_prime: typing.Optional[bytes] = None
+    salt: typing.Optional[bytes] = None
+    crc_salt: typing.Optional[bytes] = None
     security_flag: typing.Optional[SecurityFlag] = None
     pin_grid_seed: typing.Optional[int] = None
-    pin_salt: typing.Optional[typing.List[int]] = None
+    pin_salt: typing.Optional[bytes] = None
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_LOGON_CHALLENGE_Server:
@@ -92,42 +103,31 @@ class CMD_AUTH_LOGON_CHALLENGE_Server:
         pin_grid_seed = None
         pin_salt = None
         # protocol_version: u8
-        _protocol_version = await read_int(reader, 1)
-
         # result: LoginResult
-        result = LoginResult(await read_int(reader, 1))
+        _protocol_version, result = _CMD_AUTH_LOGON_CHALLENGE_Server_0.unpack(await reader.readexactly(2))
+        result = LoginResult(result)
 
         if result == LoginResult.SUCCESS:
             # server_public_key: u8[32]
-            server_public_key = []
-            for _ in range(0, 32):
-                server_public_key.append(await read_int(reader, 1))
+            server_public_key = await reader.readexactly(32)
 
             # generator_length: u8
             generator_length = await read_int(reader, 1)
 
             # generator: u8[generator_length]
-            generator = []
-            for _ in range(0, generator_length):
-                generator.append(await read_int(reader, 1))
+            generator = await reader.readexactly(generator_length)
 
             # large_safe_prime_length: u8
             large_safe_prime_length = await read_int(reader, 1)
 
             # large_safe_prime: u8[large_safe_prime_length]
-            large_safe_prime = []
-            for _ in range(0, large_safe_prime_length):
-                large_safe_prime.append(await read_int(reader, 1))
+            large_safe_prime = await reader.readexactly(large_safe_prime_length)
 
             # salt: u8[32]
-            salt = []
-            for _ in range(0, 32):
-                salt.append(await read_int(reader, 1))
+            salt = await reader.readexactly(32)
 
             # crc_salt: u8[16]
-            crc_salt = []
-            for _ in range(0, 16):
-                crc_salt.append(await read_int(reader, 1))
+            crc_salt = await reader.readexactly(16)
 
             # security_flag: SecurityFlag
             security_flag = SecurityFlag(await read_int(reader, 1))
@@ -137,9 +137,7 @@ class CMD_AUTH_LOGON_CHALLENGE_Server:
                 pin_grid_seed = await read_int(reader, 4)
 
                 # pin_salt: u8[16]
-                pin_salt = []
-                for _ in range(0, 16):
-                    pin_salt.append(await read_int(reader, 1))
+                pin_salt = await reader.readexactly(16)
 
         return CMD_AUTH_LOGON_CHALLENGE_Server(
             result=result,
@@ -153,54 +151,116 @@ class CMD_AUTH_LOGON_CHALLENGE_Server:
             pin_salt=pin_salt,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_LOGON_CHALLENGE_Server, int]:
+        server_public_key = None
+        generator_length = None
+        generator = None
+        large_safe_prime_length = None
+        large_safe_prime = None
+        salt = None
+        crc_salt = None
+        security_flag = None
+        pin_grid_seed = None
+        pin_salt = None
+        # protocol_version: u8
+        # result: LoginResult
+        _protocol_version, result = _CMD_AUTH_LOGON_CHALLENGE_Server_0.unpack_from(buf, _offset)
+        _offset += 2
+        result = LoginResult(result)
+
+        if result == LoginResult.SUCCESS:
+            # server_public_key: u8[32]
+            server_public_key, _offset = read_bytes_buffer(buf, _offset, 32)
+
+            # generator_length: u8
+            generator_length, _offset = read_int_buffer(buf, _offset, 1)
+
+            # generator: u8[generator_length]
+            generator, _offset = read_bytes_buffer(buf, _offset, generator_length)
+
+            # large_safe_prime_length: u8
+            large_safe_prime_length, _offset = read_int_buffer(buf, _offset, 1)
+
+            # large_safe_prime: u8[large_safe_prime_length]
+            large_safe_prime, _offset = read_bytes_buffer(buf, _offset, large_safe_prime_length)
+
+            # salt: u8[32]
+            salt, _offset = read_bytes_buffer(buf, _offset, 32)
+
+            # crc_salt: u8[16]
+            crc_salt, _offset = read_bytes_buffer(buf, _offset, 16)
+
+            # security_flag: SecurityFlag
+            security_flag, _offset = read_int_buffer(buf, _offset, 1)
+            security_flag = SecurityFlag(security_flag)
+
+            if security_flag == SecurityFlag.PIN:
+                # pin_grid_seed: u32
+                pin_grid_seed, _offset = read_int_buffer(buf, _offset, 4)
+
+                # pin_salt: u8[16]
+                pin_salt, _offset = read_bytes_buffer(buf, _offset, 16)
+
+        return CMD_AUTH_LOGON_CHALLENGE_Server(
+            result=result,
+            server_public_key=server_public_key,
+            generator=generator,
+            large_safe_prime=large_safe_prime,
+            salt=salt,
+            crc_salt=crc_salt,
+            security_flag=security_flag,
+            pin_grid_seed=pin_grid_seed,
+            pin_salt=pin_salt,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [0]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BBB"
+        _data = [0, 0, self.result.value]
 
-        _fmt += 'BB'
-        _data.extend([0, self.result.value])
         if self.result == LoginResult.SUCCESS:
-            _fmt += f'{len(self.server_public_key)}BB{len(self.generator)}BB{len(self.large_safe_prime)}B{len(self.salt)}B{len(self.crc_salt)}BB'
-            _data.extend([*self.server_public_key, len(self.generator), *self.generator, len(self.large_safe_prime), *self.large_safe_prime, *self.salt, *self.crc_salt, self.security_flag.value])
+            _fmt += f'{len(self.server_public_key)}sB{len(self.generator)}sB{len(self.large_safe_prime)}s{len(self.salt)}s{len(self.crc_salt)}sB'
+            _data.extend([bytes(self.server_public_key), len(self.generator), bytes(self.generator), len(self.large_safe_prime), bytes(self.large_safe_prime), bytes(self.salt), bytes(self.crc_salt), self.security_flag.value])
             if self.security_flag == SecurityFlag.PIN:
-                _fmt += f'I{len(self.pin_salt)}B'
-                _data.extend([self.pin_grid_seed, *self.pin_salt])
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+                _fmt += f'I{len(self.pin_salt)}s'
+                _data.extend([self.pin_grid_seed, bytes(self.pin_salt)])
+        return _fmt, _data
 
 
-@dataclasses.dataclass
+@slots_dataclass
 class CMD_AUTH_LOGON_PROOF_Client:
-    client_public_key: typing.List[int]
-    client_proof: typing.List[int]
-    crc_hash: typing.List[int]
+    client_public_key: bytes
+    client_proof: bytes
+    crc_hash: bytes
     telemetry_keys: typing.List[TelemetryKey]
     security_flag: SecurityFlag
-    pin_salt: typing.Optional[typing.List[int]] = None
-    pin_hash: typing.Optional[typing.List[int]] = None
+    pin_salt: typing.Optional[bytes] = None
+    pin_hash: typing.Optional[bytes] = None
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_LOGON_PROOF_Client:
         pin_salt = None
         pin_hash = None
         # client_public_key: u8[32]
-        client_public_key = []
-        for _ in range(0, 32):
-            client_public_key.append(await read_int(reader, 1))
+        client_public_key = await reader.readexactly(32)
 
         # client_proof: u8[20]
-        client_proof = []
-        for _ in range(0, 20):
-            client_proof.append(await read_int(reader, 1))
+        client_proof = await reader.readexactly(20)
 
         # crc_hash: u8[20]
-        crc_hash = []
-        for _ in range(0, 20):
-            crc_hash.append(await read_int(reader, 1))
+        crc_hash = await reader.readexactly(20)
 
         # number_of_telemetry_keys: u8
         number_of_telemetry_keys = await read_int(reader, 1)
@@ -215,14 +275,10 @@ class CMD_AUTH_LOGON_PROOF_Client:
 
         if security_flag == SecurityFlag.PIN:
             # pin_salt: u8[16]
-            pin_salt = []
-            for _ in range(0, 16):
-                pin_salt.append(await read_int(reader, 1))
+            pin_salt = await reader.readexactly(16)
 
             # pin_hash: u8[20]
-            pin_hash = []
-            for _ in range(0, 20):
-                pin_hash.append(await read_int(reader, 1))
+            pin_hash = await reader.readexactly(20)
 
         return CMD_AUTH_LOGON_PROOF_Client(
             client_public_key=client_public_key,
@@ -234,12 +290,65 @@ class CMD_AUTH_LOGON_PROOF_Client:
             pin_hash=pin_hash,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_LOGON_PROOF_Client, int]:
+        pin_salt = None
+        pin_hash = None
+        # client_public_key: u8[32]
+        client_public_key, _offset = read_bytes_buffer(buf, _offset, 32)
+
+        # client_proof: u8[20]
+        client_proof, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        # crc_hash: u8[20]
+        crc_hash, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        # number_of_telemetry_keys: u8
+        number_of_telemetry_keys, _offset = read_int_buffer(buf, _offset, 1)
+
+        # telemetry_keys: TelemetryKey[number_of_telemetry_keys]
+        telemetry_keys = []
+        for _ in range(0, number_of_telemetry_keys):
+            _element, _offset = TelemetryKey.from_buffer(buf, _offset)
+            telemetry_keys.append(_element)
+
+        # security_flag: SecurityFlag
+        security_flag, _offset = read_int_buffer(buf, _offset, 1)
+        security_flag = SecurityFlag(security_flag)
+
+        if security_flag == SecurityFlag.PIN:
+            # pin_salt: u8[16]
+            pin_salt, _offset = read_bytes_buffer(buf, _offset, 16)
+
+            # pin_hash: u8[20]
+            pin_hash, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        return CMD_AUTH_LOGON_PROOF_Client(
+            client_public_key=client_public_key,
+            client_proof=client_proof,
+            crc_hash=crc_hash,
+            telemetry_keys=telemetry_keys,
+            security_flag=security_flag,
+            pin_salt=pin_salt,
+            pin_hash=pin_hash,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [1]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = f"<B{len(self.client_public_key)}s{len(self.client_proof)}s{len(self.crc_hash)}sB"
+        _data = [1, bytes(self.client_public_key), bytes(self.client_proof), bytes(self.crc_hash), len(self.telemetry_keys)]
 
-        _fmt += f'{len(self.client_public_key)}B{len(self.client_proof)}B{len(self.crc_hash)}BB'
-        _data.extend([*self.client_public_key, *self.client_proof, *self.crc_hash, len(self.telemetry_keys)])
         # telemetry_keys: TelemetryKey[number_of_telemetry_keys]
         for i in self.telemetry_keys:
             _fmt, _data = i.write(_fmt, _data)
@@ -249,37 +358,29 @@ class CMD_AUTH_LOGON_PROOF_Client:
         _data.append(self.security_flag.value)
 
         if self.security_flag == SecurityFlag.PIN:
-            _fmt += f'{len(self.pin_salt)}B{len(self.pin_hash)}B'
-            _data.extend([*self.pin_salt, *self.pin_hash])
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+            _fmt += f'{len(self.pin_salt)}s{len(self.pin_hash)}s'
+            _data.extend([bytes(self.pin_salt), bytes(self.pin_hash)])
+        return _fmt, _data
+
 
+_CMD_SURVEY_RESULT_0 = struct.Struct("<IBH")
 
-@dataclasses.dataclass
+
+@slots_dataclass
 class CMD_SURVEY_RESULT:
     survey_id: int
     error: int
-    data: typing.List[int]
+    data: bytes
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_SURVEY_RESULT:
         # survey_id: u32
-        survey_id = await read_int(reader, 4)
-
         # error: u8
-        error = await read_int(reader, 1)
-
         # compressed_data_length: u16
-        compressed_data_length = await read_int(reader, 2)
+        survey_id, error, compressed_data_length = _CMD_SURVEY_RESULT_0.unpack(await reader.readexactly(7))
 
         # data: u8[compressed_data_length]
-        data = []
-        for _ in range(0, compressed_data_length):
-            data.append(await read_int(reader, 1))
+        data = await reader.readexactly(compressed_data_length)
 
         return CMD_SURVEY_RESULT(
             survey_id=survey_id,
@@ -287,18 +388,40 @@ class CMD_SURVEY_RESULT:
             data=data,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [4]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_SURVEY_RESULT, int]:
+        # survey_id: u32
+        # error: u8
+        # compressed_data_length: u16
+        survey_id, error, compressed_data_length = _CMD_SURVEY_RESULT_0.unpack_from(buf, _offset)
+        _offset += 7
 
-        _fmt += f'IBH{len(self.data)}B'
-        _data.extend([self.survey_id, self.error, len(self.data), *self.data])
-        _data = struct.pack(_fmt, *_data)
+        # data: u8[compressed_data_length]
+        data, _offset = read_bytes_buffer(buf, _offset, compressed_data_length)
+
+        return CMD_SURVEY_RESULT(
+            survey_id=survey_id,
+            error=error,
+            data=data,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _fmt, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            struct.pack_into(_fmt, writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = f"<BIBH{len(self.data)}s"
+        _data = [4, self.survey_id, self.error, len(self.data), bytes(self.data)]
+
+        return _fmt, _data
 
 
 ClientOpcode = typing.Union[
@@ -313,6 +436,18 @@ ClientOpcode = typing.Union[
 ]
 
 
+client_opcodes: dict[int, ClientOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Client,
+    0x01: CMD_AUTH_LOGON_PROOF_Client,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Client,
+    0x04: CMD_SURVEY_RESULT,
+    0x10: CMD_REALM_LIST_Client,
+    0x32: CMD_XFER_ACCEPT,
+    0x33: CMD_XFER_RESUME,
+    0x34: CMD_XFER_CANCEL,
+}
+
+
 async def read_client_opcode(reader: asyncio.StreamReader) -> typing.Optional[ClientOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
@@ -352,6 +487,15 @@ ServerOpcode = typing.Union[
 ]
 
 
+server_opcodes: dict[int, ServerOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Server,
+    0x01: CMD_AUTH_LOGON_PROOF_Server,
+    0x10: CMD_REALM_LIST_Server,
+    0x30: CMD_XFER_INITIATE,
+    0x31: CMD_XFER_DATA,
+}
+
+
 async def read_server_opcode(reader: asyncio.StreamReader) -> typing.Optional[ServerOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
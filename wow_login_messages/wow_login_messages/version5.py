@@ -5,11 +5,19 @@ import enum
 import struct
 import typing
 
+from .util import LoginFrameDecoder
 from .util import read_string
+from .util import read_string_buffer
+from .util import slots_dataclass
 from .util import read_bool
 from .util import read_int
 from .util import read_cstring
 from .util import read_float
+from .util import read_bool_buffer
+from .util import read_int_buffer
+from .util import read_cstring_buffer
+from .util import read_float_buffer
+from .util import read_bytes_buffer
 
 from .all import Locale
 from .version2 import LoginResult
@@ -69,7 +77,11 @@ class SecurityFlag(enum.Flag):
     MATRIX_CARD = 2
 
 
-@dataclasses.dataclass
+_Realm_0 = struct.Struct("<BBB")
+_Realm_1 = struct.Struct("<fBBB")
+
+
+@slots_dataclass
 class Realm:
     realm_type: RealmType
     locked: bool
@@ -84,13 +96,12 @@ class Realm:
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> Realm:
         # realm_type: RealmType
-        realm_type = RealmType(await read_int(reader, 1))
-
         # locked: Bool8
-        locked = await read_bool(reader, 1)
-
         # flag: RealmFlag
-        flag = RealmFlag(await read_int(reader, 1))
+        realm_type, locked, flag = _Realm_0.unpack(await reader.readexactly(3))
+        realm_type = RealmType(realm_type)
+        locked = locked == 1
+        flag = RealmFlag(flag)
 
         # name: CString
         name = await read_cstring(reader)
@@ -99,16 +110,11 @@ class Realm:
         address = await read_cstring(reader)
 
         # population: Population
-        population = await read_float(reader)
-
         # number_of_characters_on_realm: u8
-        number_of_characters_on_realm = await read_int(reader, 1)
-
         # category: RealmCategory
-        category = RealmCategory(await read_int(reader, 1))
-
         # realm_id: u8
-        realm_id = await read_int(reader, 1)
+        population, number_of_characters_on_realm, category, realm_id = _Realm_1.unpack(await reader.readexactly(7))
+        category = RealmCategory(category)
 
         return Realm(
             realm_type=realm_type,
@@ -122,6 +128,43 @@ class Realm:
             realm_id=realm_id,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[Realm, int]:
+        # realm_type: RealmType
+        # locked: Bool8
+        # flag: RealmFlag
+        realm_type, locked, flag = _Realm_0.unpack_from(buf, _offset)
+        _offset += 3
+        realm_type = RealmType(realm_type)
+        locked = locked == 1
+        flag = RealmFlag(flag)
+
+        # name: CString
+        name, _offset = read_cstring_buffer(buf, _offset)
+
+        # address: CString
+        address, _offset = read_cstring_buffer(buf, _offset)
+
+        # population: Population
+        # number_of_characters_on_realm: u8
+        # category: RealmCategory
+        # realm_id: u8
+        population, number_of_characters_on_realm, category, realm_id = _Realm_1.unpack_from(buf, _offset)
+        _offset += 7
+        category = RealmCategory(category)
+
+        return Realm(
+            realm_type=realm_type,
+            locked=locked,
+            flag=flag,
+            name=name,
+            address=address,
+            population=population,
+            number_of_characters_on_realm=number_of_characters_on_realm,
+            category=category,
+            realm_id=realm_id,
+        ), _offset
+
     def write(self, _fmt, _data):
         _fmt += f'BBB{len(self.name)}sB{len(self.address)}sBfBBB'
         _data.extend([self.realm_type.value, self.locked, self.flag.value, self.name.encode('utf-8'), 0, self.address.encode('utf-8'), 0, self.population, self.number_of_characters_on_realm, self.category.value, self.realm_id])
@@ -131,17 +174,21 @@ class Realm:
         return 12 + len(self.name) + len(self.address)
 
 
-@dataclasses.dataclass
+_CMD_AUTH_LOGON_CHALLENGE_Server_0 = struct.Struct("<BB")
+_CMD_AUTH_LOGON_CHALLENGE_Server_1 = struct.Struct("<BBBBQ")
+
+
+@slots_dataclass
 class CMD_AUTH_LOGON_CHALLENGE_Server:
     result: LoginResult
-    server_public_key: typing.Optional[typing.List[int]] = None
-    generator: typing.Optional[typing.List[int]] = None
-    large_safe_prime: typing.Optional[typing.List[int]] = None
-    salt: typing.Optional[typing.List[int]] = None
-    crc_salt: typing.Optional[typing.List[int]] = None
+    server_public_key: typing.Optional[bytes] = None
+    generator: typing.Optional[bytes] = None
+    large_safe_prime: typing.Optional[bytes] = None
+    salt: typing.Optional[bytes] = None
+    crc_salt: typing.Optional[bytes] = None
     security_flag: typing.Optional[SecurityFlag] = None
     pin_grid_seed: typing.Optional[int] = None
-    pin_salt: typing.Optional[typing.List[int]] = None
+    pin_salt: typing.Optional[bytes] = None
     width: typing.Optional[int] = None
     height: typing.Optional[int] = None
     digit_count: typing.Optional[int] = None
@@ -166,42 +213,31 @@ class CMD_AUTH_LOGON_CHALLENGE_Server:
         challenge_count = None
         seed = None
         # protocol_version: u8
-        _protocol_version = await read_int(reader, 1)
-
         # result: LoginResult
-        result = LoginResult(await read_int(reader, 1))
+        _protocol_version, result = _CMD_AUTH_LOGON_CHALLENGE_Server_0.unpack(await reader.readexactly(2))
+        result = LoginResult(result)
 
         if result == LoginResult.SUCCESS:
             # server_public_key: u8[32]
-            server_public_key = []
-            for _ in range(0, 32):
-                server_public_key.append(await read_int(reader, 1))
+            server_public_key = await reader.readexactly(32)
 
             # generator_length: u8
             generator_length = await read_int(reader, 1)
 
             # generator: u8[generator_length]
-            generator = []
-            for _ in range(0, generator_length):
-                generator.append(await read_int(reader, 1))
+            generator = await reader.readexactly(generator_length)
 
             # large_safe_prime_length: u8
             large_safe_prime_length = await read_int(reader, 1)
 
             # large_safe_prime: u8[large_safe_prime_length]
-            large_safe_prime = []
-            for _ in range(0, large_safe_prime_length):
-                large_safe_prime.append(await read_int(reader, 1))
+            large_safe_prime = await reader.readexactly(large_safe_prime_length)
 
             # salt: u8[32]
-            salt = []
-            for _ in range(0, 32):
-                salt.append(await read_int(reader, 1))
+            salt = await reader.readexactly(32)
 
             # crc_salt: u8[16]
-            crc_salt = []
-            for _ in range(0, 16):
-                crc_salt.append(await read_int(reader, 1))
+            crc_salt = await reader.readexactly(16)
 
             # security_flag: SecurityFlag
             security_flag = SecurityFlag(await read_int(reader, 1))
@@ -211,25 +247,15 @@ class CMD_AUTH_LOGON_CHALLENGE_Server:
                 pin_grid_seed = await read_int(reader, 4)
 
                 # pin_salt: u8[16]
-                pin_salt = []
-                for _ in range(0, 16):
-                    pin_salt.append(await read_int(reader, 1))
+                pin_salt = await reader.readexactly(16)
 
             if SecurityFlag.MATRIX_CARD in security_flag:
                 # width: u8
-                width = await read_int(reader, 1)
-
                 # height: u8
-                height = await read_int(reader, 1)
-
                 # digit_count: u8
-                digit_count = await read_int(reader, 1)
-
                 # challenge_count: u8
-                challenge_count = await read_int(reader, 1)
-
                 # seed: u64
-                seed = await read_int(reader, 8)
+                width, height, digit_count, challenge_count, seed = _CMD_AUTH_LOGON_CHALLENGE_Server_1.unpack(await reader.readexactly(12))
 
         return CMD_AUTH_LOGON_CHALLENGE_Server(
             result=result,
@@ -248,39 +274,126 @@ class CMD_AUTH_LOGON_CHALLENGE_Server:
             seed=seed,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_LOGON_CHALLENGE_Server, int]:
+        server_public_key = None
+        generator_length = None
+        generator = None
+        large_safe_prime_length = None
+        large_safe_prime = None
+        salt = None
+        crc_salt = None
+        security_flag = None
+        pin_grid_seed = None
+        pin_salt = None
+        width = None
+        height = None
+        digit_count = None
+        challenge_count = None
+        seed = None
+        # protocol_version: u8
+        # result: LoginResult
+        _protocol_version, result = _CMD_AUTH_LOGON_CHALLENGE_Server_0.unpack_from(buf, _offset)
+        _offset += 2
+        result = LoginResult(result)
+
+        if result == LoginResult.SUCCESS:
+            # server_public_key: u8[32]
+            server_public_key, _offset = read_bytes_buffer(buf, _offset, 32)
+
+            # generator_length: u8
+            generator_length, _offset = read_int_buffer(buf, _offset, 1)
+
+            # generator: u8[generator_length]
+            generator, _offset = read_bytes_buffer(buf, _offset, generator_length)
+
+            # large_safe_prime_length: u8
+            large_safe_prime_length, _offset = read_int_buffer(buf, _offset, 1)
+
+            # large_safe_prime: u8[large_safe_prime_length]
+            large_safe_prime, _offset = read_bytes_buffer(buf, _offset, large_safe_prime_length)
+
+            # salt: u8[32]
+            salt, _offset = read_bytes_buffer(buf, _offset, 32)
+
+            # crc_salt: u8[16]
+            crc_salt, _offset = read_bytes_buffer(buf, _offset, 16)
+
+            # security_flag: SecurityFlag
+            security_flag, _offset = read_int_buffer(buf, _offset, 1)
+            security_flag = SecurityFlag(security_flag)
+
+            if SecurityFlag.PIN in security_flag:
+                # pin_grid_seed: u32
+                pin_grid_seed, _offset = read_int_buffer(buf, _offset, 4)
+
+                # pin_salt: u8[16]
+                pin_salt, _offset = read_bytes_buffer(buf, _offset, 16)
+
+            if SecurityFlag.MATRIX_CARD in security_flag:
+                # width: u8
+                # height: u8
+                # digit_count: u8
+                # challenge_count: u8
+                # seed: u64
+                width, height, digit_count, challenge_count, seed = _CMD_AUTH_LOGON_CHALLENGE_Server_1.unpack_from(buf, _offset)
+                _offset += 12
+
+        return CMD_AUTH_LOGON_CHALLENGE_Server(
+            result=result,
+            server_public_key=server_public_key,
+            generator=generator,
+            large_safe_prime=large_safe_prime,
+            salt=salt,
+            crc_salt=crc_salt,
+            security_flag=security_flag,
+            pin_grid_seed=pin_grid_seed,
+            pin_salt=pin_salt,
+            width=width,
+            height=height,
+            digit_count=digit_count,
+            challenge_count=challenge_count,
+            seed=seed,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [0]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BBB"
+        _data = [0, 0, self.result.value]
 
-        _fmt += 'BB'
-        _data.extend([0, self.result.value])
         if self.result == LoginResult.SUCCESS:
-            _fmt += f'{len(self.server_public_key)}BB{len(self.generator)}BB{len(self.large_safe_prime)}B{len(self.salt)}B{len(self.crc_salt)}BB'
-            _data.extend([*self.server_public_key, len(self.generator), *self.generator, len(self.large_safe_prime), *self.large_safe_prime, *self.salt, *self.crc_salt, self.security_flag.value])
+            _fmt += f'{len(self.server_public_key)}sB{len(self.generator)}sB{len(self.large_safe_prime)}s{len(self.salt)}s{len(self.crc_salt)}sB'
+            _data.extend([bytes(self.server_public_key), len(self.generator), bytes(self.generator), len(self.large_safe_prime), bytes(self.large_safe_prime), bytes(self.salt), bytes(self.crc_salt), self.security_flag.value])
             if SecurityFlag.PIN in self.security_flag:
-                _fmt += f'I{len(self.pin_salt)}B'
-                _data.extend([self.pin_grid_seed, *self.pin_salt])
+                _fmt += f'I{len(self.pin_salt)}s'
+                _data.extend([self.pin_grid_seed, bytes(self.pin_salt)])
             if SecurityFlag.MATRIX_CARD in self.security_flag:
                 _fmt += 'BBBBQ'
                 _data.extend([self.width, self.height, self.digit_count, self.challenge_count, self.seed])
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+        return _fmt, _data
 
 
-@dataclasses.dataclass
+@slots_dataclass
 class CMD_AUTH_LOGON_PROOF_Client:
-    client_public_key: typing.List[int]
-    client_proof: typing.List[int]
-    crc_hash: typing.List[int]
+    client_public_key: bytes
+    client_proof: bytes
+    crc_hash: bytes
     telemetry_keys: typing.List[TelemetryKey]
     security_flag: SecurityFlag
-    pin_salt: typing.Optional[typing.List[int]] = None
-    pin_hash: typing.Optional[typing.List[int]] = None
-    matrix_card_proof: typing.Optional[typing.List[int]] = None
+    pin_salt: typing.Optional[bytes] = None
+    pin_hash: typing.Optional[bytes] = None
+    matrix_card_proof: typing.Optional[bytes] = None
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_LOGON_PROOF_Client:
@@ -288,19 +401,13 @@ class CMD_AUTH_LOGON_PROOF_Client:
         pin_hash = None
         matrix_card_proof = None
         # client_public_key: u8[32]
-        client_public_key = []
-        for _ in range(0, 32):
-            client_public_key.append(await read_int(reader, 1))
+        client_public_key = await reader.readexactly(32)
 
         # client_proof: u8[20]
-        client_proof = []
-        for _ in range(0, 20):
-            client_proof.append(await read_int(reader, 1))
+        client_proof = await reader.readexactly(20)
 
         # crc_hash: u8[20]
-        crc_hash = []
-        for _ in range(0, 20):
-            crc_hash.append(await read_int(reader, 1))
+        crc_hash = await reader.readexactly(20)
 
         # number_of_telemetry_keys: u8
         number_of_telemetry_keys = await read_int(reader, 1)
@@ -315,20 +422,14 @@ class CMD_AUTH_LOGON_PROOF_Client:
 
         if SecurityFlag.PIN in security_flag:
             # pin_salt: u8[16]
-            pin_salt = []
-            for _ in range(0, 16):
-                pin_salt.append(await read_int(reader, 1))
+            pin_salt = await reader.readexactly(16)
 
             # pin_hash: u8[20]
-            pin_hash = []
-            for _ in range(0, 20):
-                pin_hash.append(await read_int(reader, 1))
+            pin_hash = await reader.readexactly(20)
 
         if SecurityFlag.MATRIX_CARD in security_flag:
             # matrix_card_proof: u8[20]
-            matrix_card_proof = []
-            for _ in range(0, 20):
-                matrix_card_proof.append(await read_int(reader, 1))
+            matrix_card_proof = await reader.readexactly(20)
 
         return CMD_AUTH_LOGON_PROOF_Client(
             client_public_key=client_public_key,
@@ -341,12 +442,71 @@ class CMD_AUTH_LOGON_PROOF_Client:
             matrix_card_proof=matrix_card_proof,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_LOGON_PROOF_Client, int]:
+        pin_salt = None
+        pin_hash = None
+        matrix_card_proof = None
+        # client_public_key: u8[32]
+        client_public_key, _offset = read_bytes_buffer(buf, _offset, 32)
+
+        # client_proof: u8[20]
+        client_proof, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        # crc_hash: u8[20]
+        crc_hash, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        # number_of_telemetry_keys: u8
+        number_of_telemetry_keys, _offset = read_int_buffer(buf, _offset, 1)
+
+        # telemetry_keys: TelemetryKey[number_of_telemetry_keys]
+        telemetry_keys = []
+        for _ in range(0, number_of_telemetry_keys):
+            _element, _offset = TelemetryKey.from_buffer(buf, _offset)
+            telemetry_keys.append(_element)
+
+        # security_flag: SecurityFlag
+        security_flag, _offset = read_int_buffer(buf, _offset, 1)
+        security_flag = SecurityFlag(security_flag)
+
+        if SecurityFlag.PIN in security_flag:
+            # pin_salt: u8[16]
+            pin_salt, _offset = read_bytes_buffer(buf, _offset, 16)
+
+            # pin_hash: u8[20]
+            pin_hash, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        if SecurityFlag.MATRIX_CARD in security_flag:
+            # matrix_card_proof: u8[20]
+            matrix_card_proof, _offset = read_bytes_buffer(buf, _offset, 20)
+
+        return CMD_AUTH_LOGON_PROOF_Client(
+            client_public_key=client_public_key,
+            client_proof=client_proof,
+            crc_hash=crc_hash,
+            telemetry_keys=telemetry_keys,
+            security_flag=security_flag,
+            pin_salt=pin_salt,
+            pin_hash=pin_hash,
+            matrix_card_proof=matrix_card_proof,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [1]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = f"<B{len(self.client_public_key)}s{len(self.client_proof)}s{len(self.crc_hash)}sB"
+        _data = [1, bytes(self.client_public_key), bytes(self.client_proof), bytes(self.crc_hash), len(self.telemetry_keys)]
 
-        _fmt += f'{len(self.client_public_key)}B{len(self.client_proof)}B{len(self.crc_hash)}BB'
-        _data.extend([*self.client_public_key, *self.client_proof, *self.crc_hash, len(self.telemetry_keys)])
         # telemetry_keys: TelemetryKey[number_of_telemetry_keys]
         for i in self.telemetry_keys:
             _fmt, _data = i.write(_fmt, _data)
@@ -356,23 +516,21 @@ class CMD_AUTH_LOGON_PROOF_Client:
         _data.append(self.security_flag.value)
 
         if SecurityFlag.PIN in self.security_flag:
-            _fmt += f'{len(self.pin_salt)}B{len(self.pin_hash)}B'
-            _data.extend([*self.pin_salt, *self.pin_hash])
+            _fmt += f'{len(self.pin_salt)}s{len(self.pin_hash)}s'
+            _data.extend([bytes(self.pin_salt), bytes(self.pin_hash)])
         if SecurityFlag.MATRIX_CARD in self.security_flag:
-            _fmt += f'{len(self.matrix_card_proof)}B'
-            _data.extend([*self.matrix_card_proof])
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+            _fmt += f'{len(self.matrix_card_proof)}s'
+            _data.append(bytes(self.matrix_card_proof))
+        return _fmt, _data
+
+
+_CMD_AUTH_LOGON_PROOF_Server_0 = struct.Struct("<IH")
 
 
-@dataclasses.dataclass
+@slots_dataclass
 class CMD_AUTH_LOGON_PROOF_Server:
     result: LoginResult
-    server_proof: typing.Optional[typing.List[int]] = None
+    server_proof: typing.Optional[bytes] = None
     hardware_survey_id: typing.Optional[int] = None
     unknown: typing.Optional[int] = None
 
@@ -386,15 +544,11 @@ class CMD_AUTH_LOGON_PROOF_Server:
 
         if result == LoginResult.SUCCESS:
             # server_proof: u8[20]
-            server_proof = []
-            for _ in range(0, 20):
-                server_proof.append(await read_int(reader, 1))
+            server_proof = await reader.readexactly(20)
 
             # hardware_survey_id: u32
-            hardware_survey_id = await read_int(reader, 4)
-
             # unknown: u16
-            unknown = await read_int(reader, 2)
+            hardware_survey_id, unknown = _CMD_AUTH_LOGON_PROOF_Server_0.unpack(await reader.readexactly(6))
 
         return CMD_AUTH_LOGON_PROOF_Server(
             result=result,
@@ -403,67 +557,113 @@ class CMD_AUTH_LOGON_PROOF_Server:
             unknown=unknown,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [1]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_LOGON_PROOF_Server, int]:
+        server_proof = None
+        hardware_survey_id = None
+        unknown = None
+        # result: LoginResult
+        result, _offset = read_int_buffer(buf, _offset, 1)
+        result = LoginResult(result)
 
-        _fmt += 'B'
-        _data.append(self.result.value)
-        if self.result == LoginResult.SUCCESS:
-            _fmt += f'{len(self.server_proof)}BIH'
-            _data.extend([*self.server_proof, self.hardware_survey_id, self.unknown])
-        _data = struct.pack(_fmt, *_data)
+        if result == LoginResult.SUCCESS:
+            # server_proof: u8[20]
+            server_proof, _offset = read_bytes_buffer(buf, _offset, 20)
+
+            # hardware_survey_id: u32
+            # unknown: u16
+            hardware_survey_id, unknown = _CMD_AUTH_LOGON_PROOF_Server_0.unpack_from(buf, _offset)
+            _offset += 6
+
+        return CMD_AUTH_LOGON_PROOF_Server(
+            result=result,
+            server_proof=server_proof,
+            hardware_survey_id=hardware_survey_id,
+            unknown=unknown,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _fmt, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            struct.pack_into(_fmt, writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BB"
+        _data = [1, self.result.value]
+
+        if self.result == LoginResult.SUCCESS:
+            _fmt += f'{len(self.server_proof)}sIH'
+            _data.extend([bytes(self.server_proof), self.hardware_survey_id, self.unknown])
+        return _fmt, _data
+
 
+_CMD_AUTH_RECONNECT_PROOF_Server_0 = struct.Struct("<BH")
+_CMD_AUTH_RECONNECT_PROOF_Server_write = struct.Struct("<BBH")
 
-@dataclasses.dataclass
+
+@slots_dataclass
 class CMD_AUTH_RECONNECT_PROOF_Server:
     result: LoginResult
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_AUTH_RECONNECT_PROOF_Server:
         # result: LoginResult
-        result = LoginResult(await read_int(reader, 1))
-
         # padding: u16
-        _padding = await read_int(reader, 2)
+        result, _padding = _CMD_AUTH_RECONNECT_PROOF_Server_0.unpack(await reader.readexactly(3))
+        result = LoginResult(result)
 
         return CMD_AUTH_RECONNECT_PROOF_Server(
             result=result,
         )
 
-    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [3]
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_AUTH_RECONNECT_PROOF_Server, int]:
+        # result: LoginResult
+        # padding: u16
+        result, _padding = _CMD_AUTH_RECONNECT_PROOF_Server_0.unpack_from(buf, _offset)
+        _offset += 3
+        result = LoginResult(result)
 
-        _fmt += 'BH'
-        _data.extend([self.result.value, 0])
-        _data = struct.pack(_fmt, *_data)
+        return CMD_AUTH_RECONNECT_PROOF_Server(
+            result=result,
+        ), _offset
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
+        _struct, _data = self._write_fmt()
         if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
+            _struct.pack_into(writer, 0, *_data)
             return
-        writer.write(_data)
+        writer.write(_struct.pack(*_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _struct, _data = self._write_fmt()
+        _struct.pack_into(buf, offset, *_data)
+        return offset + _struct.size
+
+    def _write_fmt(self):
+        return _CMD_AUTH_RECONNECT_PROOF_Server_write, [3, self.result.value, 0]
+
 
+_CMD_REALM_LIST_Server_0 = struct.Struct("<HIB")
 
-@dataclasses.dataclass
+
+@slots_dataclass
 class CMD_REALM_LIST_Server:
     realms: typing.List[Realm]
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_REALM_LIST_Server:
         # size: u16
-        _size = await read_int(reader, 2)
-
         # header_padding: u32
-        _header_padding = await read_int(reader, 4)
-
         # number_of_realms: u8
-        number_of_realms = await read_int(reader, 1)
+        _size, _header_padding, number_of_realms = _CMD_REALM_LIST_Server_0.unpack(await reader.readexactly(7))
 
         # realms: Realm[number_of_realms]
         realms = []
@@ -477,12 +677,43 @@ class CMD_REALM_LIST_Server:
             realms=realms,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_REALM_LIST_Server, int]:
+        # size: u16
+        # header_padding: u32
+        # number_of_realms: u8
+        _size, _header_padding, number_of_realms = _CMD_REALM_LIST_Server_0.unpack_from(buf, _offset)
+        _offset += 7
+
+        # realms: Realm[number_of_realms]
+        realms = []
+        for _ in range(0, number_of_realms):
+            _element, _offset = Realm.from_buffer(buf, _offset)
+            realms.append(_element)
+
+        # footer_padding: u16
+        _footer_padding, _offset = read_int_buffer(buf, _offset, 2)
+
+        return CMD_REALM_LIST_Server(
+            realms=realms,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [16]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BHIB"
+        _data = [16, self.size(), 0, len(self.realms)]
 
-        _fmt += 'HIB'
-        _data.extend([self.size(), 0, len(self.realms)])
         # realms: Realm[number_of_realms]
         for i in self.realms:
             _fmt, _data = i.write(_fmt, _data)
@@ -491,12 +722,7 @@ class CMD_REALM_LIST_Server:
         _fmt += 'H'
         _data.append(0)
 
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+        return _fmt, _data
 
     def size(self) -> int:
         return 7 + sum([i.size() for i in self.realms])
@@ -514,6 +740,18 @@ ClientOpcode = typing.Union[
 ]
 
 
+client_opcodes: dict[int, ClientOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Client,
+    0x01: CMD_AUTH_LOGON_PROOF_Client,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Client,
+    0x03: CMD_AUTH_RECONNECT_PROOF_Client,
+    0x10: CMD_REALM_LIST_Client,
+    0x32: CMD_XFER_ACCEPT,
+    0x33: CMD_XFER_RESUME,
+    0x34: CMD_XFER_CANCEL,
+}
+
+
 async def read_client_opcode(reader: asyncio.StreamReader) -> typing.Optional[ClientOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
@@ -555,6 +793,17 @@ ServerOpcode = typing.Union[
 ]
 
 
+server_opcodes: dict[int, ServerOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Server,
+    0x01: CMD_AUTH_LOGON_PROOF_Server,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Server,
+    0x03: CMD_AUTH_RECONNECT_PROOF_Server,
+    0x10: CMD_REALM_LIST_Server,
+    0x30: CMD_XFER_INITIATE,
+    0x31: CMD_XFER_DATA,
+}
+
+
 async def read_server_opcode(reader: asyncio.StreamReader) -> typing.Optional[ServerOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
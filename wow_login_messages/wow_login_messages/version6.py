@@ -5,11 +5,19 @@ import enum
 import struct
 import typing
 
+from .util import LoginFrameDecoder
 from .util import read_string
+from .util import read_string_buffer
+from .util import slots_dataclass
 from .util import read_bool
 from .util import read_int
 from .util import read_cstring
 from .util import read_float
+from .util import read_bool_buffer
+from .util import read_int_buffer
+from .util import read_cstring_buffer
+from .util import read_float_buffer
+from .util import read_bytes_buffer
 
 from .all import Locale
 from .version2 import LoginResult
@@ -69,20 +77,19 @@ __all__ = [
     "CMD_XFER_CANCEL",
     ]
 
-@dataclasses.dataclass
+_CMD_REALM_LIST_Server_0 = struct.Struct("<HIH")
+
+
+@slots_dataclass
 class CMD_REALM_LIST_Server:
     realms: typing.List[Realm]
 
     @staticmethod
     async def read(reader: asyncio.StreamReader) -> CMD_REALM_LIST_Server:
         # size: u16
-        _size = await read_int(reader, 2)
-
         # header_padding: u32
-        _header_padding = await read_int(reader, 4)
-
         # number_of_realms: u16
-        number_of_realms = await read_int(reader, 2)
+        _size, _header_padding, number_of_realms = _CMD_REALM_LIST_Server_0.unpack(await reader.readexactly(8))
 
         # realms: Realm[number_of_realms]
         realms = []
@@ -96,12 +103,43 @@ class CMD_REALM_LIST_Server:
             realms=realms,
         )
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[CMD_REALM_LIST_Server, int]:
+        # size: u16
+        # header_padding: u32
+        # number_of_realms: u16
+        _size, _header_padding, number_of_realms = _CMD_REALM_LIST_Server_0.unpack_from(buf, _offset)
+        _offset += 8
+
+        # realms: Realm[number_of_realms]
+        realms = []
+        for _ in range(0, number_of_realms):
+            _element, _offset = Realm.from_buffer(buf, _offset)
+            realms.append(_element)
+
+        # footer_padding: u16
+        _footer_padding, _offset = read_int_buffer(buf, _offset, 2)
+
+        return CMD_REALM_LIST_Server(
+            realms=realms,
+        ), _offset
+
     def write(self, writer: typing.Union[asyncio.StreamWriter, bytearray]):
-        _fmt = '<B' # opcode
-        _data = [16]
+        _fmt, _data = self._write_fmt()
+        if isinstance(writer, bytearray):
+            struct.pack_into(_fmt, writer, 0, *_data)
+            return
+        writer.write(struct.pack(_fmt, *_data))
+
+    def write_into(self, buf: bytearray, offset: int) -> int:
+        _fmt, _data = self._write_fmt()
+        struct.pack_into(_fmt, buf, offset, *_data)
+        return offset + struct.calcsize(_fmt)
+
+    def _write_fmt(self):
+        _fmt = "<BHIH"
+        _data = [16, self.size(), 0, len(self.realms)]
 
-        _fmt += 'HIH'
-        _data.extend([self.size(), 0, len(self.realms)])
         # realms: Realm[number_of_realms]
         for i in self.realms:
             _fmt, _data = i.write(_fmt, _data)
@@ -110,12 +148,7 @@ class CMD_REALM_LIST_Server:
         _fmt += 'H'
         _data.append(0)
 
-        _data = struct.pack(_fmt, *_data)
-        if isinstance(writer, bytearray):
-            for i in range(0, len(_data)):
-                writer[i] = _data[i]
-            return
-        writer.write(_data)
+        return _fmt, _data
 
     def size(self) -> int:
         return 8 + sum([i.size() for i in self.realms])
@@ -133,6 +166,18 @@ ClientOpcode = typing.Union[
 ]
 
 
+client_opcodes: dict[int, ClientOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Client,
+    0x01: CMD_AUTH_LOGON_PROOF_Client,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Client,
+    0x03: CMD_AUTH_RECONNECT_PROOF_Client,
+    0x10: CMD_REALM_LIST_Client,
+    0x32: CMD_XFER_ACCEPT,
+    0x33: CMD_XFER_RESUME,
+    0x34: CMD_XFER_CANCEL,
+}
+
+
 async def read_client_opcode(reader: asyncio.StreamReader) -> typing.Optional[ClientOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
@@ -174,6 +219,17 @@ ServerOpcode = typing.Union[
 ]
 
 
+server_opcodes: dict[int, ServerOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Server,
+    0x01: CMD_AUTH_LOGON_PROOF_Server,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Server,
+    0x03: CMD_AUTH_RECONNECT_PROOF_Server,
+    0x10: CMD_REALM_LIST_Server,
+    0x30: CMD_XFER_INITIATE,
+    0x31: CMD_XFER_DATA,
+}
+
+
 async def read_server_opcode(reader: asyncio.StreamReader) -> typing.Optional[ServerOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
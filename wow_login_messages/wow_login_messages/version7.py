@@ -5,11 +5,19 @@ import enum
 import struct
 import typing
 
+from .util import LoginFrameDecoder
 from .util import read_string
+from .util import read_string_buffer
+from .util import slots_dataclass
 from .util import read_bool
 from .util import read_int
 from .util import read_cstring
 from .util import read_float
+from .util import read_bool_buffer
+from .util import read_int_buffer
+from .util import read_cstring_buffer
+from .util import read_float_buffer
+from .util import read_bytes_buffer
 
 from .all import Locale
 from .version2 import LoginResult
@@ -82,6 +90,18 @@ ClientOpcode = typing.Union[
 ]
 
 
+client_opcodes: dict[int, ClientOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Client,
+    0x01: CMD_AUTH_LOGON_PROOF_Client,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Client,
+    0x03: CMD_AUTH_RECONNECT_PROOF_Client,
+    0x10: CMD_REALM_LIST_Client,
+    0x32: CMD_XFER_ACCEPT,
+    0x33: CMD_XFER_RESUME,
+    0x34: CMD_XFER_CANCEL,
+}
+
+
 async def read_client_opcode(reader: asyncio.StreamReader) -> typing.Optional[ClientOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
@@ -123,6 +143,17 @@ ServerOpcode = typing.Union[
 ]
 
 
+server_opcodes: dict[int, ServerOpcode] = {
+    0x00: CMD_AUTH_LOGON_CHALLENGE_Server,
+    0x01: CMD_AUTH_LOGON_PROOF_Server,
+    0x02: CMD_AUTH_RECONNECT_CHALLENGE_Server,
+    0x03: CMD_AUTH_RECONNECT_PROOF_Server,
+    0x10: CMD_REALM_LIST_Server,
+    0x30: CMD_XFER_INITIATE,
+    0x31: CMD_XFER_DATA,
+}
+
+
 async def read_server_opcode(reader: asyncio.StreamReader) -> typing.Optional[ServerOpcode]:
     opcode = int.from_bytes(await reader.readexactly(1), 'little')
     if opcode == 0x00:
@@ -0,0 +1,158 @@
+import random
+import struct
+import unittest
+
+import wow_world_messages.vanilla as vanilla
+import wow_world_messages.tbc as tbc
+import wow_world_messages.wrath as wrath
+
+
+def round_trip(version, update_mask) -> vanilla.UpdateMask:
+    fmt, data = update_mask.write("<", [])
+    buf = struct.pack(fmt, *data)
+    mask, offset = version.UpdateMask.from_buffer(buf, 0)
+    assert offset == len(buf) == update_mask.size()
+    return mask
+
+
+class UpdateMaskArrayTests(unittest.TestCase):
+    def test_object_type_lengths(self):
+        for version in (vanilla, tbc, wrath):
+            unit = version.UpdateMaskArray.from_object_type(version.ObjectType.UNIT)
+            player = version.UpdateMaskArray.from_object_type(version.ObjectType.PLAYER)
+
+            self.assertLess(version.UpdateMaskValue.UNIT_HEALTH, len(unit.values))
+            self.assertLess(len(unit.values), len(player.values))
+
+            with self.assertRaises(IndexError):
+                unit.set_int(len(unit.values), 1)
+
+    def test_write(self):
+        for keys in ([], [vanilla.UpdateMaskValue.UNIT_HEALTH], [0, 1, 2, 40, vanilla.UpdateMaskValue.UNIT_HEALTH]):
+            update_mask = vanilla.UpdateMaskArray.from_object_type(vanilla.ObjectType.UNIT)
+            for key in keys:
+                update_mask.set_int(key, key + 1)
+
+            self.assertEqual(vanilla.UpdateMask(fields={key: key + 1 for key in keys}), round_trip(vanilla, update_mask))
+
+    def test_from_update_mask(self):
+        mask = vanilla.UpdateMask(fields={0: 1, 1: 2, 22: 3})
+        update_mask = vanilla.UpdateMaskArray.from_update_mask(mask)
+
+        self.assertEqual(23, len(update_mask.values))
+        self.assertEqual(mask, update_mask.to_update_mask())
+
+
+class UpdateMaskFieldsTests(unittest.TestCase):
+    def test_round_trip(self):
+        for version in (vanilla, tbc, wrath):
+            fields = version.UpdateMaskFields
+            values = [
+                (fields.OBJECT_GUID, 0x0102030405060708),
+                (fields.OBJECT_SCALE_X, 1.5),
+                (fields.UNIT_BYTES_0, (1, 2, 3, 4)),
+                (fields.PLAYER_SKILL_INFO_0_SKILL_0, 164),
+                (fields.PLAYER_SKILL_INFO_0_SKILL_STEP_1, 3),
+            ]
+
+            for update_mask in (
+                    version.UpdateMask(fields={}),
+                    version.UpdateMaskArray.from_object_type(version.ObjectType.PLAYER),
+            ):
+                for field, value in values:
+                    if isinstance(value, tuple):
+                        update_mask.set(field, *value)
+                    else:
+                        update_mask.set(field, value)
+
+                mask = round_trip(version, update_mask)
+                for m in (mask, version.UpdateMaskArray.from_update_mask(mask)):
+                    for field, value in values:
+                        self.assertEqual(value, m.get(field))
+
+    def test_raw_float_fallback(self):
+        fields = vanilla.UpdateMaskFields
+        unit = round_trip(vanilla, vanilla.UpdateMask(fields={0: 7, 2: 0x9, 4: 1.5, 10: 8, 129: 2.5}))
+
+        self.assertEqual(7, unit.get(fields.OBJECT_GUID))
+        self.assertEqual(1.5, unit.get(fields.OBJECT_SCALE_X))
+        self.assertEqual(8, unit.fields[fields.UNIT_CHARMEDBY.offset])
+        self.assertEqual(2.5, unit.get(fields.UNIT_BOUNDINGRADIUS))
+
+        # The same word is a float for game objects, even when an int was assigned to it
+        game_object = round_trip(vanilla, vanilla.UpdateMask(fields={2: 0x21, 10: 1, 11: 0.5}))
+        self.assertEqual((1.0, 0.5, 0.0, 0.0), game_object.get(fields.GAME_OBJECT_ROTATION))
+
+    def test_raw_float_fallback_delta(self):
+        previous = vanilla.UpdateMask(fields={2: 0x9, 4: 1.0, 129: 2.0})
+        current = vanilla.UpdateMask(fields={2: 0x9, 4: 1.0, 129: 2.5})
+
+        delta = current.delta(previous)
+        self.assertEqual(vanilla.UpdateMask(fields={129: 2.5}), delta)
+        self.assertEqual(2.5, round_trip(vanilla, delta).get(vanilla.UpdateMaskFields.UNIT_BOUNDINGRADIUS))
+
+        with self.assertRaises(Exception):
+            vanilla.UpdateMask(fields={129: 2.5}).write("<", [])
+
+
+def decode_update_objects(version, messages) -> list:
+    objects = []
+    for message in messages:
+        m = version.server_opcodes[message.opcode].from_buffer(message.body, 0, len(message.body))[0]
+        objects.extend(m.objects)
+
+    return objects
+
+
+def values_object(version, guid: int, fields: dict):
+    return version.Object(update_type=version.UpdateType.VALUES, guid1=guid, mask1=version.UpdateMask(fields=fields))
+
+
+class SplitUpdateObject(unittest.TestCase):
+    def test_split(self):
+        for version in (vanilla, tbc, wrath):
+            objects = [values_object(version, i + 1, {key: i * key + 1 for key in range(0, 100, 2)}) for i in range(30)]
+
+            for compression_threshold in (1 << 32, 0):
+                messages = version.split_update_object(objects, 2000, compression_threshold)
+
+                self.assertGreater(len(messages), 1)
+                for message in messages:
+                    self.assertLessEqual(len(message.body), 2000)
+                self.assertEqual(objects, decode_update_objects(version, messages))
+
+    def test_object_too_large(self):
+        rng = random.Random(0)
+        o = values_object(vanilla, 1, {key: rng.getrandbits(32) for key in range(0, 500)})
+
+        for compression_threshold in (1 << 32, 0):
+            with self.assertRaises(Exception):
+                vanilla.split_update_object([o], 1000, compression_threshold)
+
+    def test_empty(self):
+        self.assertEqual([], vanilla.split_update_object([]))
+
+
+class UpdateMaskDelta(unittest.TestCase):
+    def test_delta(self):
+        previous = vanilla.UpdateMask(fields={0: 1, 1: 2, 2: 3, 3: 0})
+        current = vanilla.UpdateMask(fields={0: 1, 1: 5, 4: 6})
+
+        # 1 changed, 4 added, 2 removed and sent as 0, 0 unchanged and 3 was already 0
+        self.assertEqual(vanilla.UpdateMask(fields={1: 5, 4: 6, 2: 0}), current.delta(previous))
+        self.assertEqual(vanilla.UpdateMask(fields={}), current.delta(current))
+
+    def test_update_object_deltas(self):
+        previous = vanilla.UpdateMask(fields={0: 1, 1: 2})
+        current = vanilla.UpdateMask(fields={0: 1, 1: 3})
+
+        messages = vanilla.update_object_deltas([(1, previous, current), (2, current, current), (3, current, previous)])
+        self.assertEqual(
+            [values_object(vanilla, 1, {1: 3}), values_object(vanilla, 3, {1: 2})],
+            decode_update_objects(vanilla, messages),
+        )
+        self.assertEqual([], vanilla.update_object_deltas([(1, current, current)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,385 @@
+import asyncio
+import concurrent.futures
+import struct
+import unittest
+
+import wow_srp
+
+import wow_world_messages.vanilla as vanilla
+import wow_world_messages.wrath as wrath
+
+
+def server_frame(opcode: int, body: bytes) -> bytes:
+    return struct.pack(">H", len(body) + 2) + struct.pack("<H", opcode) + body
+
+
+def client_frame(opcode: int, body: bytes) -> bytes:
+    return struct.pack(">H", len(body) + 4) + struct.pack("<I", opcode) + body
+
+
+def stream_reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+PING = vanilla.CMSG_PING(sequence_id=1, round_time_in_ms=2)
+PING_FRAME = client_frame(0x01DC, struct.pack("<II", 1, 2))
+UNKNOWN_FRAME = client_frame(0x7FFF, b"abc")
+
+
+class TruncatedBodies(unittest.IsolatedAsyncioTestCase):
+    async def test_fixed_bytes(self):
+        body = struct.pack("<II", 1, 2) + b"\x01" * 5
+
+        with self.assertRaises(struct.error):
+            wrath.SMSG_AUTH_CHALLENGE.from_buffer(body, 0, len(body))
+
+        with self.assertRaises(struct.error):
+            await wrath.read_server_opcodes_unencrypted(stream_reader(server_frame(0x01EC, body)))
+
+    def test_endless_bytes(self):
+        body = b"\x01" * 2
+
+        with self.assertRaises(struct.error):
+            vanilla.SMSG_WARDEN_DATA.from_buffer(body, 0, len(body) + 4)
+
+    def test_compressed_body(self):
+        body = struct.pack("<I", 100) + b"\x78\x9c"
+
+        with self.assertRaises(struct.error):
+            vanilla.SMSG_COMPRESSED_UPDATE_OBJECT.from_buffer(body, 0, len(body) + 10)
+
+
+class CStrings(unittest.TestCase):
+    def test_memoryview(self):
+        for name in ("", "a" * 255, "a" * 256, "a" * 1000):
+            frame = client_frame(0x0009, name.encode() + b"\x00")
+            decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+
+            self.assertEqual([vanilla.CMSG_TELEPORT_TO_UNIT(name=name)], decoder.feed(frame + PING_FRAME)[:1])
+
+    def test_missing_terminator(self):
+        for name in ("abc", "a" * 256, "a" * 1000):
+            decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+
+            with self.assertRaisesRegex(IndexError, "missing cstring terminator"):
+                decoder.feed(client_frame(0x0009, name.encode()) + PING_FRAME)
+
+
+class OpcodeFiltering(unittest.IsolatedAsyncioTestCase):
+    async def test_filtered_opcode(self):
+        reader = stream_reader(PING_FRAME + PING_FRAME)
+
+        r = await vanilla.read_client_opcodes_unencrypted(reader, opcodes={0x0009})
+        self.assertEqual(vanilla.RawPacket(0x01DC, struct.pack("<II", 1, 2)), r)
+        self.assertEqual(PING, await vanilla.read_client_opcodes_unencrypted(reader, opcodes={0x01DC}))
+
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True, opcodes={0x0009})
+        self.assertEqual([r, r], decoder.feed(PING_FRAME + PING_FRAME))
+
+    async def test_raw_unknown_opcode(self):
+        reader = stream_reader(UNKNOWN_FRAME + PING_FRAME)
+
+        r = await vanilla.read_client_opcodes_unencrypted(reader, raw_unknown_opcodes=True)
+        self.assertEqual(vanilla.RawPacket(0x7FFF, b"abc"), r)
+        self.assertEqual(PING, await vanilla.read_client_opcodes_unencrypted(reader, raw_unknown_opcodes=True))
+        self.assertTrue(reader.at_eof())
+
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True, raw_unknown_opcodes=True)
+        data = UNKNOWN_FRAME + PING_FRAME
+        self.assertEqual([r, PING], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
+
+    async def test_unknown_opcode(self):
+        with self.assertRaises(KeyError):
+            await vanilla.read_client_opcodes_unencrypted(stream_reader(UNKNOWN_FRAME + PING_FRAME))
+
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        with self.assertRaises(KeyError):
+            decoder.feed(PING_FRAME + UNKNOWN_FRAME + PING_FRAME)
+
+        # The unknown frame is skipped and the ping before it is kept for the next feed
+        self.assertEqual([PING, PING], decoder.feed(b""))
+        self.assertEqual([PING], decoder.feed(PING_FRAME))
+
+
+class LazyMessages(unittest.IsolatedAsyncioTestCase):
+    async def test_fields_named_like_internals(self):
+        chat = vanilla.SMSG_MESSAGECHAT(
+            chat_type=vanilla.ChatType.SAY,
+            language=vanilla.Language.COMMON,
+            message="hello",
+            tag=vanilla.PlayerChatTag.NONE,
+            speech_bubble_credit=1,
+            chat_credit=2,
+        )
+        server_message = vanilla.SMSG_SERVER_MESSAGE(message_type=vanilla.ServerMessageType.SHUTDOWN_TIME, message="5:00")
+        messages = [chat, server_message]
+        data = b"".join(vanilla.EncodedMessage(m).header() + vanilla.EncodedMessage(m).body for m in messages)
+
+        reader = stream_reader(data)
+        lazy_messages = [await vanilla.read_server_opcodes_unencrypted(reader, lazy=True) for _ in messages]
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False, lazy=True)
+
+        for lazy_chat, lazy_server_message in (lazy_messages, decoder.feed(data)):
+            self.assertIsInstance(lazy_chat, vanilla.LazyMessage)
+            self.assertEqual("hello", lazy_chat.message)
+            self.assertEqual(vanilla.ChatType.SAY, lazy_chat.chat_type)
+            self.assertEqual(chat, lazy_chat._decode())
+
+            self.assertEqual(vanilla.ServerMessageType.SHUTDOWN_TIME, lazy_server_message.message_type)
+            self.assertEqual("5:00", lazy_server_message.message)
+
+
+def receive(protocol: vanilla.WorldProtocol, data: bytes):
+    buffer = protocol.get_buffer(len(data))
+    buffer[:len(data)] = data
+    protocol.buffer_updated(len(data))
+
+
+class MalformedFrames(unittest.TestCase):
+    def test_feed(self):
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([PING], decoder.feed(PING_FRAME))
+
+        with self.assertRaises(IndexError):
+            decoder.feed(client_frame(0x0009, b"AB") + PING_FRAME)
+
+        self.assertEqual([PING], decoder.feed(b""))
+        self.assertEqual([], decoder.feed(b""))
+
+    def test_protocol(self):
+        messages = []
+        protocol = vanilla.WorldProtocol(
+            vanilla.WorldFrameDecoder(vanilla.client_opcodes, True),
+            lambda _, message: messages.append(message),
+        )
+        receive(protocol, PING_FRAME)
+        self.assertEqual([PING], messages)
+
+        with self.assertRaises(IndexError):
+            receive(protocol, client_frame(0x0009, b"AB"))
+
+        receive(protocol, PING_FRAME)
+        self.assertEqual([PING, PING], messages)
+
+    def test_encrypted_feed(self):
+        server, client = wrath_header_crypto()
+        pongs = [wrath.SMSG_PONG(sequence_id=i) for i in range(3)]
+        bad = wrath.EncodedMessage.from_body(0x01DD, b"AB")
+
+        data = encode_encrypted_server(pongs[0], server) + bad.header(server) + bad.body
+        data += encode_encrypted_server(pongs[1], server)
+
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False, client)
+        with self.assertRaises(struct.error):
+            decoder.feed(data)
+
+        # Headers are not decrypted twice, so the cipher stays in sync after the error
+        self.assertEqual(pongs, decoder.feed(encode_encrypted_server(pongs[2], server)))
+
+
+class WorldProtocolFrames(unittest.TestCase):
+    def test_split_frames(self):
+        messages = []
+        protocol = vanilla.WorldProtocol(
+            vanilla.WorldFrameDecoder(vanilla.client_opcodes, True),
+            lambda _, message: messages.append(message),
+            buffer_size=16,
+        )
+        teleport = client_frame(0x0009, b"ABC\x00")
+        data = (PING_FRAME + teleport) * 3
+        for i in range(0, len(data), 5):
+            receive(protocol, data[i:i + 5])
+
+        self.assertEqual([PING, vanilla.CMSG_TELEPORT_TO_UNIT(name="ABC")] * 3, messages)
+
+
+class RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class EncodeAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = RecordingExecutor()
+        vanilla.set_compression_executor(self.executor, threshold=1024)
+
+    def tearDown(self):
+        vanilla.set_compression_executor(None)
+        self.executor.shutdown()
+
+    async def test_uncompressed_message_stays_on_loop(self):
+        message = vanilla.SMSG_PONG(sequence_id=1)
+
+        self.assertEqual(vanilla.EncodedMessage(message).body, (await vanilla.encode_async(message)).body)
+        self.assertEqual(0, self.executor.submitted)
+
+    async def test_compressed_message_below_threshold(self):
+        message = vanilla.CMSG_UPDATE_ACCOUNT_DATA(vanilla.AccountDataType.GLOBAL_CONFIG_CACHE, b"a" * 100)
+
+        self.assertEqual(vanilla.EncodedMessage(message, True).body, (await vanilla.encode_async(message, True)).body)
+        self.assertEqual(0, self.executor.submitted)
+
+    async def test_compressed_message_above_threshold(self):
+        message = vanilla.CMSG_UPDATE_ACCOUNT_DATA(vanilla.AccountDataType.GLOBAL_CONFIG_CACHE, b"a" * 2048)
+
+        self.assertEqual(vanilla.EncodedMessage(message, True).body, (await vanilla.encode_async(message, True)).body)
+        self.assertEqual(1, self.executor.submitted)
+
+
+def wrath_header_crypto():
+    client_seed = wow_srp.WrathProofSeed()
+    server_seed = wow_srp.WrathProofSeed()
+    session_key = bytes(range(40))
+
+    client_proof, client = client_seed.into_client_header_crypto("A", session_key, server_seed.seed())
+    server = server_seed.into_server_header_crypto("A", session_key, client_proof, client_seed.seed())
+    return server, client
+
+
+def write_encrypted_server(message, header_crypto) -> bytes:
+    buf = bytearray(0x20000)
+    return bytes(buf[:message.write_encrypted_server_into(buf, 0, header_crypto)])
+
+
+def encode_encrypted_server(message, header_crypto) -> bytes:
+    encoded = wrath.EncodedMessage(message)
+    return encoded.header(header_crypto) + encoded.body
+
+
+class LargeServerHeader(unittest.IsolatedAsyncioTestCase):
+    async def test_encrypted(self):
+        large = wrath.SMSG_WARDEN_DATA(encrypted_data=bytes(range(256)) * 300)
+        small = wrath.SMSG_PONG(sequence_id=7)
+        messages = [small, large, small]
+
+        for encode in (write_encrypted_server, encode_encrypted_server):
+            server, client = wrath_header_crypto()
+            data = b"".join(encode(m, server) for m in messages)
+            self.assertEqual(8 + 5 + len(large.encrypted_data) + 8, len(data))
+
+            reader = stream_reader(data)
+            self.assertEqual(messages, [await wrath.read_server_opcodes_encrypted(reader, client) for _ in messages])
+            self.assertTrue(reader.at_eof())
+
+    async def test_batch_decoder(self):
+        large = wrath.SMSG_WARDEN_DATA(encrypted_data=bytes(range(256)) * 300)
+        small = wrath.SMSG_PONG(sequence_id=7)
+        messages = [small, large, wrath.EncodedMessage(large), small]
+
+        server, client = wrath_header_crypto()
+        batch = wrath.PacketBatch(server)
+        batch.extend(messages)
+        data = batch.flush()
+
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False, client)
+        decoded = [m for i in range(0, len(data), 1000) for m in decoder.feed(data[i:i + 1000])]
+        self.assertEqual([small, large, large, small], decoded)
+
+    async def test_unencrypted(self):
+        large = wrath.SMSG_WARDEN_DATA(encrypted_data=bytes(range(256)) * 300)
+        body = wrath.EncodedMessage(large).body
+        size = len(body) + 2
+        data = bytes([0x80 | size >> 16, size >> 8 & 0xFF, size & 0xFF]) + struct.pack("<H", 0x02E6) + body
+
+        self.assertEqual(large, await wrath.read_server_opcodes_unencrypted(stream_reader(data)))
+
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([large], [m for i in range(0, len(data), 7) for m in decoder.feed(data[i:i + 7])])
+
+    def test_body_over_u16(self):
+        large = wrath.SMSG_WARDEN_DATA(encrypted_data=bytes(0x12345))
+        server, client = wrath_header_crypto()
+
+        encoded = wrath.EncodedMessage(large)
+        header = encoded.header(server)
+        self.assertEqual(5, len(header))
+
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False, client)
+        self.assertEqual([large], decoder.feed(header + encoded.body))
+
+
+class Sink:
+    def __init__(self):
+        self.written = []
+
+    def write(self, data):
+        self.written.append(data)
+
+
+def wrath_heartbeat(timestamp: int, position: wrath.Vector3d) -> wrath.MSG_MOVE_HEARTBEAT:
+    info = wrath.MovementInfo(
+        flags=wrath.MovementFlags.FALLING,
+        timestamp=timestamp,
+        position=position,
+        orientation=0.5,
+        fall_time=1.0,
+        z_speed=2.0,
+        cos_angle=0.0,
+        sin_angle=1.0,
+        xy_speed=3.0,
+    )
+    return wrath.MSG_MOVE_HEARTBEAT(guid=0x1234567, info=info)
+
+
+class MessageTemplates(unittest.TestCase):
+    def test_fixed_message(self):
+        template = vanilla.SMSG_CLEAR_COOLDOWN(id=1, target=2).template()
+
+        template.patch(3)
+        self.assertEqual(vanilla.EncodedMessage(vanilla.SMSG_CLEAR_COOLDOWN(id=3, target=2)).body, template.body)
+        template.patch(target=4)
+        self.assertEqual(vanilla.EncodedMessage(vanilla.SMSG_CLEAR_COOLDOWN(id=3, target=4)).body, template.body)
+
+    def test_prefix_after_packed_guids(self):
+        message = vanilla.SMSG_ATTACKERSTATEUPDATE(
+            hit_info=vanilla.HitInfo.NORMAL_SWING,
+            attacker=0x1234,
+            target=0xFF00FF00FF,
+            total_damage=10,
+            damages=[vanilla.DamageInfo(1, 10.0, 10, 0, 0)],
+            damage_state=1,
+            unknown1=0,
+            spell_id=0,
+            blocked_amount=0,
+        )
+        template = message.template().patch(hit_info=vanilla.HitInfo.CRITICAL_HIT, total_damage=20)
+
+        message.hit_info = vanilla.HitInfo.CRITICAL_HIT
+        message.total_damage = 20
+        self.assertEqual(vanilla.EncodedMessage(message).body, template.body)
+
+    def test_nested_struct(self):
+        template = wrath_heartbeat(1, wrath.Vector3d(1.0, 2.0, 3.0)).template(True)
+        template.patch(info_timestamp=2, info_position=wrath.Vector3d(4.0, 5.0, 6.0))
+
+        expected = wrath.EncodedMessage(wrath_heartbeat(2, wrath.Vector3d(4.0, 5.0, 6.0)), True)
+        self.assertEqual(expected.header() + expected.body, template.header() + template.body)
+
+    def test_write_encrypted(self):
+        server, client = wrath_header_crypto()
+        template = wrath_heartbeat(0, wrath.Vector3d(0.0, 0.0, 0.0)).template()
+        sink = Sink()
+
+        messages = [wrath_heartbeat(i, wrath.Vector3d(float(i), 0.0, 0.0)) for i in range(3)]
+        for i in range(3):
+            template.patch(i, wrath.Vector3d(float(i), 0.0, 0.0)).write(sink, server)
+        template.write(sink)
+
+        # Earlier writes keep their contents after the template is patched again
+        data = b"".join(sink.written[:3])
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False, client)
+        self.assertEqual(messages, decoder.feed(data))
+        self.assertEqual(wrath.EncodedMessage(messages[2]).header() + template.body, sink.written[3])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,9 +44,23 @@ class CMSG_WORLD_TELEPORT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_WORLD_TELEPORT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_WORLD_TELEPORT, 0x0008, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(time=r.time, map=r.map, position=r.position, orientation=r.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -59,9 +73,23 @@ class CMSG_WORLD_TELEPORT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_WORLD_TELEPORT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_WORLD_TELEPORT, 0x0008, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(time=r.time, map=r.map, position=r.position, orientation=r.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_TELEPORT_TO_UNIT_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -76,10 +104,23 @@ class CMSG_TELEPORT_TO_UNIT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_TELEPORT_TO_UNIT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_TELEPORT_TO_UNIT, 0x0009, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_CREATE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -94,10 +135,23 @@ class CMSG_CHAR_CREATE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_CHAR_CREATE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_CHAR_CREATE, 0x0036, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_ENUM_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -112,9 +166,20 @@ class CMSG_CHAR_ENUM_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_CHAR_ENUM)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_CHAR_ENUM, 0x0037, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_DELETE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -129,9 +194,24 @@ class CMSG_CHAR_DELETE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_CHAR_DELETE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_CHAR_DELETE, 0x0038, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_CHAR_CREATE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -146,9 +226,24 @@ class SMSG_CHAR_CREATE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_CHAR_CREATE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_CHAR_CREATE, 0x003A, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(result=r.result).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_CHAR_ENUM_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -163,10 +258,23 @@ class SMSG_CHAR_ENUM_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_CHAR_ENUM)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_CHAR_ENUM, 0x003B, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_CHAR_DELETE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -181,9 +289,24 @@ class SMSG_CHAR_DELETE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_CHAR_DELETE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_CHAR_DELETE, 0x003C, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(result=r.result).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_PLAYER_LOGIN_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -198,9 +321,24 @@ class CMSG_PLAYER_LOGIN_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_PLAYER_LOGIN)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_PLAYER_LOGIN, 0x003D, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_NEW_WORLD_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -215,9 +353,23 @@ class SMSG_NEW_WORLD_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_NEW_WORLD)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_NEW_WORLD, 0x003E, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(map=r.map, position=r.position, orientation=r.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_TRANSFER_PENDING_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -232,10 +384,26 @@ class SMSG_TRANSFER_PENDING_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_TRANSFER_PENDING)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_TRANSFER_PENDING, 0x003F, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(map=r.map).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_CHARACTER_LOGIN_FAILED_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -250,9 +418,24 @@ class SMSG_CHARACTER_LOGIN_FAILED_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_CHARACTER_LOGIN_FAILED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_CHARACTER_LOGIN_FAILED, 0x0041, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(result=r.result).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_LOGIN_SETTIMESPEED_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -267,9 +450,24 @@ class SMSG_LOGIN_SETTIMESPEED_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_LOGIN_SETTIMESPEED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_LOGIN_SETTIMESPEED, 0x0042, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(datetime=r.datetime, timescale=r.timescale).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_PLAYER_LOGOUT_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -284,9 +482,20 @@ class CMSG_PLAYER_LOGOUT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_PLAYER_LOGOUT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_PLAYER_LOGOUT, 0x004A, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_LOGOUT_REQUEST_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -301,9 +510,20 @@ class CMSG_LOGOUT_REQUEST_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_LOGOUT_REQUEST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_LOGOUT_REQUEST, 0x004B, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_LOGOUT_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -318,9 +538,24 @@ class SMSG_LOGOUT_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_LOGOUT_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_LOGOUT_RESPONSE, 0x004C, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(result=r.result, speed=r.speed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_LOGOUT_COMPLETE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -335,9 +570,20 @@ class SMSG_LOGOUT_COMPLETE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_LOGOUT_COMPLETE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_LOGOUT_COMPLETE, 0x004D, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_NAME_QUERY_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -352,10 +598,26 @@ class SMSG_NAME_QUERY_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_NAME_QUERY_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_NAME_QUERY_RESPONSE, 0x0051, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -368,10 +630,26 @@ class SMSG_NAME_QUERY_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_NAME_QUERY_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_NAME_QUERY_RESPONSE, 0x0051, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_PET_NAME_QUERY_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -386,9 +664,24 @@ class CMSG_PET_NAME_QUERY_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_PET_NAME_QUERY)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_PET_NAME_QUERY, 0x0052, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(pet_number=r.pet_number, guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_PET_NAME_QUERY_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -403,10 +696,26 @@ class SMSG_PET_NAME_QUERY_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_PET_NAME_QUERY_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_PET_NAME_QUERY_RESPONSE, 0x0053, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(pet_number=r.pet_number).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_ITEM_QUERY_SINGLE_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -421,10 +730,26 @@ class SMSG_ITEM_QUERY_SINGLE_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_ITEM_QUERY_SINGLE_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_ITEM_QUERY_SINGLE_RESPONSE, 0x0058, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(item=r.item).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_CREATURE_QUERY_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -439,10 +764,26 @@ class SMSG_CREATURE_QUERY_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_CREATURE_QUERY_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_CREATURE_QUERY_RESPONSE, 0x0061, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(creature_entry=r.creature_entry).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_IGNORE_LIST_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -457,10 +798,23 @@ class SMSG_IGNORE_LIST_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_IGNORE_LIST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_IGNORE_LIST, 0x006B, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -473,10 +827,23 @@ class SMSG_IGNORE_LIST_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_IGNORE_LIST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_IGNORE_LIST, 0x006B, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_MESSAGECHAT_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -491,10 +858,26 @@ class CMSG_MESSAGECHAT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_MESSAGECHAT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_MESSAGECHAT, 0x0095, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(language=r.language).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_MESSAGECHAT_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -509,10 +892,26 @@ class SMSG_MESSAGECHAT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_MESSAGECHAT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_MESSAGECHAT, 0x0096, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(language=r.language).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_JOIN_CHANNEL_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -527,10 +926,23 @@ class CMSG_JOIN_CHANNEL_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_JOIN_CHANNEL)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_JOIN_CHANNEL, 0x0097, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -543,10 +955,23 @@ class CMSG_JOIN_CHANNEL_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_JOIN_CHANNEL)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_JOIN_CHANNEL, 0x0097, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_UPDATE_OBJECT_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -561,10 +986,26 @@ class SMSG_UPDATE_OBJECT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_UPDATE_OBJECT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_UPDATE_OBJECT, 0x00A9, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(has_transport=r.has_transport).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -577,10 +1018,26 @@ class SMSG_UPDATE_OBJECT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_UPDATE_OBJECT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_UPDATE_OBJECT, 0x00A9, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(has_transport=r.has_transport).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_DESTROY_OBJECT_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -595,9 +1052,24 @@ class SMSG_DESTROY_OBJECT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_DESTROY_OBJECT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_DESTROY_OBJECT, 0x00AA, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_USE_ITEM_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -612,10 +1084,26 @@ class CMSG_USE_ITEM_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_USE_ITEM)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_USE_ITEM, 0x00AB, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(bag_index=r.bag_index, bag_slot=r.bag_slot, spell_index=r.spell_index).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_FORWARD_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -630,10 +1118,26 @@ class MSG_MOVE_START_FORWARD_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_FORWARD_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_FORWARD_Client, 0x00B5, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_FORWARD_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -648,10 +1152,26 @@ class MSG_MOVE_START_FORWARD_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_FORWARD_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_FORWARD_Server, 0x00B5, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_BACKWARD_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -666,10 +1186,26 @@ class MSG_MOVE_START_BACKWARD_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_BACKWARD_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_BACKWARD_Client, 0x00B6, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_BACKWARD_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -684,10 +1220,26 @@ class MSG_MOVE_START_BACKWARD_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_BACKWARD_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_BACKWARD_Server, 0x00B6, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_STOP_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -702,10 +1254,26 @@ class MSG_MOVE_STOP_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_STOP_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_STOP_Client, 0x00B7, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_STOP_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -720,10 +1288,26 @@ class MSG_MOVE_STOP_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_STOP_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_STOP_Server, 0x00B7, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_STRAFE_LEFT_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -738,10 +1322,26 @@ class MSG_MOVE_START_STRAFE_LEFT_Client_vanilla(unittest.IsolatedAsyncioTestCase
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_STRAFE_LEFT_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_STRAFE_LEFT_Client, 0x00B8, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_STRAFE_LEFT_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -756,10 +1356,26 @@ class MSG_MOVE_START_STRAFE_LEFT_Server_vanilla(unittest.IsolatedAsyncioTestCase
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_STRAFE_LEFT_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_STRAFE_LEFT_Server, 0x00B8, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_STRAFE_RIGHT_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -774,10 +1390,26 @@ class MSG_MOVE_START_STRAFE_RIGHT_Client_vanilla(unittest.IsolatedAsyncioTestCas
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_STRAFE_RIGHT_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_STRAFE_RIGHT_Client, 0x00B9, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_STRAFE_RIGHT_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -792,10 +1424,26 @@ class MSG_MOVE_START_STRAFE_RIGHT_Server_vanilla(unittest.IsolatedAsyncioTestCas
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_STRAFE_RIGHT_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_STRAFE_RIGHT_Server, 0x00B9, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_STOP_STRAFE_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -810,10 +1458,26 @@ class MSG_MOVE_STOP_STRAFE_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_STOP_STRAFE_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_STOP_STRAFE_Client, 0x00BA, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_STOP_STRAFE_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -828,10 +1492,26 @@ class MSG_MOVE_STOP_STRAFE_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_STOP_STRAFE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_STOP_STRAFE_Server, 0x00BA, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_JUMP_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -846,10 +1526,26 @@ class MSG_MOVE_JUMP_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_JUMP_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_JUMP_Client, 0x00BB, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_JUMP_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -864,10 +1560,26 @@ class MSG_MOVE_JUMP_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_JUMP_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_JUMP_Server, 0x00BB, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_TURN_LEFT_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -882,10 +1594,26 @@ class MSG_MOVE_START_TURN_LEFT_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_TURN_LEFT_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_TURN_LEFT_Client, 0x00BC, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_TURN_LEFT_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -900,10 +1628,26 @@ class MSG_MOVE_START_TURN_LEFT_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_TURN_LEFT_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_TURN_LEFT_Server, 0x00BC, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_TURN_RIGHT_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -918,10 +1662,26 @@ class MSG_MOVE_START_TURN_RIGHT_Client_vanilla(unittest.IsolatedAsyncioTestCase)
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_TURN_RIGHT_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_TURN_RIGHT_Client, 0x00BD, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_START_TURN_RIGHT_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -936,10 +1696,26 @@ class MSG_MOVE_START_TURN_RIGHT_Server_vanilla(unittest.IsolatedAsyncioTestCase)
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_START_TURN_RIGHT_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_START_TURN_RIGHT_Server, 0x00BD, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_STOP_TURN_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -954,10 +1730,26 @@ class MSG_MOVE_STOP_TURN_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_STOP_TURN_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_STOP_TURN_Client, 0x00BE, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_STOP_TURN_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -972,10 +1764,26 @@ class MSG_MOVE_STOP_TURN_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_STOP_TURN_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_STOP_TURN_Server, 0x00BE, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_SET_RUN_MODE_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -990,10 +1798,26 @@ class MSG_MOVE_SET_RUN_MODE_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_SET_RUN_MODE_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_SET_RUN_MODE_Client, 0x00C2, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_SET_RUN_MODE_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1008,10 +1832,26 @@ class MSG_MOVE_SET_RUN_MODE_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_SET_RUN_MODE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_SET_RUN_MODE_Server, 0x00C2, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_SET_WALK_MODE_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1026,10 +1866,26 @@ class MSG_MOVE_SET_WALK_MODE_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_SET_WALK_MODE_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_SET_WALK_MODE_Client, 0x00C3, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_SET_WALK_MODE_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1044,10 +1900,26 @@ class MSG_MOVE_SET_WALK_MODE_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_SET_WALK_MODE_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_SET_WALK_MODE_Server, 0x00C3, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_TELEPORT_ACK_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1062,10 +1934,26 @@ class MSG_MOVE_TELEPORT_ACK_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_TELEPORT_ACK_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_TELEPORT_ACK_Client, 0x00C7, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(movement_counter=r.movement_counter, time=r.time).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_TELEPORT_ACK_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1080,10 +1968,26 @@ class MSG_MOVE_TELEPORT_ACK_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_TELEPORT_ACK_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_TELEPORT_ACK_Server, 0x00C7, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(movement_counter=r.movement_counter, info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_FALL_LAND_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1098,10 +2002,26 @@ class MSG_MOVE_FALL_LAND_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_FALL_LAND_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_FALL_LAND_Client, 0x00C9, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_FALL_LAND_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1116,10 +2036,26 @@ class MSG_MOVE_FALL_LAND_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_FALL_LAND_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_FALL_LAND_Server, 0x00C9, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_SET_FACING_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1134,10 +2070,26 @@ class MSG_MOVE_SET_FACING_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_SET_FACING_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_SET_FACING_Client, 0x00DA, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_SET_FACING_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1152,10 +2104,26 @@ class MSG_MOVE_SET_FACING_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_SET_FACING_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_SET_FACING_Server, 0x00DA, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_FORCE_RUN_SPEED_CHANGE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1170,10 +2138,26 @@ class SMSG_FORCE_RUN_SPEED_CHANGE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_FORCE_RUN_SPEED_CHANGE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_FORCE_RUN_SPEED_CHANGE, 0x00E2, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(move_event=r.move_event, speed=r.speed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_FORCE_RUN_SPEED_CHANGE_ACK_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1188,10 +2172,26 @@ class CMSG_FORCE_RUN_SPEED_CHANGE_ACK_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_FORCE_RUN_SPEED_CHANGE_ACK)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_FORCE_RUN_SPEED_CHANGE_ACK, 0x00E3, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid, counter=r.counter, info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_HEARTBEAT_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1206,10 +2206,26 @@ class MSG_MOVE_HEARTBEAT_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_MOVE_HEARTBEAT_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_HEARTBEAT_Client, 0x00EE, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_HEARTBEAT_Server_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1224,10 +2240,26 @@ class MSG_MOVE_HEARTBEAT_Server_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.MSG_MOVE_HEARTBEAT_Server)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_MOVE_HEARTBEAT_Server, 0x00EE, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(info_timestamp=r.info.timestamp, info_position=r.info.position, info_orientation=r.info.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_TUTORIAL_FLAGS_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1242,9 +2274,20 @@ class SMSG_TUTORIAL_FLAGS_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_TUTORIAL_FLAGS)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_TUTORIAL_FLAGS, 0x00FD, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_STANDSTATECHANGE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1259,9 +2302,24 @@ class CMSG_STANDSTATECHANGE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_STANDSTATECHANGE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_STANDSTATECHANGE, 0x0101, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(animation_state=r.animation_state).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_TEXT_EMOTE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1276,9 +2334,24 @@ class CMSG_TEXT_EMOTE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_TEXT_EMOTE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_TEXT_EMOTE, 0x0104, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(text_emote=r.text_emote, emote=r.emote, target=r.target).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_AUTOEQUIP_ITEM_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1293,9 +2366,24 @@ class CMSG_AUTOEQUIP_ITEM_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_AUTOEQUIP_ITEM)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_AUTOEQUIP_ITEM, 0x010A, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(source_bag=r.source_bag, source_slot=r.source_slot).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_INITIATE_TRADE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1310,9 +2398,24 @@ class CMSG_INITIATE_TRADE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_INITIATE_TRADE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_INITIATE_TRADE, 0x0116, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_CANCEL_TRADE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1327,9 +2430,20 @@ class CMSG_CANCEL_TRADE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_CANCEL_TRADE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_CANCEL_TRADE, 0x011C, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_INITIAL_SPELLS_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1344,10 +2458,26 @@ class SMSG_INITIAL_SPELLS_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_INITIAL_SPELLS)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_INITIAL_SPELLS, 0x012A, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(unknown1=r.unknown1).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_CAST_SPELL_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1362,10 +2492,26 @@ class CMSG_CAST_SPELL_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_CAST_SPELL)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_CAST_SPELL, 0x012E, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(spell=r.spell).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_CANCEL_CAST_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1380,9 +2526,24 @@ class CMSG_CANCEL_CAST_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_CANCEL_CAST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_CANCEL_CAST, 0x012F, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(id=r.id).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -1395,9 +2556,24 @@ class CMSG_CANCEL_CAST_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_CANCEL_CAST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_CANCEL_CAST, 0x012F, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(id=r.id).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_SET_SELECTION_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1412,9 +2588,24 @@ class CMSG_SET_SELECTION_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_SET_SELECTION)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_SET_SELECTION, 0x013D, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(target=r.target).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_ATTACKSWING_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1429,9 +2620,24 @@ class CMSG_ATTACKSWING_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_ATTACKSWING)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_ATTACKSWING, 0x0141, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_ATTACKSTART_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1446,9 +2652,24 @@ class SMSG_ATTACKSTART_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_ATTACKSTART)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_ATTACKSTART, 0x0143, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(attacker=r.attacker, victim=r.victim).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_ATTACKSTOP_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1463,10 +2684,26 @@ class SMSG_ATTACKSTOP_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_ATTACKSTOP)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_ATTACKSTOP, 0x0144, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(unknown1=r.unknown1).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_ATTACKERSTATEUPDATE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1481,10 +2718,26 @@ class SMSG_ATTACKERSTATEUPDATE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_ATTACKERSTATEUPDATE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_ATTACKERSTATEUPDATE, 0x014A, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(hit_info=r.hit_info, total_damage=r.total_damage).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_ITEM_PUSH_RESULT_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1499,9 +2752,24 @@ class SMSG_ITEM_PUSH_RESULT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_ITEM_PUSH_RESULT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_ITEM_PUSH_RESULT, 0x0166, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(guid=r.guid, source=r.source, creation_type=r.creation_type, alert_chat=r.alert_chat, bag_slot=r.bag_slot, item_slot=r.item_slot, item=r.item, item_suffix_factor=r.item_suffix_factor, item_random_property_id=r.item_random_property_id, item_count=r.item_count).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_QUERY_TIME_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1516,9 +2784,20 @@ class CMSG_QUERY_TIME_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_QUERY_TIME)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_QUERY_TIME, 0x01CE, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_QUERY_TIME_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1533,9 +2812,24 @@ class SMSG_QUERY_TIME_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_QUERY_TIME_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_QUERY_TIME_RESPONSE, 0x01CF, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(time=r.time).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_PING_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1550,9 +2844,24 @@ class CMSG_PING_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_PING)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_PING, 0x01DC, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(sequence_id=r.sequence_id, round_time_in_ms=r.round_time_in_ms).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_PONG_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1567,9 +2876,24 @@ class SMSG_PONG_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_PONG)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_PONG, 0x01DD, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(sequence_id=r.sequence_id).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_SETSHEATHED_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1584,9 +2908,24 @@ class CMSG_SETSHEATHED_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_SETSHEATHED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_SETSHEATHED, 0x01E0, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(sheathed=r.sheathed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_AUTH_CHALLENGE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1601,9 +2940,24 @@ class SMSG_AUTH_CHALLENGE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_AUTH_CHALLENGE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_AUTH_CHALLENGE, 0x01EC, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_unencrypted(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_unencrypted_into(written, 3))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(server_seed=r.server_seed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_AUTH_SESSION_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1618,8 +2972,14 @@ class CMSG_AUTH_SESSION_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_AUTH_SESSION)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_AUTH_SESSION, 0x01ED, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(r.size() + 6)
         r.write_unencrypted(written)
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_AUTH_SESSION, 0x01ED, encoded.body)._decode())
+        self.assertEqual(encoded.body, written[6:])
 
 
 class SMSG_AUTH_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1634,10 +2994,23 @@ class SMSG_AUTH_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_AUTH_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_AUTH_RESPONSE, 0x01EE, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -1650,10 +3023,23 @@ class SMSG_AUTH_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_AUTH_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_AUTH_RESPONSE, 0x01EE, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
     async def test2(self):
         reader = asyncio.StreamReader()
@@ -1666,10 +3052,23 @@ class SMSG_AUTH_RESPONSE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_AUTH_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_AUTH_RESPONSE, 0x01EE, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_ZONEUPDATE_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1684,9 +3083,24 @@ class CMSG_ZONEUPDATE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_ZONEUPDATE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_ZONEUPDATE, 0x01F4, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(area=r.area).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -1699,9 +3113,24 @@ class CMSG_ZONEUPDATE_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_ZONEUPDATE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_ZONEUPDATE, 0x01F4, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(area=r.area).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_COMPRESSED_UPDATE_OBJECT_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1716,8 +3145,14 @@ class SMSG_COMPRESSED_UPDATE_OBJECT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_COMPRESSED_UPDATE_OBJECT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_COMPRESSED_UPDATE_OBJECT, 0x01F6, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(r.size() + 4)
         r.write_encrypted_server(written, NullHeaderCrypto())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_COMPRESSED_UPDATE_OBJECT, 0x01F6, encoded.body)._decode())
+        self.assertEqual(encoded.body, written[4:])
 
 
 class SMSG_ACCOUNT_DATA_TIMES_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1732,9 +3167,20 @@ class SMSG_ACCOUNT_DATA_TIMES_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_ACCOUNT_DATA_TIMES)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_ACCOUNT_DATA_TIMES, 0x0209, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_REQUEST_ACCOUNT_DATA_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1749,9 +3195,24 @@ class CMSG_REQUEST_ACCOUNT_DATA_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_REQUEST_ACCOUNT_DATA)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_REQUEST_ACCOUNT_DATA, 0x020A, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(data_type=r.data_type).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_UPDATE_ACCOUNT_DATA_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1766,8 +3227,14 @@ class CMSG_UPDATE_ACCOUNT_DATA_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_UPDATE_ACCOUNT_DATA)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_UPDATE_ACCOUNT_DATA, 0x020B, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(r.size() + 6)
         r.write_encrypted_client(written, NullHeaderCrypto())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_UPDATE_ACCOUNT_DATA, 0x020B, encoded.body)._decode())
+        self.assertEqual(encoded.body, written[6:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -1780,8 +3247,14 @@ class CMSG_UPDATE_ACCOUNT_DATA_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_UPDATE_ACCOUNT_DATA)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_UPDATE_ACCOUNT_DATA, 0x020B, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(r.size() + 6)
         r.write_encrypted_client(written, NullHeaderCrypto())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_UPDATE_ACCOUNT_DATA, 0x020B, encoded.body)._decode())
+        self.assertEqual(encoded.body, written[6:])
 
 
 class CMSG_GMTICKET_GETTICKET_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1796,9 +3269,20 @@ class CMSG_GMTICKET_GETTICKET_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_GMTICKET_GETTICKET)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_GMTICKET_GETTICKET, 0x0211, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_LOGIN_VERIFY_WORLD_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1813,9 +3297,23 @@ class SMSG_LOGIN_VERIFY_WORLD_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_LOGIN_VERIFY_WORLD)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_LOGIN_VERIFY_WORLD, 0x0236, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(map=r.map, position=r.position, orientation=r.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_LEARN_TALENT_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1830,9 +3328,24 @@ class CMSG_LEARN_TALENT_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_LEARN_TALENT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_LEARN_TALENT, 0x0251, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(talent=r.talent, requested_rank=r.requested_rank).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_AUCTION_HELLO_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1847,9 +3360,24 @@ class MSG_AUCTION_HELLO_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_AUCTION_HELLO_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_AUCTION_HELLO_Client, 0x0255, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(auctioneer=r.auctioneer).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_SET_ACTIVE_MOVER_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1864,9 +3392,24 @@ class CMSG_SET_ACTIVE_MOVER_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_SET_ACTIVE_MOVER)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_SET_ACTIVE_MOVER, 0x026A, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_QUERY_NEXT_MAIL_TIME_Client_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1881,9 +3424,20 @@ class MSG_QUERY_NEXT_MAIL_TIME_Client_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.MSG_QUERY_NEXT_MAIL_TIME_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.MSG_QUERY_NEXT_MAIL_TIME_Client, 0x0284, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_MEETINGSTONE_INFO_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1898,9 +3452,20 @@ class CMSG_MEETINGSTONE_INFO_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_MEETINGSTONE_INFO)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_MEETINGSTONE_INFO, 0x0296, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_RENAME_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1915,10 +3480,26 @@ class CMSG_CHAR_RENAME_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_CHAR_RENAME)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_CHAR_RENAME, 0x02C7, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(character=r.character).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_CHAR_RENAME_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1933,10 +3514,23 @@ class SMSG_CHAR_RENAME_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_CHAR_RENAME)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_CHAR_RENAME, 0x02C8, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -1949,10 +3543,23 @@ class SMSG_CHAR_RENAME_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_CHAR_RENAME)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_CHAR_RENAME, 0x02C8, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_REQUEST_RAID_INFO_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1967,9 +3574,20 @@ class CMSG_REQUEST_RAID_INFO_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_REQUEST_RAID_INFO)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_REQUEST_RAID_INFO, 0x02CD, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_MOVE_TIME_SKIPPED_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -1984,9 +3602,24 @@ class CMSG_MOVE_TIME_SKIPPED_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_MOVE_TIME_SKIPPED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_MOVE_TIME_SKIPPED, 0x02CE, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid, lag=r.lag).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_BATTLEFIELD_STATUS_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -2001,9 +3634,20 @@ class CMSG_BATTLEFIELD_STATUS_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_client_opcode_unencrypted(reader, vanilla.CMSG_BATTLEFIELD_STATUS)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.CMSG_BATTLEFIELD_STATUS, 0x02D3, data[6:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_COMPRESSED_MOVES_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -2018,8 +3662,14 @@ class SMSG_COMPRESSED_MOVES_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_COMPRESSED_MOVES)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_COMPRESSED_MOVES, 0x02FB, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(r.size() + 4)
         r.write_encrypted_server(written, NullHeaderCrypto())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_COMPRESSED_MOVES, 0x02FB, encoded.body)._decode())
+        self.assertEqual(encoded.body, written[4:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -2032,8 +3682,14 @@ class SMSG_COMPRESSED_MOVES_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_COMPRESSED_MOVES)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_COMPRESSED_MOVES, 0x02FB, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(r.size() + 4)
         r.write_encrypted_server(written, NullHeaderCrypto())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_COMPRESSED_MOVES, 0x02FB, encoded.body)._decode())
+        self.assertEqual(encoded.body, written[4:])
 
 
 class SMSG_SPLINE_SET_RUN_SPEED_vanilla(unittest.IsolatedAsyncioTestCase):
@@ -2048,10 +3704,26 @@ class SMSG_SPLINE_SET_RUN_SPEED_vanilla(unittest.IsolatedAsyncioTestCase):
         r = await vanilla.expect_server_opcode_unencrypted(reader, vanilla.SMSG_SPLINE_SET_RUN_SPEED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, vanilla.LazyMessage(vanilla.SMSG_SPLINE_SET_RUN_SPEED, 0x02FE, data[4:])._decode())
+        decoder = vanilla.WorldFrameDecoder(vanilla.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, vanilla.seal(r).size())
+        vanilla.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = vanilla.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = vanilla.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(speed=r.speed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_TELEPORT_TO_UNIT_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2066,10 +3738,23 @@ class CMSG_TELEPORT_TO_UNIT_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_TELEPORT_TO_UNIT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_TELEPORT_TO_UNIT, 0x0009, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, tbc.seal(r).size())
+        tbc.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_ENUM_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2084,9 +3769,20 @@ class CMSG_CHAR_ENUM_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_CHAR_ENUM)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_CHAR_ENUM, 0x0037, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_DELETE_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2101,9 +3797,24 @@ class CMSG_CHAR_DELETE_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_CHAR_DELETE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_CHAR_DELETE, 0x0038, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_PLAYER_LOGIN_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2118,9 +3829,24 @@ class CMSG_PLAYER_LOGIN_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_PLAYER_LOGIN)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_PLAYER_LOGIN, 0x003D, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_LOGIN_SETTIMESPEED_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2135,9 +3861,24 @@ class SMSG_LOGIN_SETTIMESPEED_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_LOGIN_SETTIMESPEED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_LOGIN_SETTIMESPEED, 0x0042, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(datetime=r.datetime, timescale=r.timescale).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_PLAYER_LOGOUT_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2152,9 +3893,20 @@ class CMSG_PLAYER_LOGOUT_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_PLAYER_LOGOUT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_PLAYER_LOGOUT, 0x004A, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_LOGOUT_REQUEST_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2169,9 +3921,20 @@ class CMSG_LOGOUT_REQUEST_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_LOGOUT_REQUEST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_LOGOUT_REQUEST, 0x004B, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_LOGOUT_RESPONSE_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2186,9 +3949,24 @@ class SMSG_LOGOUT_RESPONSE_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_LOGOUT_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_LOGOUT_RESPONSE, 0x004C, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(result=r.result, speed=r.speed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_LOGOUT_COMPLETE_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2203,9 +3981,20 @@ class SMSG_LOGOUT_COMPLETE_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_LOGOUT_COMPLETE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_LOGOUT_COMPLETE, 0x004D, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_PET_NAME_QUERY_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2220,9 +4009,24 @@ class CMSG_PET_NAME_QUERY_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_PET_NAME_QUERY)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_PET_NAME_QUERY, 0x0052, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(pet_number=r.pet_number, guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_DESTROY_OBJECT_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2237,9 +4041,24 @@ class SMSG_DESTROY_OBJECT_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_DESTROY_OBJECT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_DESTROY_OBJECT, 0x00AA, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_MOVE_TELEPORT_ACK_Client_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2254,10 +4073,26 @@ class MSG_MOVE_TELEPORT_ACK_Client_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.MSG_MOVE_TELEPORT_ACK_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.MSG_MOVE_TELEPORT_ACK_Client, 0x00C7, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, tbc.seal(r).size())
+        tbc.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(movement_counter=r.movement_counter, time=r.time).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_TUTORIAL_FLAGS_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2272,9 +4107,20 @@ class SMSG_TUTORIAL_FLAGS_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_TUTORIAL_FLAGS)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_TUTORIAL_FLAGS, 0x00FD, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_STANDSTATECHANGE_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2289,9 +4135,24 @@ class CMSG_STANDSTATECHANGE_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_STANDSTATECHANGE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_STANDSTATECHANGE, 0x0101, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(animation_state=r.animation_state).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_AUTOEQUIP_ITEM_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2306,9 +4167,24 @@ class CMSG_AUTOEQUIP_ITEM_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_AUTOEQUIP_ITEM)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_AUTOEQUIP_ITEM, 0x010A, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(source_bag=r.source_bag, source_slot=r.source_slot).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_INITIATE_TRADE_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2323,9 +4199,24 @@ class CMSG_INITIATE_TRADE_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_INITIATE_TRADE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_INITIATE_TRADE, 0x0116, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_CANCEL_TRADE_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2340,9 +4231,20 @@ class CMSG_CANCEL_TRADE_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_CANCEL_TRADE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_CANCEL_TRADE, 0x011C, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_INITIAL_SPELLS_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2357,10 +4259,26 @@ class SMSG_INITIAL_SPELLS_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_INITIAL_SPELLS)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_INITIAL_SPELLS, 0x012A, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, tbc.seal(r).size())
+        tbc.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(unknown1=r.unknown1).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_CANCEL_CAST_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2375,9 +4293,24 @@ class CMSG_CANCEL_CAST_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_CANCEL_CAST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_CANCEL_CAST, 0x012F, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(id=r.id).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -2390,9 +4323,24 @@ class CMSG_CANCEL_CAST_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_CANCEL_CAST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_CANCEL_CAST, 0x012F, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(id=r.id).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_SET_SELECTION_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2407,9 +4355,24 @@ class CMSG_SET_SELECTION_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_SET_SELECTION)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_SET_SELECTION, 0x013D, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(target=r.target).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_ATTACKSWING_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2424,9 +4387,24 @@ class CMSG_ATTACKSWING_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_ATTACKSWING)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_ATTACKSWING, 0x0141, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_ATTACKSTART_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2441,9 +4419,24 @@ class SMSG_ATTACKSTART_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_ATTACKSTART)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_ATTACKSTART, 0x0143, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(attacker=r.attacker, victim=r.victim).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_ATTACKSTOP_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2458,10 +4451,26 @@ class SMSG_ATTACKSTOP_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_ATTACKSTOP)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_ATTACKSTOP, 0x0144, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, tbc.seal(r).size())
+        tbc.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(unknown1=r.unknown1).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_QUERY_TIME_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2476,9 +4485,20 @@ class CMSG_QUERY_TIME_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_QUERY_TIME)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_QUERY_TIME, 0x01CE, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_PING_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2493,9 +4513,24 @@ class CMSG_PING_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_PING)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_PING, 0x01DC, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(sequence_id=r.sequence_id, round_time_in_ms=r.round_time_in_ms).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_PONG_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2510,9 +4545,24 @@ class SMSG_PONG_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_PONG)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_PONG, 0x01DD, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(sequence_id=r.sequence_id).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_SETSHEATHED_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2527,9 +4577,24 @@ class CMSG_SETSHEATHED_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_SETSHEATHED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_SETSHEATHED, 0x01E0, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(sheathed=r.sheathed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_AUTH_CHALLENGE_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2544,9 +4609,24 @@ class SMSG_AUTH_CHALLENGE_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_AUTH_CHALLENGE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_AUTH_CHALLENGE, 0x01EC, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_unencrypted(written)
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_unencrypted_into(written, 3))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(server_seed=r.server_seed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_AUTH_SESSION_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2561,8 +4641,14 @@ class CMSG_AUTH_SESSION_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_AUTH_SESSION)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_AUTH_SESSION, 0x01ED, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(r.size() + 6)
         r.write_unencrypted(written)
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_AUTH_SESSION, 0x01ED, encoded.body)._decode())
+        self.assertEqual(encoded.body, written[6:])
 
 
 class SMSG_ACCOUNT_DATA_TIMES_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2577,9 +4663,20 @@ class SMSG_ACCOUNT_DATA_TIMES_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_ACCOUNT_DATA_TIMES)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_ACCOUNT_DATA_TIMES, 0x0209, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_REQUEST_ACCOUNT_DATA_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2594,9 +4691,24 @@ class CMSG_REQUEST_ACCOUNT_DATA_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_REQUEST_ACCOUNT_DATA)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_REQUEST_ACCOUNT_DATA, 0x020A, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(data_type=r.data_type).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_UPDATE_ACCOUNT_DATA_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2611,8 +4723,14 @@ class CMSG_UPDATE_ACCOUNT_DATA_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_UPDATE_ACCOUNT_DATA)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_UPDATE_ACCOUNT_DATA, 0x020B, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(r.size() + 6)
         r.write_encrypted_client(written, NullHeaderCrypto())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_UPDATE_ACCOUNT_DATA, 0x020B, encoded.body)._decode())
+        self.assertEqual(encoded.body, written[6:])
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -2625,8 +4743,14 @@ class CMSG_UPDATE_ACCOUNT_DATA_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_UPDATE_ACCOUNT_DATA)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_UPDATE_ACCOUNT_DATA, 0x020B, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(r.size() + 6)
         r.write_encrypted_client(written, NullHeaderCrypto())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_UPDATE_ACCOUNT_DATA, 0x020B, encoded.body)._decode())
+        self.assertEqual(encoded.body, written[6:])
 
 
 class CMSG_GMTICKET_GETTICKET_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2641,9 +4765,20 @@ class CMSG_GMTICKET_GETTICKET_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_GMTICKET_GETTICKET)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_GMTICKET_GETTICKET, 0x0211, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class MSG_AUCTION_HELLO_Client_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2658,9 +4793,24 @@ class MSG_AUCTION_HELLO_Client_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.MSG_AUCTION_HELLO_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.MSG_AUCTION_HELLO_Client, 0x0255, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(auctioneer=r.auctioneer).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_SET_ACTIVE_MOVER_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2675,9 +4825,24 @@ class CMSG_SET_ACTIVE_MOVER_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_SET_ACTIVE_MOVER)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_SET_ACTIVE_MOVER, 0x026A, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_QUERY_NEXT_MAIL_TIME_Client_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2692,9 +4857,20 @@ class MSG_QUERY_NEXT_MAIL_TIME_Client_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.MSG_QUERY_NEXT_MAIL_TIME_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.MSG_QUERY_NEXT_MAIL_TIME_Client, 0x0284, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_MEETINGSTONE_INFO_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2709,9 +4885,20 @@ class CMSG_MEETINGSTONE_INFO_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_MEETINGSTONE_INFO)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_MEETINGSTONE_INFO, 0x0296, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_RENAME_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2726,10 +4913,26 @@ class CMSG_CHAR_RENAME_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_CHAR_RENAME)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_CHAR_RENAME, 0x02C7, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, tbc.seal(r).size())
+        tbc.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(character=r.character).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_REQUEST_RAID_INFO_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2744,9 +4947,20 @@ class CMSG_REQUEST_RAID_INFO_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_REQUEST_RAID_INFO)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_REQUEST_RAID_INFO, 0x02CD, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_MOVE_TIME_SKIPPED_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2761,9 +4975,24 @@ class CMSG_MOVE_TIME_SKIPPED_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_MOVE_TIME_SKIPPED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_MOVE_TIME_SKIPPED, 0x02CE, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid, lag=r.lag).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_BATTLEFIELD_STATUS_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2778,9 +5007,20 @@ class CMSG_BATTLEFIELD_STATUS_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_client_opcode_unencrypted(reader, tbc.CMSG_BATTLEFIELD_STATUS)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.CMSG_BATTLEFIELD_STATUS, 0x02D3, data[6:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_SPLINE_SET_RUN_SPEED_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2795,10 +5035,26 @@ class SMSG_SPLINE_SET_RUN_SPEED_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_SPLINE_SET_RUN_SPEED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_SPLINE_SET_RUN_SPEED, 0x02FE, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, tbc.seal(r).size())
+        tbc.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(speed=r.speed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_MOTD_tbc(unittest.IsolatedAsyncioTestCase):
@@ -2813,10 +5069,23 @@ class SMSG_MOTD_tbc(unittest.IsolatedAsyncioTestCase):
         r = await tbc.expect_server_opcode_unencrypted(reader, tbc.SMSG_MOTD)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, tbc.LazyMessage(tbc.SMSG_MOTD, 0x033D, data[4:])._decode())
+        decoder = tbc.WorldFrameDecoder(tbc.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, tbc.seal(r).size())
+        tbc.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = tbc.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = tbc.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_WORLD_TELEPORT_wrath(unittest.IsolatedAsyncioTestCase):
@@ -2831,9 +5100,23 @@ class CMSG_WORLD_TELEPORT_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_WORLD_TELEPORT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_WORLD_TELEPORT, 0x0008, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(time=r.time, map=r.map, unknown=r.unknown, position=r.position, orientation=r.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -2846,9 +5129,23 @@ class CMSG_WORLD_TELEPORT_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_WORLD_TELEPORT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_WORLD_TELEPORT, 0x0008, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(time=r.time, map=r.map, unknown=r.unknown, position=r.position, orientation=r.orientation).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_TELEPORT_TO_UNIT_wrath(unittest.IsolatedAsyncioTestCase):
@@ -2863,10 +5160,23 @@ class CMSG_TELEPORT_TO_UNIT_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_TELEPORT_TO_UNIT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_TELEPORT_TO_UNIT, 0x0009, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, wrath.seal(r).size())
+        wrath.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_ENUM_wrath(unittest.IsolatedAsyncioTestCase):
@@ -2881,9 +5191,20 @@ class CMSG_CHAR_ENUM_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_CHAR_ENUM)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_CHAR_ENUM, 0x0037, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_DELETE_wrath(unittest.IsolatedAsyncioTestCase):
@@ -2898,9 +5219,24 @@ class CMSG_CHAR_DELETE_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_CHAR_DELETE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_CHAR_DELETE, 0x0038, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_PLAYER_LOGIN_wrath(unittest.IsolatedAsyncioTestCase):
@@ -2915,9 +5251,24 @@ class CMSG_PLAYER_LOGIN_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_PLAYER_LOGIN)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_PLAYER_LOGIN, 0x003D, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_PLAYER_LOGOUT_wrath(unittest.IsolatedAsyncioTestCase):
@@ -2932,9 +5283,20 @@ class CMSG_PLAYER_LOGOUT_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_PLAYER_LOGOUT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_PLAYER_LOGOUT, 0x004A, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_LOGOUT_REQUEST_wrath(unittest.IsolatedAsyncioTestCase):
@@ -2949,9 +5311,20 @@ class CMSG_LOGOUT_REQUEST_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_LOGOUT_REQUEST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_LOGOUT_REQUEST, 0x004B, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_LOGOUT_RESPONSE_wrath(unittest.IsolatedAsyncioTestCase):
@@ -2966,9 +5339,24 @@ class SMSG_LOGOUT_RESPONSE_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_server_opcode_unencrypted(reader, wrath.SMSG_LOGOUT_RESPONSE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.SMSG_LOGOUT_RESPONSE, 0x004C, data[4:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(result=r.result, speed=r.speed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_LOGOUT_COMPLETE_wrath(unittest.IsolatedAsyncioTestCase):
@@ -2983,9 +5371,20 @@ class SMSG_LOGOUT_COMPLETE_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_server_opcode_unencrypted(reader, wrath.SMSG_LOGOUT_COMPLETE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.SMSG_LOGOUT_COMPLETE, 0x004D, data[4:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_PET_NAME_QUERY_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3000,9 +5399,24 @@ class CMSG_PET_NAME_QUERY_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_PET_NAME_QUERY)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_PET_NAME_QUERY, 0x0052, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(pet_number=r.pet_number, guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_UPDATE_OBJECT_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3017,10 +5431,23 @@ class SMSG_UPDATE_OBJECT_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_server_opcode_unencrypted(reader, wrath.SMSG_UPDATE_OBJECT)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.SMSG_UPDATE_OBJECT, 0x00A9, data[4:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, wrath.seal(r).size())
+        wrath.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class MSG_MOVE_TELEPORT_ACK_Client_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3035,10 +5462,26 @@ class MSG_MOVE_TELEPORT_ACK_Client_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.MSG_MOVE_TELEPORT_ACK_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.MSG_MOVE_TELEPORT_ACK_Client, 0x00C7, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, wrath.seal(r).size())
+        wrath.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(movement_counter=r.movement_counter, time=r.time).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_TUTORIAL_FLAGS_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3053,9 +5496,20 @@ class SMSG_TUTORIAL_FLAGS_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_server_opcode_unencrypted(reader, wrath.SMSG_TUTORIAL_FLAGS)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.SMSG_TUTORIAL_FLAGS, 0x00FD, data[4:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_STANDSTATECHANGE_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3070,9 +5524,24 @@ class CMSG_STANDSTATECHANGE_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_STANDSTATECHANGE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_STANDSTATECHANGE, 0x0101, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(animation_state=r.animation_state).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_AUTOEQUIP_ITEM_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3087,9 +5556,24 @@ class CMSG_AUTOEQUIP_ITEM_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_AUTOEQUIP_ITEM)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_AUTOEQUIP_ITEM, 0x010A, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(source_bag=r.source_bag, source_slot=r.source_slot).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_INITIATE_TRADE_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3104,9 +5588,24 @@ class CMSG_INITIATE_TRADE_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_INITIATE_TRADE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_INITIATE_TRADE, 0x0116, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_CANCEL_TRADE_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3121,9 +5620,20 @@ class CMSG_CANCEL_TRADE_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_CANCEL_TRADE)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_CANCEL_TRADE, 0x011C, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CANCEL_CAST_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3138,9 +5648,24 @@ class CMSG_CANCEL_CAST_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_CANCEL_CAST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_CANCEL_CAST, 0x012F, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(id=r.id).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
     async def test1(self):
         reader = asyncio.StreamReader()
@@ -3153,9 +5678,24 @@ class CMSG_CANCEL_CAST_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_CANCEL_CAST)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_CANCEL_CAST, 0x012F, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(id=r.id).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_SET_SELECTION_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3170,9 +5710,24 @@ class CMSG_SET_SELECTION_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_SET_SELECTION)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_SET_SELECTION, 0x013D, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(target=r.target).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_ATTACKSWING_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3187,9 +5742,24 @@ class CMSG_ATTACKSWING_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_ATTACKSWING)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_ATTACKSWING, 0x0141, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_ATTACKSTART_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3204,9 +5774,24 @@ class SMSG_ATTACKSTART_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_server_opcode_unencrypted(reader, wrath.SMSG_ATTACKSTART)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.SMSG_ATTACKSTART, 0x0143, data[4:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(attacker=r.attacker, victim=r.victim).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_ATTACKSTOP_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3221,10 +5806,26 @@ class SMSG_ATTACKSTOP_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_server_opcode_unencrypted(reader, wrath.SMSG_ATTACKSTOP)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.SMSG_ATTACKSTOP, 0x0144, data[4:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, wrath.seal(r).size())
+        wrath.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(unknown1=r.unknown1).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_QUERY_TIME_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3239,9 +5840,20 @@ class CMSG_QUERY_TIME_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_QUERY_TIME)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_QUERY_TIME, 0x01CE, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_PING_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3256,9 +5868,24 @@ class CMSG_PING_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_PING)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_PING, 0x01DC, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(sequence_id=r.sequence_id, round_time_in_ms=r.round_time_in_ms).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_PONG_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3273,9 +5900,24 @@ class SMSG_PONG_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_server_opcode_unencrypted(reader, wrath.SMSG_PONG)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.SMSG_PONG, 0x01DD, data[4:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(sequence_id=r.sequence_id).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_SETSHEATHED_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3290,9 +5932,24 @@ class CMSG_SETSHEATHED_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_SETSHEATHED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_SETSHEATHED, 0x01E0, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(sheathed=r.sheathed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_REQUEST_ACCOUNT_DATA_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3307,9 +5964,24 @@ class CMSG_REQUEST_ACCOUNT_DATA_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_REQUEST_ACCOUNT_DATA)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_REQUEST_ACCOUNT_DATA, 0x020A, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(data_type=r.data_type).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_GMTICKET_GETTICKET_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3324,9 +5996,20 @@ class CMSG_GMTICKET_GETTICKET_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_GMTICKET_GETTICKET)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_GMTICKET_GETTICKET, 0x0211, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class MSG_AUCTION_HELLO_Client_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3341,9 +6024,24 @@ class MSG_AUCTION_HELLO_Client_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.MSG_AUCTION_HELLO_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.MSG_AUCTION_HELLO_Client, 0x0255, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(auctioneer=r.auctioneer).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_SET_ACTIVE_MOVER_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3358,9 +6056,24 @@ class CMSG_SET_ACTIVE_MOVER_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_SET_ACTIVE_MOVER)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_SET_ACTIVE_MOVER, 0x026A, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(guid=r.guid).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class MSG_QUERY_NEXT_MAIL_TIME_Client_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3375,9 +6088,20 @@ class MSG_QUERY_NEXT_MAIL_TIME_Client_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.MSG_QUERY_NEXT_MAIL_TIME_Client)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.MSG_QUERY_NEXT_MAIL_TIME_Client, 0x0284, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_CHAR_RENAME_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3392,10 +6116,26 @@ class CMSG_CHAR_RENAME_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_CHAR_RENAME)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_CHAR_RENAME, 0x02C7, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 6, r.size())
+        self.assertEqual(len(data) - 6, wrath.seal(r).size())
+        wrath.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[6:], template.patch(character=r.character).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class CMSG_REQUEST_RAID_INFO_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3410,9 +6150,20 @@ class CMSG_REQUEST_RAID_INFO_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_REQUEST_RAID_INFO)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_REQUEST_RAID_INFO, 0x02CD, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class CMSG_BATTLEFIELD_STATUS_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3427,9 +6178,20 @@ class CMSG_BATTLEFIELD_STATUS_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_client_opcode_unencrypted(reader, wrath.CMSG_BATTLEFIELD_STATUS)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.CMSG_BATTLEFIELD_STATUS, 0x02D3, data[6:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.client_opcodes, True)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         written = bytearray(len(data))
         r.write_encrypted_client(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_client_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), True)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, True)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
 class SMSG_SPLINE_SET_RUN_SPEED_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3444,10 +6206,26 @@ class SMSG_SPLINE_SET_RUN_SPEED_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_server_opcode_unencrypted(reader, wrath.SMSG_SPLINE_SET_RUN_SPEED)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.SMSG_SPLINE_SET_RUN_SPEED, 0x02FE, data[4:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, wrath.seal(r).size())
+        wrath.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
+        template = r.template()
+        self.assertEqual(data[4:], template.patch(speed=r.speed).body)
+        self.assertEqual(data, template.header(NullHeaderCrypto()) + template.body)
 
 
 class SMSG_MOTD_wrath(unittest.IsolatedAsyncioTestCase):
@@ -3462,9 +6240,22 @@ class SMSG_MOTD_wrath(unittest.IsolatedAsyncioTestCase):
         r = await wrath.expect_server_opcode_unencrypted(reader, wrath.SMSG_MOTD)
         self.assertIsNotNone(r)
         self.assertTrue(reader.at_eof())
+        self.assertEqual(r, wrath.LazyMessage(wrath.SMSG_MOTD, 0x033D, data[4:])._decode())
+        decoder = wrath.WorldFrameDecoder(wrath.server_opcodes, False)
+        self.assertEqual([r], [m for i in range(0, len(data)) for m in decoder.feed(data[i:i + 1])])
         self.assertEqual(len(data) - 4, r.size())
+        self.assertEqual(len(data) - 4, wrath.seal(r).size())
+        wrath.unseal(r)
         written = bytearray(len(data))
         r.write_encrypted_server(written, NullHeaderCrypto())
         self.assertEqual(data, written)
+        written = bytearray(len(data) + 3)
+        self.assertEqual(len(data) + 3, r.write_encrypted_server_into(written, 3, NullHeaderCrypto()))
+        self.assertEqual(data, written[3:])
+        batch = wrath.PacketBatch(NullHeaderCrypto(), False)
+        batch.extend([r, r])
+        self.assertEqual(data + data, batch.flush())
+        encoded = wrath.EncodedMessage(r, False)
+        self.assertEqual(data, encoded.header(NullHeaderCrypto()) + encoded.body)
 
 
@@ -1,10 +1,45 @@
+from __future__ import annotations
 import asyncio
+import concurrent.futures
 import dataclasses
+import functools
 import struct
+import sys
 import typing
+import zlib
 
 
-@dataclasses.dataclass
+def slots_dataclass(cls):
+    if sys.version_info >= (3, 10):
+        return dataclasses.dataclass(cls, slots=True)
+
+    cls = dataclasses.dataclass(cls)
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    # Fields that are not in __init__ read their default from the class attribute that __slots__ replaces
+    defaults = [(field.name, field.default) for field in dataclasses.fields(cls)
+                if not field.init and field.default is not dataclasses.MISSING]
+    if len(defaults) != 0:
+        init = cls_dict["__init__"]
+
+        def __init__(self, *args, **kwargs):
+            for name, default in defaults:
+                setattr(self, name, default)
+            init(self, *args, **kwargs)
+
+        cls_dict["__init__"] = __init__
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@slots_dataclass
 class EnchantMask:
     fields: dict[int]
 
@@ -20,6 +55,17 @@ class EnchantMask:
 
         return EnchantMask(fields=fields)
 
+    @staticmethod
+    def from_buffer(buf: bytes, _offset: int) -> typing.Tuple[EnchantMask, int]:
+        mask, _offset = read_int_buffer(buf, _offset, 2)
+
+        fields = {}
+        for index in range(0, 16):
+            if mask & 1 << index:
+                fields[index], _offset = read_int_buffer(buf, _offset, 2)
+
+        return EnchantMask(fields=fields), _offset
+
     def write(self, fmt, data):
         mask = 0
         for i, _ in enumerate(self.fields):
@@ -38,6 +84,517 @@ class EnchantMask:
         return 2 + len(self.fields) * 2
 
 
+@dataclasses.dataclass
+class RawPacket:
+    opcode: int
+    body: bytes
+
+
+class LazyMessage:
+    # Underscore names only, so that message fields like message, message_type and body reach __getattr__
+    __slots__ = ("_opcode", "_body", "_message_type", "_message")
+
+    def __init__(self, message_type: typing.Any, opcode: int, body: bytes):
+        self._message_type = message_type
+        self._opcode = opcode
+        self._body = body
+        self._message = None
+
+    def _decode(self) -> typing.Any:
+        if self._message is None:
+            self._message = self._message_type.from_buffer(self._body, 0, len(self._body))[0]
+        return self._message
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._decode(), name)
+
+    def __repr__(self) -> str:
+        if self._message is not None:
+            return f"LazyMessage({self._message!r})"
+        return f"LazyMessage({self._message_type.__name__}, opcode=0x{self._opcode:04X}, body_size={len(self._body)})"
+
+
+class WorldFrameDecoder:
+    # Wrath servers send a 5 byte header for bodies larger than 0x7FFF bytes.
+    # Used when large_server_header is not given, wrath.WorldFrameDecoder sets it to True.
+    LARGE_SERVER_HEADER = False
+
+    def __init__(
+            self,
+            message_types: dict[int, typing.Any],
+            client: bool,
+            header_crypto: typing.Any = None,
+            lazy: bool = False,
+            opcodes: typing.Optional[typing.Collection[int]] = None,
+            raw_unknown_opcodes: bool = False,
+            large_server_header: typing.Optional[bool] = None,
+    ):
+        if large_server_header is None:
+            large_server_header = self.LARGE_SERVER_HEADER
+
+        self.message_types = message_types
+        self.client = client
+        self.header_crypto = header_crypto
+        self.lazy = lazy
+        self.opcodes = opcodes
+        self.raw_unknown_opcodes = raw_unknown_opcodes
+        self.large_server_header = large_server_header and not client
+
+        self._size_field_size = 4 if client else 2
+        self._header_size = self._size_field_size + 2
+        self._buffer = bytearray()
+        self._messages = []
+        self._header: typing.Optional[typing.Tuple[int, int]] = None
+        self._large_header = False
+
+        # Offset after the last header or frame decode_frames consumed, also set when a frame raises.
+        self.consumed = 0
+
+    def feed(self, data: bytes) -> typing.List[typing.Any]:
+        self._buffer += data
+
+        messages = self._messages
+        self._messages = []
+        try:
+            self.decode_frames(self._buffer, 0, len(self._buffer), messages.append)
+        except Exception:
+            # The failing frame is skipped, messages decoded before it are returned by the next feed.
+            self._messages = messages
+            raise
+        finally:
+            del self._buffer[:self.consumed]
+
+        return messages
+
+    def decode_frames(
+            self,
+            buf: bytearray,
+            offset: int,
+            end: int,
+            callback: typing.Callable[[typing.Any], None],
+    ) -> int:
+        while True:
+            self.consumed = offset
+
+            if self._header is None:
+                if end - offset < self._header_size:
+                    return offset
+
+                header = bytes(buf[offset:offset + self._header_size])
+                offset += self._header_size
+                self.consumed = offset
+                self._header = self._decode_header(header)
+
+            if self._large_header:
+                if end - offset < 1:
+                    return offset
+
+                body_size, opcode = self._header
+                self._header = (body_size, opcode ^ buf[offset] << 8)
+                self._large_header = False
+                offset += 1
+                self.consumed = offset
+
+            body_size, opcode = self._header
+            if end - offset < body_size:
+                return offset
+
+            self._header = None
+            self.consumed = offset + body_size
+            message = self._decode_body(opcode, buf, offset, body_size)
+            offset += body_size
+
+            callback(message)
+
+    def _decode_header(self, header: bytes) -> typing.Tuple[int, int]:
+        if self.header_crypto is not None:
+            if self.client:
+                size, opcode = self.header_crypto.decrypt_client_header(header)
+            elif self.large_server_header:
+                # The 5th byte is only part of large headers, so a placeholder is decrypted in its place.
+                # The header cipher is a plain stream cipher, which means the real byte can be applied afterwards.
+                size, opcode = self.header_crypto.decrypt_server_header(header + b"\x00")
+                self._large_header = size > 0x7FFF
+            else:
+                size, opcode = self.header_crypto.decrypt_server_header(header)
+        elif self.large_server_header and header[0] & 0x80:
+            size = int.from_bytes(header[0:3], "big") & 0x7FFFFF
+            opcode = header[3]
+            self._large_header = True
+        else:
+            size = int.from_bytes(header[0:2], "big")
+            opcode = int.from_bytes(header[2:], "little")
+
+        return size - self._size_field_size, opcode
+
+    def _decode_body(self, opcode: int, buf: bytearray, offset: int, body_size: int) -> typing.Any:
+        if self.opcodes is not None and opcode not in self.opcodes:
+            return RawPacket(opcode, bytes(buf[offset:offset + body_size]))
+
+        if self.raw_unknown_opcodes and opcode not in self.message_types:
+            return RawPacket(opcode, bytes(buf[offset:offset + body_size]))
+
+        if self.lazy:
+            return LazyMessage(self.message_types[opcode], opcode, bytes(buf[offset:offset + body_size]))
+
+        # Bound the decode to this frame so a malformed body can not read into the next frame.
+        with memoryview(buf)[offset:offset + body_size] as body:
+            return self.message_types[opcode].from_buffer(body, 0, body_size)[0]
+
+
+class WorldProtocol(asyncio.BufferedProtocol):
+    MINIMUM_READ_SIZE = 4096
+
+    def __init__(
+            self,
+            decoder: WorldFrameDecoder,
+            handler: typing.Callable[[WorldProtocol, typing.Any], None],
+            buffer_size: int = 65536,
+    ):
+        self.decoder = decoder
+        self.handler = handler
+        self.transport: typing.Optional[asyncio.BaseTransport] = None
+
+        self._buffer = bytearray(buffer_size)
+        self._start = 0
+        self._end = 0
+
+    def connection_made(self, transport: asyncio.BaseTransport):
+        self.transport = transport
+
+    def connection_lost(self, exc: typing.Optional[Exception]):
+        self.transport = None
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        needed = max(sizehint, self.MINIMUM_READ_SIZE)
+        if len(self._buffer) - self._end < needed:
+            remaining = self._end - self._start
+            if len(self._buffer) - remaining < needed:
+                buffer = bytearray(max(len(self._buffer) * 2, remaining + needed))
+                buffer[:remaining] = self._buffer[self._start:self._end]
+                self._buffer = buffer
+            else:
+                self._buffer[:remaining] = self._buffer[self._start:self._end]
+
+            self._start = 0
+            self._end = remaining
+
+        return memoryview(self._buffer)[self._end:]
+
+    def buffer_updated(self, nbytes: int):
+        self._end += nbytes
+        try:
+            self.decoder.decode_frames(self._buffer, self._start, self._end, self._handle)
+        finally:
+            self._start = self.decoder.consumed
+
+        if self._start == self._end:
+            self._start = 0
+            self._end = 0
+
+    def _handle(self, message: typing.Any):
+        self.handler(self, message)
+
+
+SMSG_COMPRESSED_UPDATE_OBJECT_OPCODE = 0x01F6
+
+_compression_level = zlib.Z_DEFAULT_COMPRESSION
+_compressobj = None
+
+
+def set_compression(
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        strategy: int = zlib.Z_DEFAULT_STRATEGY,
+        memory_level: int = zlib.DEF_MEM_LEVEL,
+):
+    global _compression_level, _compressobj
+
+    _compression_level = level
+    if strategy == zlib.Z_DEFAULT_STRATEGY and memory_level == zlib.DEF_MEM_LEVEL:
+        _compressobj = None
+    else:
+        _compressobj = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS, memory_level, strategy)
+
+
+def compress(data: bytes) -> bytes:
+    if _compressobj is None:
+        return zlib.compress(data, _compression_level)
+
+    compressobj = _compressobj.copy()
+    return compressobj.compress(data) + compressobj.flush()
+
+
+_compression_executor: typing.Optional[concurrent.futures.Executor] = None
+_compression_executor_threshold = 16384
+
+
+def set_compression_executor(
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        threshold: int = 16384,
+):
+    global _compression_executor, _compression_executor_threshold
+
+    _compression_executor = executor
+    _compression_executor_threshold = threshold
+
+
+async def run_compression(function: typing.Callable, size: int, *args) -> typing.Any:
+    if _compression_executor is None or size < _compression_executor_threshold:
+        return function(*args)
+
+    return await asyncio.get_running_loop().run_in_executor(_compression_executor, function, *args)
+
+
+def _message_fmt(message: typing.Any, header_crypto: typing.Any, client: bool):
+    if hasattr(message, "_write_unencrypted_fmt"):
+        return message._write_unencrypted_fmt()
+    elif client:
+        return message._write_encrypted_client_fmt(header_crypto)
+    else:
+        return message._write_encrypted_server_fmt(header_crypto)
+
+
+class _PlainHeaderCrypto:
+    @staticmethod
+    def encrypt_server_header(size: int, opcode: int) -> bytes:
+        return struct.pack(">H", size) + struct.pack("<H", opcode)
+
+    @staticmethod
+    def encrypt_client_header(size: int, opcode: int) -> bytes:
+        return struct.pack(">H", size) + struct.pack("<I", opcode)
+
+
+class _OpcodeHeaderCrypto:
+    # EncodedMessage only keeps the opcode, so the size is left out to not limit it to 16 bits
+    @staticmethod
+    def encrypt_server_header(size: int, opcode: int) -> bytes:
+        return struct.pack("<2xH", opcode)
+
+    @staticmethod
+    def encrypt_client_header(size: int, opcode: int) -> bytes:
+        return struct.pack("<2xI", opcode)
+
+
+class EncodedMessage:
+    __slots__ = ("opcode", "body", "client")
+
+    def __init__(self, message: typing.Any, client: bool = False):
+        _fmt, _data = _message_fmt(message, _OpcodeHeaderCrypto, client)
+        if isinstance(_fmt, str):
+            data = struct.pack(_fmt, *_data)
+        else:
+            data = _fmt.pack(*_data)
+
+        header_size = 6 if client else 4
+        self.client = client
+        self.opcode = int.from_bytes(data[2:header_size], "little")
+        self.body = memoryview(data)[header_size:]
+
+    @staticmethod
+    def from_body(opcode: int, body: bytes, client: bool = False) -> EncodedMessage:
+        encoded = EncodedMessage.__new__(EncodedMessage)
+        encoded.opcode = opcode
+        encoded.body = memoryview(body)
+        encoded.client = client
+        return encoded
+
+    def size(self) -> int:
+        return len(self.body)
+
+    def header(self, header_crypto: typing.Any = None) -> bytes:
+        if header_crypto is None:
+            header_crypto = _PlainHeaderCrypto
+
+        if self.client:
+            return bytes(header_crypto.encrypt_client_header(len(self.body) + 4, self.opcode))
+        return bytes(header_crypto.encrypt_server_header(len(self.body) + 2, self.opcode))
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, asyncio.WriteTransport], header_crypto: typing.Any = None):
+        writer.writelines((self.header(header_crypto), self.body))
+
+    def write_into(self, buf: bytearray, offset: int, header_crypto: typing.Any = None) -> int:
+        header = self.header(header_crypto)
+        end = offset + len(header)
+        buf[offset:end] = header
+        buf[end:end + len(self.body)] = self.body
+
+        return end + len(self.body)
+
+    def __repr__(self) -> str:
+        return f"EncodedMessage(opcode=0x{self.opcode:04X}, body={bytes(self.body)!r})"
+
+
+# Used by the patch methods of generated message templates
+pack_u8_into = struct.Struct("<B").pack_into
+pack_i8_into = struct.Struct("<b").pack_into
+pack_u16_into = struct.Struct("<H").pack_into
+pack_i16_into = struct.Struct("<h").pack_into
+pack_u32_into = struct.Struct("<I").pack_into
+pack_i32_into = struct.Struct("<i").pack_into
+pack_u64_into = struct.Struct("<Q").pack_into
+pack_i64_into = struct.Struct("<q").pack_into
+pack_f32_into = struct.Struct("<f").pack_into
+
+
+class MessageTemplate(EncodedMessage):
+    # The header is written right aligned into the first 6 bytes of the buffer and the body starts after them,
+    # so generated patch methods have fixed body offsets and writing needs no concatenation.
+    __slots__ = ("buffer", "_size", "_header")
+
+    def __init__(self, message: typing.Any, client: bool = False):
+        super().__init__(message, client)
+        body = self.body
+        self.buffer = bytearray(6 + len(body))
+        self.buffer[6:] = body
+        self.body = memoryview(self.buffer)[6:]
+        self._size = len(body) + (4 if client else 2)
+        self._header = self.header()
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, asyncio.WriteTransport], header_crypto: typing.Any = None):
+        if header_crypto is None:
+            header = self._header
+        elif self.client:
+            header = header_crypto.encrypt_client_header(self._size, self.opcode)
+        else:
+            header = header_crypto.encrypt_server_header(self._size, self.opcode)
+
+        start = 6 - len(header)
+        self.buffer[start:6] = header
+        # The buffer is patched in place and transports can keep a reference to unsent data, so a copy is written
+        writer.write(self.buffer[start:])
+
+
+def broadcast(
+        message: typing.Any,
+        recipients: typing.Iterable[typing.Tuple[typing.Union[asyncio.StreamWriter, asyncio.WriteTransport], typing.Any]],
+        client: bool = False,
+) -> EncodedMessage:
+    encoded = EncodedMessage(message, client)
+    for writer, header_crypto in recipients:
+        encoded.write(writer, header_crypto)
+
+    return encoded
+
+
+def encode_update_object(message: typing.Any, threshold: int = 100) -> EncodedMessage:
+    encoded = EncodedMessage(message)
+    if len(encoded.body) <= threshold:
+        return encoded
+
+    return _compressed_update_object(encoded.body, compress(encoded.body))
+
+
+async def encode_update_object_async(message: typing.Any, threshold: int = 100) -> EncodedMessage:
+    encoded = EncodedMessage(message)
+    if len(encoded.body) <= threshold:
+        return encoded
+
+    body = bytes(encoded.body)
+    return _compressed_update_object(body, await run_compression(compress, len(body), body))
+
+
+async def encode_async(message: typing.Any, client: bool = False) -> EncodedMessage:
+    if not hasattr(message, "_uncompressed_size"):
+        return EncodedMessage(message, client)
+
+    return await run_compression(EncodedMessage, message._uncompressed_size(), message, client)
+
+
+def _compressed_update_object(body: bytes, compressed: bytes) -> EncodedMessage:
+    return EncodedMessage.from_body(
+        SMSG_COMPRESSED_UPDATE_OBJECT_OPCODE, struct.pack("<I", len(body)) + compressed
+    )
+
+
+def seal(message: typing.Any) -> typing.Any:
+    _set_sealed(message, True)
+    return message
+
+
+def unseal(message: typing.Any) -> typing.Any:
+    _set_sealed(message, False)
+    return message
+
+
+def _set_sealed(message: typing.Any, sealed: bool):
+    if not dataclasses.is_dataclass(message):
+        return
+
+    for field in dataclasses.fields(message):
+        if field.name == "_sealed_size":
+            continue
+
+        value = getattr(message, field.name)
+        if isinstance(value, list):
+            if len(value) != 0 and dataclasses.is_dataclass(value[0]):
+                for v in value:
+                    _set_sealed(v, sealed)
+        else:
+            _set_sealed(value, sealed)
+
+    if hasattr(message, "_sealed_size"):
+        message._sealed_size = None
+        if sealed:
+            message._sealed_size = message.size()
+
+
+class PacketBatch:
+    def __init__(self, header_crypto: typing.Any = None, client: bool = False, buffer_size: int = 4096):
+        self.header_crypto = header_crypto
+        self.client = client
+
+        self._buffer = bytearray(buffer_size)
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end
+
+    def append(self, message: typing.Any):
+        if isinstance(message, EncodedMessage):
+            header = message.header(self.header_crypto)
+            size = len(header) + len(message.body)
+            self._reserve(size)
+
+            body = self._end + len(header)
+            self._buffer[self._end:body] = header
+            self._buffer[body:self._end + size] = message.body
+            self._end += size
+            return
+
+        _fmt, _data = _message_fmt(message, self.header_crypto, self.client)
+
+        if isinstance(_fmt, str):
+            size = struct.calcsize(_fmt)
+            pack_into = functools.partial(struct.pack_into, _fmt)
+        else:
+            size = _fmt.size
+            pack_into = _fmt.pack_into
+
+        self._reserve(size)
+        pack_into(self._buffer, self._end, *_data)
+        self._end += size
+
+    def extend(self, messages: typing.Iterable[typing.Any]):
+        for message in messages:
+            self.append(message)
+
+    def flush(self) -> bytes:
+        data = bytes(memoryview(self._buffer)[:self._end])
+        self._end = 0
+        return data
+
+    def write(self, writer: typing.Union[asyncio.StreamWriter, asyncio.WriteTransport]):
+        if self._end != 0:
+            writer.write(self.flush())
+
+    def _reserve(self, size: int):
+        end = self._end + size
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(max(len(self._buffer), end - len(self._buffer))))
+
+
 def packed_guid_size(value: int) -> int:
     size = 1
     for i in range(0, 8):
@@ -103,3 +660,79 @@ async def read_sized_cstring(reader: asyncio.StreamReader) -> str:
 async def read_float(reader: asyncio.StreamReader) -> float:
     [value] = struct.unpack('f', await reader.readexactly(4))
     return value
+
+
+_integer_structs = {
+    1: struct.Struct("<B"),
+    2: struct.Struct("<H"),
+    4: struct.Struct("<I"),
+    8: struct.Struct("<Q"),
+}
+_u48_struct = struct.Struct("<IH")
+_float_struct = struct.Struct("<f")
+
+
+def read_int_buffer(buf: bytes, offset: int, size: int) -> typing.Tuple[int, int]:
+    if size == 6:
+        low, high = _u48_struct.unpack_from(buf, offset)
+        return low | high << 32, offset + 6
+
+    [value] = _integer_structs[size].unpack_from(buf, offset)
+    return value, offset + size
+
+
+def read_bool_buffer(buf: bytes, offset: int, size: int) -> typing.Tuple[bool, int]:
+    value, offset = read_int_buffer(buf, offset, size)
+    return value == 1, offset
+
+
+def read_float_buffer(buf: bytes, offset: int) -> typing.Tuple[float, int]:
+    [value] = _float_struct.unpack_from(buf, offset)
+    return value, offset + 4
+
+
+def read_bytes_buffer(buf: bytes, offset: int, size: int) -> typing.Tuple[bytes, int]:
+    [value] = struct.unpack_from(f"{size}s", buf, offset)
+    return value, offset + size
+
+
+_cstring_chunk_size = 256
+
+
+def read_cstring_buffer(buf: bytes, offset: int) -> typing.Tuple[str, int]:
+    if isinstance(buf, memoryview):
+        # memoryview has no find, so the terminator is searched for in copied chunks
+        end = offset
+        while True:
+            chunk = buf[end:end + _cstring_chunk_size].tobytes()
+            index = chunk.find(0)
+            if index != -1:
+                end += index
+                break
+            if len(chunk) < _cstring_chunk_size:
+                raise IndexError("missing cstring terminator")
+            end += _cstring_chunk_size
+    else:
+        end = buf.find(0, offset)
+        if end == -1:
+            raise IndexError("missing cstring terminator")
+
+    return str(buf[offset:end], "utf-8"), end + 1
+
+
+def read_sized_cstring_buffer(buf: bytes, offset: int) -> typing.Tuple[str, int]:
+    length, offset = read_int_buffer(buf, offset, 4)
+    [value] = struct.unpack_from(f"{length}s", buf, offset)
+    return value.decode("utf-8").rstrip('\x00'), offset + length
+
+
+def read_packed_guid_buffer(buf: bytes, offset: int) -> typing.Tuple[int, int]:
+    value = 0
+    byte_mask = buf[offset]
+    offset += 1
+    for i in range(0, 8):
+        if byte_mask & (1 << i):
+            value |= buf[offset] << (i * 8)
+            offset += 1
+
+    return value, offset